@@ -0,0 +1,158 @@
+"""Cached RDAP lookups for the internal RDAP API"""
+
+import logging
+import threading
+import time
+from dataclasses import dataclass
+
+import requests
+from cachetools import LRUCache
+from requests.adapters import HTTPAdapter
+
+logger = logging.getLogger(__name__)
+
+# How long a successful RDAP response is served from the cache
+RDAP_CACHE_TTL = 600
+
+# Not found and other error responses are cached for less time, so that a
+# newly registered domain shows up quickly
+RDAP_NEGATIVE_CACHE_TTL = 60
+
+# How long past its TTL a response may still be served when the upstream is unreachable
+RDAP_STALE_TTL = 3600
+
+RDAP_CACHE_SIZE = 1024
+
+RDAP_TIMEOUT = 5
+
+
+@dataclass
+class RdapResult:
+    """An RDAP response body with its upstream status code"""
+
+    data: dict
+    status: int
+    # True when served past its TTL because the upstream could not be reached
+    stale: bool = False
+
+
+@dataclass
+class _CacheEntry:
+    result: RdapResult
+    fresh_until: float
+    stale_until: float
+
+
+class _InFlight:
+    """A lookup in progress, which concurrent lookups for the same domain wait on"""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.result = None
+        self.error = None
+
+
+class RdapClient:
+    """Looks up RDAP data for domains.
+
+    Responses are kept in a size bounded cache keyed on the normalized domain name.
+    Concurrent lookups for the same domain share a single upstream request, and requests
+    reuse pooled keep-alive connections. If the upstream times out or cannot be reached,
+    an expired response is served for up to stale_ttl seconds past its TTL.
+    """
+
+    def __init__(
+        self,
+        url_template,
+        ttl=RDAP_CACHE_TTL,
+        negative_ttl=RDAP_NEGATIVE_CACHE_TTL,
+        stale_ttl=RDAP_STALE_TTL,
+        maxsize=RDAP_CACHE_SIZE,
+        timeout=RDAP_TIMEOUT,
+    ):
+        self.url_template = url_template
+        self.ttl = ttl
+        self.negative_ttl = negative_ttl
+        self.stale_ttl = stale_ttl
+        self.timeout = timeout
+        self._cache: LRUCache = LRUCache(maxsize=maxsize)
+        self._in_flight: dict[str, _InFlight] = {}
+        self._lock = threading.Lock()
+        self._session = self._create_session()
+
+    def _create_session(self):
+        """A requests session with a connection pool shared between worker threads"""
+        session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=10)
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return session
+
+    @staticmethod
+    def normalize(domain):
+        """Lowercases and trims the given domain, and appends .gov if it has no TLD"""
+        domain = domain.strip().lower().rstrip(".")
+        if "." not in domain:
+            domain = f"{domain}.gov"
+        return domain
+
+    def lookup(self, domain) -> RdapResult:
+        """Returns the RDAP data for the given domain.
+
+        Raises requests.RequestException if the upstream cannot be reached and
+        there is no cached response to fall back on."""
+        key = self.normalize(domain)
+        now = time.monotonic()
+
+        with self._lock:
+            entry = self._cache.get(key)
+            if entry is not None and now < entry.fresh_until:
+                return entry.result
+
+            in_flight = self._in_flight.get(key)
+            leader = in_flight is None
+            if leader:
+                in_flight = _InFlight()
+                self._in_flight[key] = in_flight
+
+        if not leader:
+            # Another thread is already fetching this domain, use its result
+            in_flight.done.wait()
+            if in_flight.error is not None:
+                raise in_flight.error
+            return in_flight.result
+
+        try:
+            in_flight.result = self._fetch_and_cache(key, entry)
+            return in_flight.result
+        except Exception as err:
+            # Any error, not only a failed request, is raised in the waiting lookups too
+            in_flight.error = err
+            raise
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+            in_flight.done.set()
+
+    def _fetch_and_cache(self, key, entry):
+        """Fetches key from the upstream and caches the result, falling back
+        on the expired entry if the upstream cannot be reached"""
+        try:
+            response = self._session.get(self.url_template.format(domain=key), timeout=self.timeout)
+            result = RdapResult(data=response.json(), status=response.status_code)
+        except (requests.Timeout, requests.ConnectionError) as err:
+            if entry is not None and time.monotonic() < entry.stale_until:
+                logger.warning(f"RDAP lookup for {key} failed, serving stale response: {err}")
+                return RdapResult(data=entry.result.data, status=entry.result.status, stale=True)
+            raise
+
+        ttl = self.ttl if response.ok else self.negative_ttl
+        now = time.monotonic()
+        with self._lock:
+            self._cache[key] = _CacheEntry(result=result, fresh_until=now + ttl, stale_until=now + ttl + self.stale_ttl)
+        return result
+
+    def clear(self):
+        """Removes all cached responses"""
+        with self._lock:
+            self._cache.clear()
@@ -1,11 +1,18 @@
 """Test the domain rdap lookup API."""
 
 import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
+import requests
 from django.contrib.auth import get_user_model
 from django.test import RequestFactory
+from django.test import SimpleTestCase
 from django.test import TestCase
 
+from ..rdap import RdapClient
 from ..views import rdap
 
 API_BASE_PATH = "/api/v1/rdap/?domain="
@@ -64,3 +71,155 @@ class RdapAPITest(TestCase):
         self.assertContains(response, "rdap")
         response_object = json.loads(response.content)
         self.assertIn("rdapConformance", response_object)
+
+
+class StubRdapHandler(BaseHTTPRequestHandler):
+    """Serves RDAP responses for .gov domains, and a not found error for everything else"""
+
+    def do_GET(self):
+        server = self.server
+        domain = self.path.rsplit("/", 1)[-1]
+        with server.lock:
+            server.request_counts[domain] = server.request_counts.get(domain, 0) + 1
+        time.sleep(server.delay)
+        if domain.endswith(".gov"):
+            status = 200
+            body = {"rdapConformance": ["rdap_level_0"], "ldhName": domain}
+        else:
+            status = 404
+            body = {"errorCode": 404, "title": "Not Found"}
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/rdap+json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class RdapClientTest(SimpleTestCase):
+    """Test the RDAP lookup cache against a local stub RDAP server"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubRdapHandler)
+        cls.server.lock = threading.Lock()
+        cls.server.request_counts = {}
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+        cls.url = f"http://127.0.0.1:{cls.server.server_port}/rdap/domain/{{domain}}"
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        self.server.request_counts.clear()
+        self.server.delay = 0
+        self.client = RdapClient(self.url, timeout=0.5)
+
+    def test_lookup_is_cached_by_normalized_domain(self):
+        """Lookups differing only in case, whitespace or a missing .gov share one upstream request"""
+        for domain in ["whitehouse", "WhiteHouse.gov", " whitehouse.gov. "]:
+            result = self.client.lookup(domain)
+            self.assertEqual(result.status, 200)
+            self.assertEqual(result.data["ldhName"], "whitehouse.gov")
+        self.assertEqual(self.server.request_counts, {"whitehouse.gov": 1})
+
+    def test_negative_results_expire_sooner(self):
+        """Error responses are cached for negative_ttl rather than ttl"""
+        self.client = RdapClient(self.url, ttl=600, negative_ttl=0)
+        self.assertEqual(self.client.lookup("whitehouse.com").status, 404)
+        self.client.lookup("whitehouse.com")
+        self.client.lookup("whitehouse.gov")
+        self.client.lookup("whitehouse.gov")
+        self.assertEqual(self.server.request_counts, {"whitehouse.com": 2, "whitehouse.gov": 1})
+
+    def test_cache_is_bounded(self):
+        """The least recently used domain is evicted once the cache is full"""
+        self.client = RdapClient(self.url, maxsize=2)
+        for domain in ["a.gov", "b.gov", "c.gov", "a.gov"]:
+            self.client.lookup(domain)
+        self.assertEqual(self.server.request_counts["a.gov"], 2)
+
+    def test_concurrent_lookups_are_coalesced(self):
+        """Concurrent lookups for the same domain make a single upstream request"""
+        self.server.delay = 0.2
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.client.lookup("whitehouse.gov"))) for _ in range(5)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        self.assertEqual(len(results), 5)
+        self.assertEqual(self.server.request_counts, {"whitehouse.gov": 1})
+
+    def test_concurrent_lookups_share_unexpected_errors(self):
+        """An error other than a failed request in the leading lookup is raised in the waiting lookups too"""
+        started = threading.Event()
+        release = threading.Event()
+        error = ValueError("malformed response")
+
+        def get(*args, **kwargs):
+            started.set()
+            release.wait(5)
+            raise error
+
+        errors = []
+
+        def lookup():
+            try:
+                self.client.lookup("whitehouse.gov")
+            except Exception as err:
+                errors.append(err)
+
+        with patch.object(self.client._session, "get", side_effect=get) as mock_get:
+            leader = threading.Thread(target=lookup)
+            leader.start()
+            started.wait(5)
+            waiters = [threading.Thread(target=lookup) for _ in range(3)]
+            for thread in waiters:
+                thread.start()
+            # Gives the waiting lookups time to find the leader's lookup in flight
+            time.sleep(0.2)
+            release.set()
+            for thread in [leader, *waiters]:
+                thread.join()
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertEqual(errors, [error] * 4)
+        self.assertEqual(self.client._in_flight, {})
+
+    def test_stale_response_served_on_timeout(self):
+        """An expired response is served when the upstream times out"""
+        self.client = RdapClient(self.url, ttl=0, timeout=0.1)
+        self.assertFalse(self.client.lookup("whitehouse.gov").stale)
+
+        self.server.delay = 0.5
+        result = self.client.lookup("whitehouse.gov")
+        self.assertTrue(result.stale)
+        self.assertEqual(result.data["ldhName"], "whitehouse.gov")
+
+    def test_timeout_without_cached_response_raises(self):
+        """A timeout with nothing cached is raised to the caller"""
+        self.client = RdapClient(self.url, timeout=0.1)
+        self.server.delay = 0.5
+        with self.assertRaises(requests.Timeout):
+            self.client.lookup("whitehouse.gov")
+
+    def test_view_returns_error_when_upstream_unavailable(self):
+        """The rdap view returns an RDAP error response when the upstream cannot be reached"""
+        self.client = RdapClient(self.url, timeout=0.1)
+        self.server.delay = 0.5
+        request = RequestFactory().get(API_BASE_PATH + "whitehouse")
+        with patch("api.views.RDAP_CLIENT", self.client):
+            response = rdap(request, domain="whitehouse")
+        self.assertEqual(response.status_code, 503)
+        self.assertEqual(json.loads(response.content)["errorCode"], 503)
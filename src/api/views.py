@@ -1,11 +1,14 @@
 """Internal API views"""
 
+import logging
+
 from django.apps import apps
 from django.views.decorators.http import require_http_methods
 from django.http import HttpResponse, JsonResponse
 from django.utils.safestring import mark_safe
 
 from registrar.templatetags.url_helpers import public_site_url
+from registrar.utility.domain_availability import DomainAvailabilityCache
 from registrar.utility.enums import ValidationReturnType
 from registrar.utility.errors import GenericError, GenericErrorCodes
 
@@ -13,13 +16,17 @@ import requests
 
 from login_required import login_not_required
 
-from cachetools.func import ttl_cache
+from api.rdap import RdapClient
 
 from registrar.utility.s3_bucket import S3ClientError, S3ClientHelper
 
 
+logger = logging.getLogger(__name__)
+
 RDAP_URL = "https://rdap.cloudflareregistry.com/rdap/domain/{domain}"
 
+RDAP_CLIENT = RdapClient(RDAP_URL)
+
 
 DOMAIN_API_MESSAGES = {
     "required": "Enter the .gov domain you want. Don’t include “www” or “.gov.”"
@@ -63,7 +70,8 @@ def available(request, domain=""):
     """Is a given domain available or not.
 
     Response is a JSON dictionary with the key "available" and value true or
-    false.
+    false. Results are remembered in the session for a short time, so the domain
+    request form does not check the same name against the registry again.
     """
     Domain = apps.get_model("registrar.Domain")
     domain = request.GET.get("domain", "")
@@ -71,24 +79,36 @@ def available(request, domain=""):
     _, json_response = Domain.validate_and_handle_errors(
         domain=domain,
         return_type=ValidationReturnType.JSON_RESPONSE,
+        availability=DomainAvailabilityCache(getattr(request, "session", None)),
     )
     return json_response
 
 
 @require_http_methods(["GET"])
 @login_not_required
-# Since we cache domain RDAP data, cache time may need to be re-evaluated this if we encounter any memory issues
-@ttl_cache(ttl=600)
 def rdap(request, domain=""):
-    """Returns JSON dictionary of a domain's RDAP data from Cloudflare API"""
-    domain = request.GET.get("domain", "")
+    """Returns JSON dictionary of a domain's RDAP data from Cloudflare API.
 
-    # If inputted domain doesn't have a TLD, append .gov to it
-    if "." not in domain:
-        domain = f"{domain}.gov"
+    Responses are cached per domain by RDAP_CLIENT. If inputted domain doesn't have a TLD,
+    .gov is appended to it."""
+    domain = request.GET.get("domain", "")
 
-    rdap_data = requests.get(RDAP_URL.format(domain=domain), timeout=5).json()
-    return JsonResponse(rdap_data)
+    try:
+        result = RDAP_CLIENT.lookup(domain)
+    except requests.RequestException as err:
+        logger.error(f"RDAP lookup for {domain} failed: {err}")
+        # Error body follows the RDAP error response format
+        return JsonResponse(
+            {
+                "errorCode": 503,
+                "title": "Service Unavailable",
+                "description": ["The RDAP service could not be reached."],
+            },
+            status=503,
+        )
+
+    # RDAP error bodies (such as not found) are passed through with a 200 as before
+    return JsonResponse(result.data)
 
 
 @require_http_methods(["GET"])
@@ -0,0 +1,5 @@
+"""
+Benchmarks of the registrar's most used pages and APIs.
+
+Run them with `./manage.py run_benchmarks`. See "Benchmarks" in docs/developer/README.md.
+"""
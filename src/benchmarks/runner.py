@@ -0,0 +1,141 @@
+"""
+Runs benchmark scenarios and stores their results as JSON, to compare across commits.
+
+Each scenario is run a number of times to warm up, which are not measured, then a number
+of measured times. Latencies are wall clock times of whole iterations, in milliseconds.
+"""
+
+import json
+import logging
+import subprocess  # nosec
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+
+logger = logging.getLogger(__name__)
+
+# A scenario counts as slower than the baseline if its p95 grows by more than this
+REGRESSION_THRESHOLD = 0.2
+
+
+def percentile(values, percent):
+    """Returns the given percentile of values, by the nearest rank method"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+    return ordered[rank]
+
+
+@dataclass
+class BenchmarkResult:
+    """The timings of the measured iterations of one scenario"""
+
+    name: str
+    warmup: int
+    latencies_ms: list = field(default_factory=list)
+    errors: int = 0
+    total_seconds: float = 0.0
+
+    @property
+    def iterations(self):
+        return len(self.latencies_ms)
+
+    def as_dict(self):
+        """Returns the result in a form that can be serialized to JSON"""
+
+        def rounded(value):
+            return round(value, 2) if value is not None else None
+
+        return {
+            "iterations": self.iterations,
+            "warmup": self.warmup,
+            "errors": self.errors,
+            "throughput_per_second": rounded(self.iterations / self.total_seconds) if self.total_seconds else None,
+            "latency_ms": {
+                "mean": rounded(sum(self.latencies_ms) / self.iterations) if self.iterations else None,
+                "p50": rounded(percentile(self.latencies_ms, 50)),
+                "p95": rounded(percentile(self.latencies_ms, 95)),
+                "max": rounded(max(self.latencies_ms, default=None)),
+            },
+        }
+
+
+def run_scenario(name, run_iteration, iterations, warmup):
+    """
+    Calls run_iteration(i) warmup + iterations times, timing the last iterations.
+    run_iteration returns the responses of the iteration; any response with a status
+    of 400 or more counts as an error.
+    """
+    result = BenchmarkResult(name=name, warmup=warmup)
+    for i in range(warmup):
+        run_iteration(i)
+
+    for i in range(warmup, warmup + iterations):
+        started_at = time.perf_counter()
+        responses = run_iteration(i)
+        elapsed = time.perf_counter() - started_at
+        result.latencies_ms.append(elapsed * 1000)
+        result.total_seconds += elapsed
+        if any(response.status_code >= 400 for response in responses):
+            result.errors += 1
+
+    summary = result.as_dict()
+    logger.info(
+        f"{name}: p50 {summary['latency_ms']['p50']}ms, p95 {summary['latency_ms']['p95']}ms, "
+        f"{summary['throughput_per_second']}/s, {result.errors} errors"
+    )
+    return result
+
+
+def get_commit():
+    """Returns the sha of the checked out commit, or "unknown" outside of a git checkout"""
+    try:
+        return subprocess.check_output(  # nosec
+            ["git", "rev-parse", "HEAD"], stderr=subprocess.DEVNULL, text=True
+        ).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def build_report(results, scale, seed):
+    """Returns the results of a run, with what they were run against, in a form that can be written as JSON"""
+    return {
+        "commit": get_commit(),
+        "created_at": datetime.now(timezone.utc).isoformat(),
+        "scale": scale,
+        "seed": seed,
+        "scenarios": {result.name: result.as_dict() for result in results},
+    }
+
+
+def write_report(report, path):
+    with open(path, "w") as f:
+        json.dump(report, f, indent=2)
+        f.write("\n")
+
+
+def compare_reports(report, baseline):
+    """
+    Returns a line for each scenario in both reports, with the change in its p50 and p95 latency.
+    Scenarios whose p95 grew by more than REGRESSION_THRESHOLD are marked as slower.
+    """
+    lines = []
+    for name, current in report["scenarios"].items():
+        previous = baseline["scenarios"].get(name)
+        if previous is None:
+            continue
+
+        changes = []
+        for key in ["p50", "p95"]:
+            before, after = previous["latency_ms"][key], current["latency_ms"][key]
+            change = (after - before) / before if before else 0.0
+            changes.append(f"{key} {before}ms -> {after}ms ({change:+.0%})")
+
+        before, after = previous["latency_ms"]["p95"], current["latency_ms"]["p95"]
+        slower = bool(before) and (after - before) / before > REGRESSION_THRESHOLD
+        lines.append(f"{name}: {', '.join(changes)}{' SLOWER' if slower else ''}")
+
+    if report["scale"] != baseline["scale"]:
+        lines.append(f"Note: the baseline was run at scale {baseline['scale']}, not {report['scale']}")
+    return lines
@@ -0,0 +1,187 @@
+"""
+The pages and APIs that are benchmarked.
+
+Each scenario is a function that makes the requests of one iteration with a logged in
+test client, and returns their responses. Scenarios start from the objects created by
+BenchmarkFixture.load, which are passed in as `data`. Scenarios which time code other
+than a page return no responses.
+
+To benchmark another page, add a Scenario to SCENARIOS.
+"""
+
+import contextlib
+import logging
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import Callable
+
+from django.urls import reverse
+
+from registrar.management.commands.utility.extra_transition_domain_helper import OrganizationDataLoader
+from registrar.management.commands.utility.transition_domain_arguments import TransitionDomainArguments
+from registrar.utility.enums import Step
+from registrar.views.domain_request import DomainRequestWizard
+
+
+@dataclass
+class Scenario:
+    name: str
+    # Called with (client, data, i), where i is the number of the iteration
+    run: Callable
+    # Whether the client is logged in as the analyst rather than the domain manager
+    as_admin: bool = False
+    # Waffle flags which are turned on while the scenario runs
+    flags: tuple = ()
+    # Called with data before the scenario runs. Returns a context manager, which is
+    # exited once the scenario has run
+    setup: Callable | None = None
+
+
+def availability(client, data, i):
+    """Each iteration checks a new name, as checked names are remembered in the session"""
+    return [client.get(reverse("available"), {"domain": f"benchmark-check-{i}.gov"})]
+
+
+def domains_json(client, data, i):
+    return [client.get(reverse("get_domains_json"))]
+
+
+def domains_json_portfolio(client, data, i):
+    return [client.get(reverse("get_domains_json"), {"portfolio": data["portfolio"].id})]
+
+
+def domain_requests_json(client, data, i):
+    return [client.get(reverse("get_domain_requests_json"))]
+
+
+def portfolio_members_json(client, data, i):
+    return [client.get(reverse("get_portfolio_members_json"), {"portfolio": data["portfolio"].id})]
+
+
+def domain_detail(client, data, i):
+    return [client.get(reverse("domain", kwargs={"pk": data["domain"].id}))]
+
+
+def domain_nameservers(client, data, i):
+    return [client.get(reverse("domain-dns-nameservers", kwargs={"pk": data["domain"].id}))]
+
+
+def domain_request_wizard(client, data, i):
+    """Opens the started domain request, then views each of its wizard steps in order, without submitting"""
+    domain_request = data["wizard_request"]
+    conditions = DomainRequestWizard.REGULAR_WIZARD_CONDITIONS
+    steps = [step for step in Step if step not in conditions or getattr(domain_request, f"show_{step}")()]
+
+    responses = [client.get(reverse("edit-domain-request", kwargs={"id": domain_request.id}))]
+    for step in steps:
+        responses.append(client.get(reverse(f"domain-request:{step}")))
+    return responses
+
+
+def export(url_name):
+    def run(client, data, i):
+        return [client.get(reverse(url_name))]
+
+    return run
+
+
+def admin_changelist(model_name):
+    def run(client, data, i):
+        return [client.get(reverse(f"admin:registrar_{model_name}_changelist"))]
+
+    return run
+
+
+def health(client, data, i):
+    return [client.get(reverse("health"))]
+
+
+def health_profiled(client, data, i):
+    """Compared with the health scenario, shows the overhead of RequestProfilingMiddleware"""
+    return [client.get(reverse("health"), headers={"X-Profile-Request": "1"})]
+
+
+@contextlib.contextmanager
+def quiet_request_profiles(data):
+    """Keeps the profile of each request out of the console. The profile is still built and serialized."""
+    profiling_logger = logging.getLogger("registrar.registrar_middleware")
+    level = profiling_logger.level
+    profiling_logger.setLevel(logging.WARNING)
+    try:
+        yield
+    finally:
+        profiling_logger.setLevel(level)
+
+
+# Number of domains in the files of the organization data scenario, the size of a full migration
+ORGANIZATION_DATA_DOMAINS = 100000
+ORGANIZATION_DATA_ORGS = 500
+
+
+@contextlib.contextmanager
+def organization_data_files(data):
+    """Writes domain_additional and organization_adhoc files with ORGANIZATION_DATA_DOMAINS domains,
+    and parses them with an OrganizationDataLoader"""
+    with tempfile.TemporaryDirectory() as directory:
+        with open(os.path.join(directory, "domain_additional.txt"), "w") as domain_additional_file:
+            domain_additional_file.write(
+                "domainname|domaintypeid|authorityid|orgid|securitycontactemail|dnsseckeymonitor|domainpurpose\n"
+            )
+            for i in range(ORGANIZATION_DATA_DOMAINS):
+                domain_additional_file.write(
+                    f"domain{i}.gov|1|1|{i % ORGANIZATION_DATA_ORGS}|security@domain{i}.gov|N|test\n"
+                )
+        with open(os.path.join(directory, "organization_adhoc.txt"), "w") as organization_file:
+            organization_file.write("orgid|orgname|orgstreet|orgcity|orgstate|orgzip|orgcountrycode\n")
+            for i in range(ORGANIZATION_DATA_ORGS):
+                organization_file.write(f"{i}|Org {i}|{i} Main St|Citytown|Virginia|22201|US\n")
+
+        data["organization_data_loader"] = OrganizationDataLoader(
+            TransitionDomainArguments(
+                directory=directory,
+                domain_additional_filename="domain_additional.txt",
+                organization_adhoc_filename="organization_adhoc.txt",
+            )
+        )
+        try:
+            yield
+        finally:
+            del data["organization_data_loader"]
+
+
+def organization_data_index(client, data, i):
+    """Resolves the organization of every domain in the files, as load_organization_data does"""
+    data["organization_data_loader"].build_org_info_index()
+    return []
+
+
+SCENARIOS = [
+    Scenario("availability API", availability),
+    Scenario("get_domains_json", domains_json),
+    Scenario("get_domains_json (portfolio)", domains_json_portfolio, flags=("organization_feature",)),
+    Scenario("get_domain_requests_json", domain_requests_json),
+    Scenario(
+        "get_portfolio_members_json",
+        portfolio_members_json,
+        flags=("organization_feature", "organization_members"),
+    ),
+    Scenario("domain detail", domain_detail),
+    Scenario("domain nameservers", domain_nameservers),
+    Scenario("domain request wizard", domain_request_wizard),
+    Scenario("export domains by type", export("export_data_type"), as_admin=True),
+    Scenario("export current full", export("export_data_full"), as_admin=True),
+    Scenario("export current federal", export("export_data_federal"), as_admin=True),
+    Scenario("export domain requests full", export("export_data_domain_requests_full"), as_admin=True),
+    Scenario("admin domain changelist", admin_changelist("domain"), as_admin=True),
+    Scenario("admin domain request changelist", admin_changelist("domainrequest"), as_admin=True),
+    Scenario("admin user changelist", admin_changelist("user"), as_admin=True),
+    Scenario("admin portfolio changelist", admin_changelist("portfolio"), as_admin=True),
+    Scenario("health", health, as_admin=True),
+    Scenario("health (profiled)", health_profiled, as_admin=True, setup=quiet_request_profiles),
+    Scenario(
+        f"organization data index ({ORGANIZATION_DATA_DOMAINS} domains)",
+        organization_data_index,
+        setup=organization_data_files,
+    ),
+]
@@ -0,0 +1,31 @@
+"""
+Stands in for the registry, SES and S3 while benchmarks run, so they run offline
+and measure the registrar rather than the network.
+
+The registry stub is the one the test suite uses (MockEppLib.mockSend), so pages get
+the same canned registry responses they get in tests.
+"""
+
+import contextlib
+import io
+from unittest.mock import MagicMock, patch
+
+from registrar.tests.common import MockEppLib, MockSESClient
+
+
+def fake_s3_client():
+    """An S3 client whose uploads succeed and whose downloads return an empty file"""
+    client = MagicMock()
+    client.get_object.side_effect = lambda **kwargs: {"Body": io.BytesIO(b"")}
+    return client
+
+
+@contextlib.contextmanager
+def fake_services():
+    """Replaces the registry, SES and S3 clients with stubs for the duration of the block"""
+    registry = MockEppLib()
+    with contextlib.ExitStack() as stack:
+        stack.enter_context(patch("registrar.models.domain.registry.send", side_effect=registry.mockSend))
+        stack.enter_context(patch("registrar.utility.email.boto3.client", return_value=MockSESClient()))
+        stack.enter_context(patch("registrar.utility.s3_bucket.boto3.client", return_value=fake_s3_client()))
+        yield
@@ -3,15 +3,19 @@ from __future__ import unicode_literals
 
 import logging
 import json
+import threading
+import time
 
 from django.conf import settings
+from django.core.cache import cache
+from django.db import connections
 from django.http import HttpResponseRedirect
 from Cryptodome.PublicKey.RSA import importKey
 from jwkest.jwk import RSAKey  # type: ignore
 from oic import oic, rndstr, utils
 from oic.oauth2 import ErrorResponse
 from oic.oic import AuthorizationRequest, AuthorizationResponse, RegistrationResponse
-from oic.oic.message import AccessTokenResponse
+from oic.oic.message import AccessTokenResponse, ProviderConfigurationResponse
 from oic.utils.authn.client import CLIENT_AUTHN_METHOD
 from oic.utils import keyio
 
@@ -21,6 +25,17 @@ __author__ = "roland"
 
 logger = logging.getLogger(__name__)
 
+# Seconds that discovered provider info and signing keys are considered fresh.
+# Override with settings.OIDC_PROVIDER_INFO_TTL
+PROVIDER_INFO_TTL = 60 * 60
+
+# Seconds that provider info is kept in the cache, so that a stale copy
+# can still be used when the provider cannot be reached
+PROVIDER_INFO_CACHE_TIMEOUT = 7 * 24 * 60 * 60
+
+# Only one background refresh runs at a time per process
+_refresh_lock = threading.Lock()
+
 
 class Client(oic.Client):
     def __init__(self, op):
@@ -71,7 +86,8 @@ class Client(oic.Client):
 
         try:
             # discover and store the provider (OP) urls, etc
-            self.provider_config(provider["srv_discovery_url"])
+            self.discovery_url = provider["srv_discovery_url"]
+            self.load_provider_info()
             self.store_registration_info(RegistrationResponse(**provider["client_registration"]))
         except Exception as err:
             logger.error(err)
@@ -81,6 +97,89 @@ class Client(oic.Client):
             )
             raise o_e.InternalError()
 
+    def load_provider_info(self):
+        """Configure the provider (OP) urls and signing keys.
+
+        Provider info is shared between processes through the django cache,
+        so the provider is only contacted when nothing has been cached yet.
+        A stale cached copy is used as is and refreshed in the background."""
+        info = self._get_cached_provider_info()
+        if info is None:
+            logger.info("No cached provider info for %s, discovering provider" % self.discovery_url)
+            info = self._discover_provider_info()
+        self._apply_provider_info(info)
+        self.refresh_provider_info_if_stale()
+
+    def provider_info_is_stale(self):
+        """Returns True if the provider info in use is older than OIDC_PROVIDER_INFO_TTL"""
+        ttl = getattr(settings, "OIDC_PROVIDER_INFO_TTL", PROVIDER_INFO_TTL)
+        return time.time() - self.provider_info_fetched_at > ttl
+
+    def refresh_provider_info_if_stale(self):
+        """Start a background refresh of the provider info if it is stale,
+        unless one is already running. Requests keep using the current info."""
+        if not self.provider_info_is_stale() or not _refresh_lock.acquire(blocking=False):
+            return
+        thread = threading.Thread(target=self._refresh_provider_info, daemon=True)
+        thread.start()
+
+    def _refresh_provider_info(self):
+        """Runs in a background thread. Another process may already have
+        refreshed the shared cache, otherwise the provider is discovered again."""
+        try:
+            info = self._get_cached_provider_info()
+            if info is None or info["fetched_at"] <= self.provider_info_fetched_at:
+                info = self._discover_provider_info()
+            self._apply_provider_info(info)
+            logger.info("Refreshed provider info for %s" % self.discovery_url)
+        except Exception as err:
+            logger.warning(err)
+            logger.warning("Unable to refresh provider info for %s, using cached info" % self.discovery_url)
+        finally:
+            # the database cache opens a connection for this thread
+            connections.close_all()
+            _refresh_lock.release()
+
+    def _discover_provider_info(self):
+        """Fetch the provider configuration and signing keys (JWKS) from the provider,
+        and store them in the shared cache"""
+        pcr = self.provider_config(self.discovery_url, keys=False)
+        response = self.http_request(pcr["jwks_uri"])
+        if response.status_code != 200:
+            logger.error("Unable to fetch signing keys from %s" % pcr["jwks_uri"])
+            raise o_e.InternalError()
+
+        info = {
+            "provider_info": pcr.to_dict(),
+            "jwks": json.loads(response.text),
+            "fetched_at": time.time(),
+        }
+        try:
+            cache.set(self._provider_info_cache_key(), info, PROVIDER_INFO_CACHE_TIMEOUT)
+        except Exception as err:
+            logger.warning(err)
+            logger.warning("Unable to cache provider info for %s" % self.discovery_url)
+        return info
+
+    def _get_cached_provider_info(self):
+        """Returns the cached provider info, or None if there is none or the cache is unavailable"""
+        try:
+            return cache.get(self._provider_info_cache_key())
+        except Exception as err:
+            logger.warning(err)
+            logger.warning("Unable to read cached provider info for %s" % self.discovery_url)
+            return None
+
+    def _apply_provider_info(self, info):
+        """Configure endpoints and replace the provider's signing keys from the given provider info"""
+        pcr = ProviderConfigurationResponse(**info["provider_info"])
+        self.handle_provider_config(pcr, self.discovery_url, keys=False)
+        self.keyjar.issuer_keys[self.issuer] = [keyio.KeyBundle(keys=info["jwks"]["keys"])]
+        self.provider_info_fetched_at = info["fetched_at"]
+
+    def _provider_info_cache_key(self):
+        return "djangooidc:provider_info:%s" % self.discovery_url
+
     def create_authn_request(
         self,
         session,
@@ -1,10 +1,19 @@
+import json
 import logging
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
 
-from django.test import TestCase
+from Cryptodome.PublicKey import RSA
+from django.core.cache import cache
+from django.test import SimpleTestCase, TestCase, override_settings
+from jwkest.jwk import RSAKey  # type: ignore
 
 from django.conf import settings
 
 from djangooidc.oidc import Client
+from djangooidc.tests.common import less_console_noise
 
 logger = logging.getLogger(__name__)
 
@@ -28,3 +37,133 @@ class OidcTest(TestCase):
         except Exception as err:
             logger.warning(err)
             logger.warning("Unable to configure OpenID Connect provider in pipeline. Cannot execute this test.")
+
+
+class StubProviderHandler(BaseHTTPRequestHandler):
+    """Serves a minimal OpenID Connect discovery document and JWKS"""
+
+    def do_GET(self):
+        server = self.server
+        server.request_counts[self.path] = server.request_counts.get(self.path, 0) + 1
+        time.sleep(server.delay)
+        if self.path == "/.well-known/openid-configuration":
+            body = {
+                "issuer": server.issuer,
+                "authorization_endpoint": f"{server.issuer}/authorize",
+                "token_endpoint": f"{server.issuer}/token",
+                "userinfo_endpoint": f"{server.issuer}/userinfo",
+                "end_session_endpoint": f"{server.issuer}/logout",
+                "jwks_uri": f"{server.issuer}/jwks",
+                "response_types_supported": ["code"],
+                "subject_types_supported": ["public"],
+                "id_token_signing_alg_values_supported": ["RS256"],
+            }
+        elif self.path == "/jwks":
+            body = {"keys": [server.signing_key]}
+        else:
+            self.send_response(404)
+            self.end_headers()
+            return
+        payload = json.dumps(body).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format, *args):
+        pass
+
+
+@override_settings(CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}})
+class OidcProviderInfoCacheTest(SimpleTestCase):
+    """Tests that provider discovery and signing keys are cached, against a local stub provider"""
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.server = ThreadingHTTPServer(("127.0.0.1", 0), StubProviderHandler)
+        cls.server.issuer = f"http://127.0.0.1:{cls.server.server_port}"
+        cls.server.signing_key = RSAKey(key=RSA.generate(2048).publickey(), kid="stub", use="sig").serialize()
+        cls.server.request_counts = {}
+        # Simulate a slow identity provider
+        cls.server.delay = 0.2
+        cls.server_thread = threading.Thread(target=cls.server.serve_forever, daemon=True)
+        cls.server_thread.start()
+
+        cls.provider = {
+            "srv_discovery_url": cls.server.issuer,
+            "behaviour": {
+                "response_type": "code",
+                "scope": ["email"],
+                "user_info_request": ["email"],
+                "acr_value": "http://idmanagement.gov/ns/assurance/ial/1",
+            },
+            "client_registration": {
+                "client_id": "stub_client",
+                "redirect_uris": ["http://localhost/openid/callback/login/"],
+                "post_logout_redirect_uris": ["http://localhost/openid/callback/logout/"],
+                "token_endpoint_auth_method": ["private_key_jwt"],
+                "sp_private_key": RSA.generate(2048).export_key().decode("utf-8"),
+            },
+        }
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.server.shutdown()
+        cls.server.server_close()
+        super().tearDownClass()
+
+    def setUp(self):
+        cache.clear()
+        self.server.request_counts.clear()
+
+    def _timed_client(self):
+        """Initializes a client for the stub provider and returns it with the time it took"""
+        with override_settings(OIDC_PROVIDERS={"stub": self.provider}):
+            start = time.perf_counter()
+            client = Client("stub")
+            return client, time.perf_counter() - start
+
+    def test_warm_cache_skips_discovery(self):
+        """Only the first client contacts the provider, later clients use the shared cache"""
+        with less_console_noise():
+            cold_client, cold_elapsed = self._timed_client()
+            warm_client, warm_elapsed = self._timed_client()
+
+        logger.info(f"Client initialization: cold cache {cold_elapsed:.3f}s, warm cache {warm_elapsed:.3f}s")
+        self.assertEqual(self.server.request_counts, {"/.well-known/openid-configuration": 1, "/jwks": 1})
+        self.assertLess(warm_elapsed, cold_elapsed)
+        self.assertEqual(warm_client.token_endpoint, f"{self.server.issuer}/token")
+        self.assertEqual(
+            warm_client.provider_info["end_session_endpoint"], cold_client.provider_info["end_session_endpoint"]
+        )
+        self.assertEqual(len(warm_client.keyjar.get_issuer_keys(self.server.issuer)), 1)
+
+    def test_cached_info_survives_provider_outage(self):
+        """A client can still be initialized from the cache when the provider is down"""
+        with less_console_noise():
+            self._timed_client()
+            with patch.object(Client, "provider_config", side_effect=ConnectionError("provider down")):
+                client, _ = self._timed_client()
+
+        self.assertEqual(client.authorization_endpoint, f"{self.server.issuer}/authorize")
+
+    def test_stale_info_is_refreshed_in_background(self):
+        """Stale provider info is used immediately and refreshed off the request path"""
+        with less_console_noise():
+            client, _ = self._timed_client()
+            with override_settings(OIDC_PROVIDER_INFO_TTL=-1):
+                with patch("djangooidc.oidc.threading.Thread") as mock_thread:
+                    client.refresh_provider_info_if_stale()
+                    # a second stale check does not start another refresh while one is pending
+                    client.refresh_provider_info_if_stale()
+
+                mock_thread.assert_called_once()
+                self.assertEqual(self.server.request_counts["/jwks"], 1)
+
+                # run the background refresh
+                mock_thread.call_args.kwargs["target"]()
+
+        self.assertEqual(self.server.request_counts["/jwks"], 2)
+        self.assertFalse(client.provider_info_is_stale())
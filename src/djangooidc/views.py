@@ -73,6 +73,8 @@ def openid(request):
         if _client_is_none():
             logger.debug("OIDC client is None, attempting to initialize")
             _initialize_client()
+        # Keep the provider's urls and signing keys current without delaying this request
+        CLIENT.refresh_provider_info_if_stale()
         request.session["acr_value"] = CLIENT.get_default_acr_value()
         request.session["next"] = request.GET.get("next", "/")
         # Create the authentication request
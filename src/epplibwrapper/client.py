@@ -1,6 +1,7 @@
 """Provide a wrapper around epplib to handle authentication and errors."""
 
 import logging
+import time
 from gevent.lock import BoundedSemaphore
 
 try:
@@ -15,6 +16,7 @@ from django.conf import settings
 
 from .cert import Cert, Key
 from .errors import ErrorCode, LoginError, RegistryError
+from .metrics import EPP_METRICS
 
 logger = logging.getLogger(__name__)
 
@@ -38,8 +40,10 @@ class EPPLibWrapper:
     ATTN: This should not be used directly. Use `Domain` from domain.py.
     """
 
-    def __init__(self) -> None:
-        """Initialize settings which will be used for all connections."""
+    def __init__(self, metrics=None) -> None:
+        """Initialize settings which will be used for all connections.
+        Commands are recorded in metrics, or in EPP_METRICS if not given."""
+        self.metrics = metrics if metrics is not None else EPP_METRICS
         # set _client to None initially. In the event that the __init__ fails
         # before _client initializes, app should still start and be in a state
         # that it can attempt _client initialization on send attempts
@@ -129,6 +133,7 @@ class EPPLibWrapper:
             # check for the condition that the _client was not initialized properly
             # at app initialization
             if self._client is None:
+                self.metrics.record_reconnect()
                 self._initialize_client()
             response = self._client.send(command)
         except (ValueError, ParsingError) as err:
@@ -159,6 +164,7 @@ class EPPLibWrapper:
         """Retry sending a command through EPP by re-initializing the client
         and then sending the command."""
         # re-initialize by disconnecting and initial
+        self.metrics.record_reconnect()
         self._disconnect()
         self._initialize_client()
         return self._send(command)
@@ -170,7 +176,11 @@ class EPPLibWrapper:
         if not cleaned:
             raise ValueError("Please sanitize user input before sending it.")
 
+        lock_requested_at = time.perf_counter()
         self.connection_lock.acquire()
+        sent_at = time.perf_counter()
+        error_code = None
+        retried = False
         try:
             return self._send(command)
         except RegistryError as err:
@@ -183,11 +193,24 @@ class EPPLibWrapper:
             ):
                 message = f"{cmd_type} failed and will be retried"
                 logger.info(f"{message} Error: {err}")
-                return self._retry(command)
+                retried = True
+                try:
+                    return self._retry(command)
+                except RegistryError as retry_err:
+                    error_code = retry_err.code if retry_err.code is not None else "unknown"
+                    raise retry_err
             else:
+                error_code = err.code if err.code is not None else "unknown"
                 raise err
         finally:
             self.connection_lock.release()
+            self.metrics.record_command(
+                cmd_type,
+                seconds=time.perf_counter() - sent_at,
+                lock_wait_seconds=sent_at - lock_requested_at,
+                error_code=error_code,
+                retried=retried,
+            )
 
 
 try:
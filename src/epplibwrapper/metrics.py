@@ -0,0 +1,137 @@
+"""Counters and timings for the commands sent to the registry through EPPLibWrapper."""
+
+import logging
+import time
+from collections import Counter, deque
+
+logger = logging.getLogger(__name__)
+
+
+class CommandMetrics:
+    """Counts and recent timings for one type of EPP command"""
+
+    # How many recent latencies are kept for the percentiles
+    SAMPLE_SIZE = 1000
+
+    def __init__(self):
+        self.count = 0
+        self.retries = 0
+        self.error_codes: Counter = Counter()
+        self.total_seconds = 0.0
+        self.total_lock_wait_seconds = 0.0
+        self.max_lock_wait_seconds = 0.0
+        self.latencies: deque = deque(maxlen=self.SAMPLE_SIZE)
+
+    def percentile(self, percent):
+        """Returns the given percentile of the recent latencies, by the nearest rank method"""
+        if not self.latencies:
+            return None
+        ordered = sorted(self.latencies)
+        rank = max(int(round(percent / 100 * len(ordered))) - 1, 0)
+        return ordered[rank]
+
+    def as_dict(self):
+        """Returns these metrics in a form that can be serialized to JSON, with times in milliseconds"""
+
+        def milliseconds(seconds):
+            return round(seconds * 1000, 2) if seconds is not None else None
+
+        return {
+            "count": self.count,
+            "errors": sum(self.error_codes.values()),
+            "error_codes": {str(code): count for code, count in self.error_codes.items()},
+            "retries": self.retries,
+            "latency_ms": {
+                "mean": milliseconds(self.total_seconds / self.count) if self.count else None,
+                "p50": milliseconds(self.percentile(50)),
+                "p90": milliseconds(self.percentile(90)),
+                "p99": milliseconds(self.percentile(99)),
+            },
+            "lock_wait_ms": {
+                "mean": milliseconds(self.total_lock_wait_seconds / self.count) if self.count else None,
+                "max": milliseconds(self.max_lock_wait_seconds),
+            },
+        }
+
+
+class EPPMetrics:
+    """
+    Collects the metrics of every command sent through an EPPLibWrapper, by command class:
+    how many were sent, how long they took, how long they waited for the connection lock,
+    which error codes came back and how many were retried. Reconnects to the registry
+    are counted across all commands.
+
+    Metrics are kept in memory for the life of the process, so each web worker has its own.
+    A summary is logged at most every SUMMARY_INTERVAL_SECONDS, as commands are sent.
+    Listeners added with add_listener are also called with each command's timings.
+    """
+
+    SUMMARY_INTERVAL_SECONDS = 600
+
+    def __init__(self):
+        self.commands: dict[str, CommandMetrics] = {}
+        self.reconnects = 0
+        self.listeners: list = []
+        self.started_at = time.time()
+        self._last_summary = time.monotonic()
+
+    def record_command(self, cmd_type, seconds, lock_wait_seconds, error_code=None, retried=False):
+        """Records one command sent to the registry. error_code is the code of the RegistryError
+        it failed with, if any, and retried says whether it was sent a second time."""
+        metrics = self.commands.get(cmd_type)
+        if metrics is None:
+            metrics = self.commands[cmd_type] = CommandMetrics()
+
+        metrics.count += 1
+        metrics.total_seconds += seconds
+        metrics.latencies.append(seconds)
+        metrics.total_lock_wait_seconds += lock_wait_seconds
+        metrics.max_lock_wait_seconds = max(metrics.max_lock_wait_seconds, lock_wait_seconds)
+        if retried:
+            metrics.retries += 1
+        if error_code is not None:
+            metrics.error_codes[error_code] += 1
+
+        for listener in self.listeners:
+            listener(cmd_type, seconds, lock_wait_seconds)
+        self.maybe_log_summary()
+
+    def add_listener(self, listener):
+        """Adds a function to be called with (cmd_type, seconds, lock_wait_seconds) for each command sent.
+        Adding the same function again does nothing."""
+        if listener not in self.listeners:
+            self.listeners.append(listener)
+
+    def record_reconnect(self):
+        """Records that the connection to the registry was opened again"""
+        self.reconnects += 1
+
+    def snapshot(self):
+        """Returns all of the metrics in a form that can be serialized to JSON"""
+        return {
+            "since": self.started_at,
+            "reconnects": self.reconnects,
+            "commands": {cmd_type: metrics.as_dict() for cmd_type, metrics in sorted(self.commands.items())},
+        }
+
+    def maybe_log_summary(self):
+        """Logs a summary if one has not been logged in the last SUMMARY_INTERVAL_SECONDS"""
+        now = time.monotonic()
+        if now - self._last_summary >= self.SUMMARY_INTERVAL_SECONDS:
+            self._last_summary = now
+            self.log_summary()
+
+    def log_summary(self):
+        """Logs one line per command type with its count, errors, retries and latencies"""
+        for cmd_type, metrics in sorted(self.commands.items()):
+            summary = metrics.as_dict()
+            logger.info(
+                f"EPP {cmd_type}: {summary['count']} sent, {summary['errors']} failed, "
+                f"{summary['retries']} retried, p50 {summary['latency_ms']['p50']}ms, "
+                f"p99 {summary['latency_ms']['p99']}ms, mean lock wait {summary['lock_wait_ms']['mean']}ms"
+            )
+        logger.info(f"EPP reconnects: {self.reconnects}")
+
+
+# The metrics of the registry client of this process
+EPP_METRICS = EPPMetrics()
@@ -7,6 +7,7 @@ from api.tests.common import less_console_noise_decorator
 from gevent.exceptions import ConcurrentObjectUseError
 from epplibwrapper.client import EPPLibWrapper
 from epplibwrapper.errors import RegistryError, LoginError
+from epplibwrapper.metrics import EPPMetrics
 import logging
 
 try:
@@ -380,3 +381,57 @@ class TestClient(TestCase):
             ):
                 result = wrapper.send(tested_command, cleaned=True)
                 self.assertEqual(expected_result, result.__dict__)
+
+    @less_console_noise_decorator
+    @patch("epplibwrapper.client.Client")
+    def test_send_records_metrics(self, mock_client):
+        """Test that each command sent is counted by its class, along with its error codes,
+        retries and the reconnects they cause, against a fake registry"""
+        success_result = self.fake_result(1000, "Command completed successfully")
+        failure_result = self.fake_result(2400, "Command failed")
+        not_found_result = self.fake_result(2303, "Object does not exist")
+
+        def side_effect(command, *args, **kwargs):
+            if isinstance(command, commands.InfoContact):
+                return not_found_result
+            if isinstance(command, commands.InfoDomain) and command.name == "retried.gov":
+                return failure_result
+            return success_result
+
+        mock_client.return_value.send = MagicMock(side_effect=side_effect)
+        metrics = EPPMetrics()
+        wrapper = EPPLibWrapper(metrics=metrics)
+
+        wrapper.send(commands.InfoDomain(name="igorville.gov"), cleaned=True)
+        wrapper.send(commands.InfoDomain(name="igorville.gov"), cleaned=True)
+        with self.assertRaises(RegistryError):
+            wrapper.send(commands.InfoContact(id="missing"), cleaned=True)
+        with self.assertRaises(RegistryError):
+            wrapper.send(commands.InfoDomain(name="retried.gov"), cleaned=True)
+
+        snapshot = metrics.snapshot()
+        info_domain = snapshot["commands"]["InfoDomain"]
+        self.assertEqual(info_domain["count"], 3)
+        self.assertEqual(info_domain["errors"], 1)
+        self.assertEqual(info_domain["error_codes"], {"2400": 1})
+        self.assertEqual(info_domain["retries"], 1)
+        self.assertIsNotNone(info_domain["latency_ms"]["p99"])
+        self.assertIsNotNone(info_domain["lock_wait_ms"]["max"])
+        info_contact = snapshot["commands"]["InfoContact"]
+        self.assertEqual(info_contact["count"], 1)
+        self.assertEqual(info_contact["error_codes"], {"2303": 1})
+        self.assertEqual(info_contact["retries"], 0)
+        # Only the retry reconnected; the first connection is made when the client is created
+        self.assertEqual(snapshot["reconnects"], 1)
+
+    def test_metrics_latency_percentiles(self):
+        """Test that latency percentiles are taken from the recorded latencies by nearest rank"""
+        metrics = EPPMetrics()
+        for milliseconds in range(1, 101):
+            metrics.record_command("InfoDomain", seconds=milliseconds / 1000, lock_wait_seconds=0)
+
+        latency = metrics.snapshot()["commands"]["InfoDomain"]["latency_ms"]
+        self.assertEqual(latency["p50"], 50.0)
+        self.assertEqual(latency["p90"], 90.0)
+        self.assertEqual(latency["p99"], 99.0)
+        self.assertEqual(latency["mean"], 50.5)
@@ -15,6 +15,7 @@ from django.conf import settings
 from django.shortcuts import redirect
 from django_fsm import get_available_FIELD_transitions, FSMField
 from registrar.models import DomainInformation, Portfolio, UserPortfolioPermission, DomainInvitation
+from registrar.models.utility.bulk_approval import DomainRequestBulkApproval
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
 from waffle.decorators import flag_is_active
 from django.contrib import admin, messages
@@ -26,7 +27,16 @@ from epplibwrapper.errors import ErrorCode, RegistryError
 from registrar.models.user_domain_role import UserDomainRole
 from waffle.admin import FlagAdmin
 from waffle.models import Sample, Switch
-from registrar.models import Contact, Domain, DomainRequest, DraftDomain, User, Website, SeniorOfficial
+from registrar.models import (
+    Contact,
+    Domain,
+    DomainRequest,
+    DomainRequestStatusChange,
+    DraftDomain,
+    User,
+    Website,
+    SeniorOfficial,
+)
 from registrar.utility.constants import BranchChoices
 from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
 from registrar.utility.waffle import flag_is_active_for_user
@@ -44,7 +54,6 @@ from django.contrib.admin.views.main import IGNORED_PARAMS
 from django_admin_multiple_choice_list_filter.list_filters import MultipleChoiceListFilter
 from import_export import resources
 from import_export.admin import ImportExportModelAdmin
-from django.core.exceptions import ObjectDoesNotExist
 from django.contrib.admin.widgets import FilteredSelectMultiple
 from django.utils.html import format_html
 from django.utils.translation import gettext_lazy as _
@@ -915,12 +924,18 @@ class MyUserAdmin(BaseUserAdmin, ImportExportModelAdmin):
     # Let's define First group
     # (which should in theory be the ONLY group)
     def group(self, obj):
-        if obj.groups.filter(name="full_access_group").exists():
+        # The groups are prefetched in get_queryset
+        group_names = {group.name for group in obj.groups.all()}
+        if "full_access_group" in group_names:
             return "full_access_group"
-        elif obj.groups.filter(name="cisa_analysts_group").exists():
+        elif "cisa_analysts_group" in group_names:
             return "cisa_analysts_group"
         return ""
 
+    def get_queryset(self, request):
+        """Loads each user's groups along with the users, for the group column"""
+        return super().get_queryset(request).prefetch_related("groups")
+
     def get_list_display(self, request):
         # The full_access_permission perm will load onto the full_access_group
         # which is equivalent to superuser. The other group we use to manage
@@ -1207,6 +1222,9 @@ class WebsiteAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "website",
     ]
     search_help_text = "Search by website."
+    # this ordering effects the ordering of results
+    # in autocomplete_fields
+    ordering = ["website"]
 
     def get_model_perms(self, request):
         """
@@ -1228,6 +1246,16 @@ class WebsiteAdmin(ListHeaderAdmin, ImportExportModelAdmin):
             return True
         return super().has_change_permission(request, obj)
 
+    def has_view_permission(self, request, obj=None):
+        """
+        Allow analysts to search websites from autocomplete fields.
+        """
+        superuser_perm = request.user.has_perm("registrar.full_access_permission")
+        analyst_perm = request.user.has_perm("registrar.analyst_access_permission")
+        if analyst_perm and not superuser_perm:
+            return True
+        return super().has_view_permission(request, obj)
+
     def response_change(self, request, obj):
         """
         Override to redirect users back to the previous page after saving.
@@ -1560,10 +1588,8 @@ class DomainInformationAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "is_policy_acknowledged",
     ]
 
-    # For each filter_horizontal, init in admin js extendFilterHorizontalWidgets
-    # to activate the edit/delete/view buttons
-    filter_horizontal = ("other_contacts",)
-
+    # Many to many fields use autocomplete rather than filter_horizontal, so that the change form
+    # only loads the linked rows and searches the rest page by page, instead of listing every row.
     autocomplete_fields = [
         "creator",
         "domain_request",
@@ -1571,6 +1597,7 @@ class DomainInformationAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "domain",
         "portfolio",
         "sub_organization",
+        "other_contacts",
     ]
 
     # Table ordering
@@ -1717,6 +1744,10 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "investigator",
     ]
 
+    # The related objects shown in list_display, loaded with the rows. These are nullable
+    # foreign keys, which the changelist does not select_related on its own.
+    list_select_related = ["requested_domain", "federal_agency", "investigator"]
+
     orderable_fk_fields = [
         ("requested_domain", "name"),
         ("investigator", ["first_name", "last_name"]),
@@ -1877,8 +1908,12 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "investigator",
         "portfolio",
         "sub_organization",
+        # Many to many fields use autocomplete rather than filter_horizontal, so that the change form
+        # only loads the linked rows and searches the rest page by page, instead of listing every row.
+        "current_websites",
+        "alternative_domains",
+        "other_contacts",
     ]
-    filter_horizontal = ("current_websites", "alternative_domains", "other_contacts")
 
     # Table ordering
     # NOTE: This impacts the select2 dropdowns (combobox)
@@ -1887,6 +1922,22 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
 
     change_form_template = "django/admin/domain_request_change_form.html"
 
+    actions = ["approve_selected"]
+
+    @admin.action(description="Approve selected domain requests", permissions=["change"])
+    def approve_selected(self, request, queryset):
+        """Approves the selected domain requests together, reporting any that could not be approved"""
+        result = DomainRequestBulkApproval().approve(queryset)
+
+        if result.approved:
+            self.message_user(
+                request,
+                f"Approved {len(result.approved)} domain request(s).",
+                messages.SUCCESS,
+            )
+        for domain_request, error_message in result.failed:
+            self.message_user(request, f"Could not approve {domain_request}: {error_message}", messages.ERROR)
+
     def get_fieldsets(self, request, obj=None):
         fieldsets = super().get_fieldsets(request, obj)
 
@@ -2169,31 +2220,20 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
 
     def change_view(self, request, object_id, form_url="", extra_context=None):
         """Display restricted warning,
-        Setup the auditlog trail and pass it in extra context."""
+        Setup the status history and pass it in extra context."""
         obj = self.get_object(request, object_id)
         self.display_restricted_warning(request, obj)
 
-        # Initialize variables for tracking status changes and filtered entries
-        filtered_audit_log_entries = []
-
-        try:
-            # Retrieve and order audit log entries by timestamp in descending order
-            audit_log_entries = LogEntry.objects.filter(object_id=object_id).order_by("-timestamp")
-
-            # Process each log entry to filter based on the change criteria
-            for log_entry in audit_log_entries:
-                entry = self.process_log_entry(log_entry)
-                if entry:
-                    filtered_audit_log_entries.append(entry)
-
-        except ObjectDoesNotExist as e:
-            logger.error(f"Object with object_id {object_id} does not exist: {e}")
-        except Exception as e:
-            logger.error(f"An error occurred during change_view: {e}")
-
-        # Initialize extra_context and add filtered entries
+        # The status history is read from its own table, rather than from every audit log entry
+        status_changes = (
+            DomainRequestStatusChange.objects.filter(domain_request=obj)
+            .select_related("actor")
+            .order_by("-changed_at", "-id")
+        )
         extra_context = extra_context or {}
-        extra_context["filtered_audit_log_entries"] = filtered_audit_log_entries
+        extra_context["filtered_audit_log_entries"] = [
+            status_change.as_history_entry() for status_change in status_changes
+        ]
 
         # Denote if an action needed email was sent or not
         email_sent = request.session.get("action_needed_email_sent", False)
@@ -2204,63 +2244,6 @@ class DomainRequestAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         # Call the superclass method with updated extra_context
         return super().change_view(request, object_id, form_url, extra_context)
 
-    def process_log_entry(self, log_entry):
-        """Process a log entry and return filtered entry dictionary if applicable."""
-        changes = log_entry.changes
-        status_changed = "status" in changes
-        rejection_reason_changed = "rejection_reason" in changes
-        action_needed_reason_changed = "action_needed_reason" in changes
-
-        # Check if the log entry meets the filtering criteria
-        if status_changed or (not status_changed and (rejection_reason_changed or action_needed_reason_changed)):
-            entry = {}
-
-            # Handle status change
-            if status_changed:
-                _, status_value = changes.get("status")
-                if status_value:
-                    entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(status_value)
-
-            # Handle rejection reason change
-            if rejection_reason_changed:
-                _, rejection_reason_value = changes.get("rejection_reason")
-                if rejection_reason_value:
-                    entry["rejection_reason"] = (
-                        ""
-                        if rejection_reason_value == "None"
-                        else DomainRequest.RejectionReasons.get_rejection_reason_label(rejection_reason_value)
-                    )
-                    # Handle case where rejection reason changed but not status
-                    if not status_changed:
-                        entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(
-                            DomainRequest.DomainRequestStatus.REJECTED
-                        )
-
-            # Handle action needed reason change
-            if action_needed_reason_changed:
-                _, action_needed_reason_value = changes.get("action_needed_reason")
-                if action_needed_reason_value:
-                    entry["action_needed_reason"] = (
-                        ""
-                        if action_needed_reason_value == "None"
-                        else DomainRequest.ActionNeededReasons.get_action_needed_reason_label(
-                            action_needed_reason_value
-                        )
-                    )
-                    # Handle case where action needed reason changed but not status
-                    if not status_changed:
-                        entry["status"] = DomainRequest.DomainRequestStatus.get_status_label(
-                            DomainRequest.DomainRequestStatus.ACTION_NEEDED
-                        )
-
-            # Add actor and timestamp information
-            entry["actor"] = log_entry.actor
-            entry["timestamp"] = log_entry.timestamp
-
-            return entry
-
-        return None
-
     def formfield_for_foreignkey(self, db_field, request, **kwargs):
         """Customize the behavior of formfields with foreign key relationships. This will customize
         the behavior of selects. Customized behavior includes sorting of objects in list."""
@@ -2498,6 +2481,9 @@ class DomainAdmin(ListHeaderAdmin, ImportExportModelAdmin):
         "deleted",
     ]
 
+    # Most columns are read from the domain's information, loaded with the rows
+    list_select_related = ["domain_info__federal_agency"]
+
     fieldsets = (
         (
             None,
@@ -3090,6 +3076,8 @@ class PortfolioAdmin(ListHeaderAdmin):
     ]
 
     list_display = ("organization_name", "organization_type", "federal_type", "creator")
+    # federal_type is read from the federal agency
+    list_select_related = ["federal_agency", "creator"]
     search_fields = ["organization_name"]
     search_help_text = "Search by organization name."
     readonly_fields = [
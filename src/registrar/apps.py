@@ -5,3 +5,8 @@ class RegistrarConfig(AppConfig):
     """Configure signal handling for our registrar Django application."""
 
     name = "registrar"
+
+    def ready(self):
+        from registrar.models.utility.audit_helper import connect_batched_audit_log_receivers
+
+        connect_batched_audit_log_receivers()
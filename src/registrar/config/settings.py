@@ -63,6 +63,8 @@ env_log_level = env.str("DJANGO_LOG_LEVEL", "DEBUG")
 env_base_url: str = env.str("DJANGO_BASE_URL")
 env_getgov_public_site_url = env.str("GETGOV_PUBLIC_SITE_URL", "")
 env_oidc_active_provider = env.str("OIDC_ACTIVE_PROVIDER", "identity sandbox")
+env_request_profiling_sample_rate = env.float("REQUEST_PROFILING_SAMPLE_RATE", 0.0)
+env_request_profiling_server_timing = env.bool("REQUEST_PROFILING_SERVER_TIMING", default=False)
 
 secret_login_key = b64decode(secret("DJANGO_SECRET_LOGIN_KEY", ""))
 secret_key = secret("DJANGO_SECRET_KEY")
@@ -179,6 +181,8 @@ MIDDLEWARE = [
     "django.middleware.csrf.CsrfViewMiddleware",
     # add `user` (the currently-logged-in user) to incoming HttpRequest objects
     "django.contrib.auth.middleware.AuthenticationMiddleware",
+    # log where the time of sampled requests goes, see REQUEST_PROFILING_SAMPLE_RATE
+    "registrar.registrar_middleware.RequestProfilingMiddleware",
     # Require login for every single request by default
     "login_required.middleware.LoginRequiredMiddleware",
     # provide framework for displaying messages to the user, see documentation
@@ -588,6 +592,15 @@ LOGGING = {
     },
 }
 
+# The share of requests (from 0 to 1) whose database queries, registry commands,
+# AWS calls and template rendering are timed and logged by RequestProfilingMiddleware.
+# Staff can also profile a single request by sending the X-Profile-Request header.
+REQUEST_PROFILING_SAMPLE_RATE = env_request_profiling_sample_rate
+
+# Whether profiled requests return their timings in a Server-Timing header.
+# Requests profiled with the X-Profile-Request header always do.
+REQUEST_PROFILING_SERVER_TIMING = env_request_profiling_server_timing
+
 # endregion
 # region: Login-------------------------------------------------------------###
 
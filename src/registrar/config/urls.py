@@ -31,9 +31,10 @@ from registrar.views.utility.api_views import (
     get_federal_and_portfolio_types_from_federal_agency_json,
     get_action_needed_email_for_user_json,
     get_rejection_email_for_user_json,
+    get_epp_metrics_json,
 )
 
-from registrar.views.domain_request import Step, PortfolioDomainRequestStep
+from registrar.views.domain_request import WIZARD_STEP_VIEWS
 from registrar.views.transfer_user import TransferUserView
 from registrar.views.utility import always_404
 from api.views import available, rdap, get_current_federal, get_current_full
@@ -45,26 +46,7 @@ domain_request_urls = [
 ]
 
 # dynamically generate the other domain_request_urls
-for step, view in [
-    # add/remove steps here
-    (Step.ORGANIZATION_TYPE, views.OrganizationType),
-    (Step.TRIBAL_GOVERNMENT, views.TribalGovernment),
-    (Step.ORGANIZATION_FEDERAL, views.OrganizationFederal),
-    (Step.ORGANIZATION_ELECTION, views.OrganizationElection),
-    (Step.ORGANIZATION_CONTACT, views.OrganizationContact),
-    (Step.ABOUT_YOUR_ORGANIZATION, views.AboutYourOrganization),
-    (Step.SENIOR_OFFICIAL, views.SeniorOfficial),
-    (Step.CURRENT_SITES, views.CurrentSites),
-    (Step.DOTGOV_DOMAIN, views.DotgovDomain),
-    (Step.PURPOSE, views.Purpose),
-    (Step.OTHER_CONTACTS, views.OtherContacts),
-    (Step.ADDITIONAL_DETAILS, views.AdditionalDetails),
-    (Step.REQUIREMENTS, views.Requirements),
-    (Step.REVIEW, views.Review),
-    # Portfolio steps
-    (PortfolioDomainRequestStep.REQUESTING_ENTITY, views.RequestingEntity),
-    (PortfolioDomainRequestStep.ADDITIONAL_DETAILS, views.PortfolioAdditionalDetails),
-]:
+for step, view in WIZARD_STEP_VIEWS:
     domain_request_urls.append(path(f"{step}/", view.as_view(), name=step))
 
 
@@ -215,6 +197,11 @@ urlpatterns = [
         get_rejection_email_for_user_json,
         name="get-rejection-email-for-user-json",
     ),
+    path(
+        "admin/api/get-epp-metrics-json/",
+        get_epp_metrics_json,
+        name="get-epp-metrics-json",
+    ),
     path("admin/", admin.site.urls),
     path(
         "reports/export_data_type_user/",
@@ -0,0 +1,241 @@
+from datetime import timedelta
+from django.utils import timezone
+import logging
+import random
+from faker import Faker
+from django.db import transaction
+
+from registrar.fixtures.fixtures_requests import DomainRequestFixture
+from registrar.models import (
+    Contact,
+    Domain,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    DraftDomain,
+    FederalAgency,
+    Portfolio,
+    PortfolioInvitation,
+    User,
+    UserDomainRole,
+    UserGroup,
+    UserPortfolioPermission,
+)
+from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
+
+fake = Faker()
+logger = logging.getLogger(__name__)
+
+
+class BenchmarkFixture(DomainRequestFixture):
+    """
+    Creates a synthetic dataset of a chosen size for the benchmark suite in src/benchmarks.
+
+    For each step up to `scale`, this adds: a ready domain in the benchmark portfolio,
+    managed by the owner; a domain request created by the owner, cycling through the
+    statuses of DomainRequestFixture.DOMAINREQUESTS; a portfolio member who manages that
+    domain and the shared domain; a portfolio invitation with a domain invitation to the
+    shared domain; and another portfolio, created by the member.
+
+    It also adds one started, federal domain request for the owner to walk through the wizard.
+
+    Fake data is seeded with `seed`, so the same scale and seed give the same dataset.
+    Unlike the other fixtures, this is not loaded by `./manage.py load`; it is loaded by
+    `./manage.py run_benchmarks` into a throwaway database.
+    """
+
+    OWNER = {
+        "username": "benchmark-owner",
+        "first_name": "Benchmark",
+        "last_name": "Owner",
+        "email": "benchmark-owner@igorville.gov",
+        "title": "Owner",
+        "phone": "2025555555",
+    }
+
+    ADMIN = {
+        "username": "benchmark-admin",
+        "first_name": "Benchmark",
+        "last_name": "Admin",
+        "email": "benchmark-admin@igorville.gov",
+        "title": "Analyst",
+        "phone": "2025555556",
+        "is_staff": True,
+        "is_superuser": True,
+    }
+
+    SHARED_DOMAIN = "benchmark-shared.gov"
+    WIZARD_DOMAIN = "benchmark-wizard.gov"
+
+    @classmethod
+    def load(cls, scale=100, seed=0):
+        """Creates the benchmark dataset. Returns the objects the benchmark scenarios start from."""
+        logger.info(f"Going to load a benchmark dataset of scale {scale}")
+        Faker.seed(seed)
+        random.seed(seed)
+
+        # Lumped under .atomic to ensure we don't make redundant DB calls.
+        # This bundles them all together, and then saves it in a single call.
+        with transaction.atomic():
+            owner = User.objects.create(**cls.OWNER)
+            admin = User.objects.create(**cls.ADMIN)
+            admin.groups.set([UserGroup.objects.get_or_create(name="full_access_group")[0]])
+
+            portfolio = Portfolio.objects.create(creator=owner, organization_name="Benchmark portfolio")
+            UserPortfolioPermission.objects.create(
+                user=owner,
+                portfolio=portfolio,
+                roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+                additional_permissions=[
+                    UserPortfolioPermissionChoices.VIEW_MEMBERS,
+                    UserPortfolioPermissionChoices.EDIT_MEMBERS,
+                ],
+            )
+
+            # Loaded once, rather than per request as in DomainRequestFixture._get_federal_agency
+            federal_agencies = list(FederalAgency.objects.all())
+
+            shared_domain = cls._create_domains(owner, portfolio, [cls.SHARED_DOMAIN])[0]
+            domains = cls._create_domains(owner, portfolio, [f"benchmark-{i}.gov" for i in range(scale)])
+            cls._create_requests(owner, portfolio, federal_agencies, scale)
+            members = cls._create_members(portfolio, domains, shared_domain)
+            cls._create_invitations(portfolio, shared_domain, scale)
+            Portfolio.objects.bulk_create(
+                [
+                    Portfolio(creator=member, organization_name=f"Benchmark portfolio {i}")
+                    for i, member in enumerate(members)
+                ]
+            )
+
+            wizard_request = cls._create_wizard_request(owner, federal_agencies)
+
+        logger.info(f"Loaded a benchmark dataset of scale {scale}")
+        return {
+            "owner": owner,
+            "admin": admin,
+            "portfolio": portfolio,
+            "domain": domains[0] if domains else shared_domain,
+            "wizard_request": wizard_request,
+        }
+
+    @classmethod
+    def _create_domains(cls, owner, portfolio, names):
+        """Bulk creates ready domains in the portfolio, managed by the owner."""
+        domains = Domain.objects.bulk_create(
+            [
+                Domain(
+                    name=name,
+                    state=Domain.State.READY,
+                    expiration_date=timezone.now().date() + timedelta(days=random.randint(1, 365)),  # nosec
+                )
+                for name in names
+            ]
+        )
+        DomainInformation.objects.bulk_create(
+            [
+                DomainInformation(
+                    creator=owner,
+                    domain=domain,
+                    portfolio=portfolio,
+                    organization_name=fake.company(),
+                    generic_org_type=DomainRequest.OrganizationChoices.FEDERAL,
+                )
+                for domain in domains
+            ]
+        )
+        UserDomainRole.objects.bulk_create(
+            [UserDomainRole(user=owner, domain=domain, role=UserDomainRole.Roles.MANAGER) for domain in domains]
+        )
+        return domains
+
+    @classmethod
+    def _create_requests(cls, owner, portfolio, federal_agencies, scale):
+        """Bulk creates domain requests created by the owner, each with a senior official and another contact."""
+        draft_domains = DraftDomain.objects.bulk_create(
+            [DraftDomain(name=f"benchmark-request-{i}.gov") for i in range(scale)]
+        )
+        senior_officials = Contact.objects.bulk_create([Contact(**cls.fake_contact()) for _ in range(scale)])
+        other_contacts = Contact.objects.bulk_create([Contact(**cls.fake_contact()) for _ in range(scale)])
+
+        domain_requests = []
+        for i in range(scale):
+            domain_request = DomainRequest(
+                creator=owner,
+                portfolio=portfolio,
+                organization_name=fake.company(),
+                requested_domain=draft_domains[i],
+                senior_official=senior_officials[i],
+                federal_agency=random.choice(federal_agencies) if federal_agencies else None,  # nosec
+            )
+            cls._set_non_foreign_key_fields(domain_request, cls.DOMAINREQUESTS[i % len(cls.DOMAINREQUESTS)])
+            domain_requests.append(domain_request)
+        DomainRequest.objects.bulk_create(domain_requests)
+
+        OtherContacts = DomainRequest.other_contacts.through
+        OtherContacts.objects.bulk_create(
+            [
+                OtherContacts(domainrequest_id=domain_request.id, contact_id=contact.id)
+                for domain_request, contact in zip(domain_requests, other_contacts)
+            ]
+        )
+
+    @classmethod
+    def _create_members(cls, portfolio, domains, shared_domain):
+        """Bulk creates a portfolio member for each domain, who manages it and the shared domain."""
+        members = User.objects.bulk_create(
+            [
+                User(
+                    username=f"benchmark-member-{i}",
+                    first_name=fake.first_name(),
+                    last_name=fake.last_name(),
+                    email=f"benchmark-member-{i}@igorville.gov",
+                )
+                for i in range(len(domains))
+            ]
+        )
+        UserPortfolioPermission.objects.bulk_create(
+            [
+                UserPortfolioPermission(
+                    user=member, portfolio=portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+                )
+                for member in members
+            ]
+        )
+        roles = []
+        for member, domain in zip(members, domains):
+            roles.append(UserDomainRole(user=member, domain=domain, role=UserDomainRole.Roles.MANAGER))
+            roles.append(UserDomainRole(user=member, domain=shared_domain, role=UserDomainRole.Roles.MANAGER))
+        UserDomainRole.objects.bulk_create(roles)
+        return members
+
+    @classmethod
+    def _create_invitations(cls, portfolio, shared_domain, scale):
+        """Bulk creates portfolio invitations, each with a domain invitation to the shared domain."""
+        emails = [f"benchmark-invited-{i}@igorville.gov" for i in range(scale)]
+        PortfolioInvitation.objects.bulk_create(
+            [
+                PortfolioInvitation(
+                    email=email, portfolio=portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+                )
+                for email in emails
+            ]
+        )
+        DomainInvitation.objects.bulk_create([DomainInvitation(email=email, domain=shared_domain) for email in emails])
+
+    @classmethod
+    def _create_wizard_request(cls, owner, federal_agencies):
+        """Creates a started, federal domain request, with every step of the wizard filled in."""
+        domain_request = DomainRequest(
+            creator=owner,
+            organization_name="Benchmark wizard org",
+            requested_domain=DraftDomain.objects.create(name=cls.WIZARD_DOMAIN),
+            senior_official=Contact.objects.create(**cls.fake_contact()),
+            federal_agency=random.choice(federal_agencies) if federal_agencies else None,  # nosec
+        )
+        cls._set_non_foreign_key_fields(
+            domain_request,
+            {"status": DomainRequest.DomainRequestStatus.STARTED, "generic_org_type": "federal"},
+        )
+        domain_request.save()
+        cls._set_many_to_many_relations(domain_request, {})
+        return domain_request
@@ -421,6 +421,9 @@ CurrentSitesFormSet = forms.formset_factory(
 
 
 class AlternativeDomainForm(RegistrarForm):
+    # A DomainAvailabilityCache set by the wizard, so registry checks are shared
+    domain_availability = None
+
     def clean_alternative_domain(self):
         """Validation code for domain names."""
         requested = self.cleaned_data.get("alternative_domain", None)
@@ -428,6 +431,7 @@ class AlternativeDomainForm(RegistrarForm):
             domain=requested,
             return_type=ValidationReturnType.FORM_VALIDATION_ERROR,
             blank_ok=True,
+            availability=self.domain_availability,
         )
         return validated
 
@@ -479,6 +483,9 @@ AlternativeDomainFormSet = forms.formset_factory(
 
 
 class DotGovDomainForm(RegistrarForm):
+    # A DomainAvailabilityCache set by the wizard, so registry checks are shared
+    domain_availability = None
+
     def to_database(self, obj):
         if not self.is_valid():
             return
@@ -510,6 +517,7 @@ class DotGovDomainForm(RegistrarForm):
         validated, _ = DraftDomain.validate_and_handle_errors(
             domain=requested,
             return_type=ValidationReturnType.FORM_VALIDATION_ERROR,
+            availability=self.domain_availability,
         )
         return validated
 
@@ -2,9 +2,12 @@
 
 from itertools import zip_longest
 from typing import Callable
+from django.db import transaction
 from django.db.models.fields.related import ForeignObjectRel
 from django import forms
+from django.utils import timezone
 from registrar.models import DomainRequest, Contact
+from registrar.models.utility.audit_helper import AuditHelper
 
 
 class RegistrarForm(forms.Form):
@@ -43,6 +46,48 @@ class RegistrarForm(forms.Form):
         return {name: getattr(obj, name) for name in cls.declared_fields.keys()}  # type: ignore
 
 
+class FormSetChanges:
+    """The writes needed to bring the rows joined to a domain request in line with a formset"""
+
+    def __init__(self, model):
+        self.model = model
+        self.to_create: list[dict] = []
+        # db_obj: {field name: (old value, new value)}
+        self.to_update: dict = {}
+        self.to_delete: list = []
+        self.to_unlink: list = []
+
+    def apply(self, obj, join):
+        """Writes the changes with at most one query for each kind of change"""
+        audit = AuditHelper()
+        related = getattr(obj, join)
+
+        if self.to_unlink:
+            related.remove(*self.to_unlink)
+
+        if self.to_delete:
+            # a queryset delete still sends delete signals, so these are audited as usual
+            self.model.objects.filter(pk__in=[db_obj.pk for db_obj in self.to_delete]).delete()
+
+        if self.to_update:
+            now = timezone.now()
+            fields = set()
+            for db_obj, changed_fields in self.to_update.items():
+                # bulk_update does not fill in auto_now fields
+                db_obj.updated_at = now
+                fields.update(changed_fields)
+                audit.log_update(db_obj, changed_fields)
+            self.model.objects.bulk_update(list(self.to_update), sorted(fields) + ["updated_at"])
+
+        if self.to_create:
+            created = self.model.objects.bulk_create([self.model(**kwargs) for kwargs in self.to_create])
+            related.add(*created)
+            for db_obj in created:
+                audit.log_create(db_obj)
+
+        audit.save()
+
+
 class RegistrarFormSet(forms.BaseFormSet):
     """
     As with RegistrarForm, a common set of methods and configuration.
@@ -98,63 +143,90 @@ class RegistrarFormSet(forms.BaseFormSet):
 
         Has hooks such as `should_delete` and `pre_update` by which the
         subclass can control behavior. Add more hooks whenever needed.
+
+        Cleaned data is compared against the related rows first, so rows which
+        did not change are not written at all. The remaining changes are applied
+        with one bulk query each for created, updated, deleted and unlinked rows.
         """
         if not self.is_valid():
             return
-        obj.save()
 
-        query = getattr(obj, join).order_by("created_at").all()  # order matters
-
-        # get the related name for the join defined for the db_obj for this form.
-        # the related name will be the reference on a related object back to db_obj
-        related_name = ""
-        field = obj._meta.get_field(join)
+        with transaction.atomic():
+            obj.save()
+
+            query = getattr(obj, join).order_by("created_at").all()  # order matters
+
+            # get the related name for the join defined for the db_obj for this form.
+            # the related name will be the reference on a related object back to db_obj
+            field = obj._meta.get_field(join)
+            related_name = self._get_related_name(field)
+
+            changes = FormSetChanges(field.related_model)
+
+            # the use of `zip` pairs the forms in the formset with the
+            # related objects gotten from the database -- there should always be
+            # at least as many forms as database entries: extra forms means new
+            # entries, but fewer forms is _not_ the correct way to delete items
+            # (likely a client-side error or an attempt at data tampering)
+            for db_obj, post_data in zip_longest(query, self.forms, fillvalue=None):
+                cleaned = post_data.cleaned_data if post_data is not None else {}
+
+                # matching database object exists, update it
+                if db_obj is not None and cleaned:
+                    if should_delete(cleaned):
+                        if hasattr(db_obj, "has_more_than_one_join") and db_obj.has_more_than_one_join(related_name):
+                            # Remove the specific relationship without deleting the object
+                            changes.to_unlink.append(db_obj)
+                        else:
+                            # If there are no other relationships, delete the object
+                            changes.to_delete.append(db_obj)
+                    else:
+                        changed_fields = self._apply_update(db_obj, cleaned, pre_update)
+                        if not changed_fields:
+                            continue
+                        if hasattr(db_obj, "has_more_than_one_join") and db_obj.has_more_than_one_join(related_name):
+                            # create a new db_obj and disconnect existing one
+                            changes.to_unlink.append(db_obj)
+                            changes.to_create.append(pre_create(db_obj, cleaned))
+                        else:
+                            changes.to_update[db_obj] = changed_fields
+
+                # no matching database object, create it
+                # make sure not to create a database object if cleaned has 'delete' attribute
+                elif db_obj is None and cleaned and not cleaned.get("DELETE", False):
+                    changes.to_create.append(pre_create(db_obj, cleaned))
+
+            changes.apply(obj, join)
+
+    @staticmethod
+    def _get_related_name(field) -> str:
+        """Returns the name a related object uses to refer back to the object of this join"""
         if isinstance(field, ForeignObjectRel) and callable(field.related_query_name):
-            related_name = field.related_query_name()
+            return field.related_query_name()
         elif hasattr(field, "related_query_name") and callable(field.related_query_name):
-            related_name = field.related_query_name()
-
-        # the use of `zip` pairs the forms in the formset with the
-        # related objects gotten from the database -- there should always be
-        # at least as many forms as database entries: extra forms means new
-        # entries, but fewer forms is _not_ the correct way to delete items
-        # (likely a client-side error or an attempt at data tampering)
-        for db_obj, post_data in zip_longest(query, self.forms, fillvalue=None):
-            cleaned = post_data.cleaned_data if post_data is not None else {}
-
-            # matching database object exists, update it
-            if db_obj is not None and cleaned:
-                if should_delete(cleaned):
-                    if hasattr(db_obj, "has_more_than_one_join") and db_obj.has_more_than_one_join(related_name):
-                        # Remove the specific relationship without deleting the object
-                        getattr(db_obj, related_name).remove(self.domain_request)
-                    else:
-                        # If there are no other relationships, delete the object
-                        db_obj.delete()
-                else:
-                    if hasattr(db_obj, "has_more_than_one_join") and db_obj.has_more_than_one_join(related_name):
-                        # create a new db_obj and disconnect existing one
-                        getattr(db_obj, related_name).remove(self.domain_request)
-                        kwargs = pre_create(db_obj, cleaned)
-                        getattr(obj, join).create(**kwargs)
-                    else:
-                        pre_update(db_obj, cleaned)
-                        db_obj.save()
+            return field.related_query_name()
+        return ""
 
-            # no matching database object, create it
-            # make sure not to create a database object if cleaned has 'delete' attribute
-            elif db_obj is None and cleaned and not cleaned.get("DELETE", False):
-                kwargs = pre_create(db_obj, cleaned)
-                getattr(obj, join).create(**kwargs)
+    def _apply_update(self, db_obj, cleaned, pre_update: Callable) -> dict:
+        """Runs pre_update on db_obj and returns the fields it changed, as
+        a dict of field name to (old value, new value)"""
+        fields = [field for field in db_obj._meta.concrete_fields if not field.primary_key]
+        before = {field.attname: getattr(db_obj, field.attname) for field in fields}
+        pre_update(db_obj, cleaned)
+        return {name: (old, getattr(db_obj, name)) for name, old in before.items() if getattr(db_obj, name) != old}
 
     @classmethod
     def on_fetch(cls, query):
         """Code to run when fetching formset's objects from the database."""
-        return query.values()
+        return [{field.attname: getattr(item, field.attname) for field in item._meta.concrete_fields} for item in query]
 
     @classmethod
     def from_database(cls, obj: DomainRequest, join: str, on_fetch: Callable):
-        """Returns a dict of form field values gotten from `obj`."""
+        """Returns a dict of form field values gotten from `obj`.
+
+        If the join was prefetched (already ordered by created_at), no query is made."""
+        if join in getattr(obj, "_prefetched_objects_cache", {}):
+            return on_fetch(getattr(obj, join).all())
         return on_fetch(getattr(obj, join).order_by("created_at"))  # order matters
 
 
@@ -1,19 +1,82 @@
-from django.core.paginator import Paginator
+import csv
+import io
 import logging
+import multiprocessing
 import os
+import time
 import pyzipper
-import tablib
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from django.core.management import BaseCommand
+from django.db import connections
 import registrar.admin
 
 logger = logging.getLogger(__name__)
 
+TMP_DIR = "tmp"
+ZIP_FILENAME = "tmp/exported_tables.zip"
+
+# Number of rows written to each csv file. import_tables expects files named {table_name}_{n}.csv
+ROWS_PER_FILE = 10000
+
+# Number of rows fetched per round trip from the server-side cursor
+CHUNK_SIZE = 2000
+
+
+def open_tmp_file(filename):
+    """Opens a csv file for writing in the tmp directory"""
+    return open(os.path.join(TMP_DIR, filename), "w", newline="")
+
+
+def export_table_to_tmp(table_name, rows_per_file, chunk_size):
+    """Exports a single table to csv files in the tmp directory.
+    This is the entry point for worker processes, so it lives at module level."""
+    command = Command()
+    command.rows_per_file = rows_per_file
+    command.chunk_size = chunk_size
+    return table_name, command.export_table(table_name, open_chunk=open_tmp_file)
+
 
 class Command(BaseCommand):
     help = "Exports tables in csv format to zip file in tmp directory."
 
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.rows_per_file = ROWS_PER_FILE
+        self.chunk_size = CHUNK_SIZE
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=1,
+            help="Number of tables to export in parallel worker processes",
+        )
+        parser.add_argument(
+            "--rowsPerFile",
+            type=int,
+            default=ROWS_PER_FILE,
+            help="Maximum number of rows written to each csv file",
+        )
+        parser.add_argument(
+            "--chunkSize",
+            type=int,
+            default=CHUNK_SIZE,
+            help="Number of rows fetched from the database per round trip",
+        )
+
     def handle(self, **options):
-        """Generates CSV files for specified tables and creates a zip archive"""
+        """Generates CSV files for specified tables and creates a zip archive.
+
+        Each table is streamed from a server-side cursor, so only one chunk of rows
+        is held in memory at a time. With a single worker the csv files are written
+        straight into the zip archive; with more workers, each table is exported by
+        a separate process into the tmp directory and added to the archive as it finishes.
+        """
+        workers = options.get("workers") or 1
+        self.rows_per_file = options.get("rowsPerFile") or ROWS_PER_FILE
+        self.chunk_size = options.get("chunkSize") or CHUNK_SIZE
+
         table_names = [
             "User",
             "Contact",
@@ -30,68 +93,100 @@ class Command(BaseCommand):
         ]
 
         # Ensure the tmp directory exists
-        os.makedirs("tmp", exist_ok=True)
-
-        for table_name in table_names:
-            self.export_table(table_name)
-
-        # Create a zip file containing all the CSV files
-        zip_filename = "tmp/exported_tables.zip"
-        with pyzipper.AESZipFile(zip_filename, "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
-            for table_name in table_names:
+        os.makedirs(TMP_DIR, exist_ok=True)
+
+        with pyzipper.AESZipFile(ZIP_FILENAME, "w", compression=pyzipper.ZIP_DEFLATED) as zipf:
+            if workers > 1:
+                self.export_tables_in_parallel(zipf, table_names, workers)
+            else:
+                for table_name in table_names:
+                    self.export_table(table_name, open_chunk=lambda filename: self.open_zip_entry(zipf, filename))
+
+    def open_zip_entry(self, zipf, filename):
+        """Opens a csv file for writing directly inside of the zip archive"""
+        logger.info(f"Adding {filename} to {ZIP_FILENAME}")
+        return io.TextIOWrapper(zipf.open(filename, "w"), encoding="utf-8", newline="")
+
+    def export_tables_in_parallel(self, zipf, table_names, workers):
+        """Exports each table in its own worker process, then moves the
+        resulting csv files from the tmp directory into the zip archive"""
+
+        # Forked workers must not share the parent's database connection
+        connections.close_all()
+
+        # Forked workers inherit the already configured django app registry
+        mp_context = multiprocessing.get_context("fork")
+        with ProcessPoolExecutor(max_workers=workers, mp_context=mp_context) as executor:
+            futures = [
+                executor.submit(export_table_to_tmp, table_name, self.rows_per_file, self.chunk_size)
+                for table_name in table_names
+            ]
+            for future in as_completed(futures):
+                table_name, filenames = future.result()
+                for filename in filenames:
+                    file_path = os.path.join(TMP_DIR, filename)
 
-                # Define the tmp directory and the file pattern
-                tmp_dir = "tmp"
-                pattern = f"{table_name}_"
-                zip_file_path = os.path.join(tmp_dir, "exported_files.zip")
-
-                # Find all files that match the pattern
-                matching_files = [file for file in os.listdir(tmp_dir) if file.startswith(pattern)]
-                for file_path in matching_files:
                     # Add each file to the zip archive
-                    zipf.write(f"tmp/{file_path}", os.path.basename(file_path))
-                    logger.info(f"Added {file_path} to {zip_file_path}")
+                    zipf.write(file_path, filename)
+                    logger.info(f"Added {filename} to {ZIP_FILENAME}")
 
                     # Remove the file after adding to zip
-                    os.remove(f"tmp/{file_path}")
-                    logger.info(f"Removed {file_path}")
+                    os.remove(file_path)
+                    logger.info(f"Removed {filename}")
+
+    def export_table(self, table_name, open_chunk=open_tmp_file):
+        """Export a given table to csv files of at most self.rows_per_file rows.
 
-    def export_table(self, table_name):
-        """Export a given table to csv files in the tmp directory"""
+        open_chunk is called with each file name and returns the text stream to write to.
+        Returns the list of file names written."""
         resourcename = f"{table_name}Resource"
+        filenames = []
         try:
             resourceclass = getattr(registrar.admin, resourcename)
-            dataset = resourceclass().export()
-            if not isinstance(dataset, tablib.Dataset):
-                raise ValueError(f"Exported data from {resourcename} is not a tablib.Dataset")
-
-            # Determine the number of rows per file
-            rows_per_file = 10000
-
-            # Use Paginator to handle splitting the dataset
-            paginator = Paginator(dataset.dict, rows_per_file)
-            num_files = paginator.num_pages
-
-            logger.info(f"splitting {table_name} into {num_files} files")
-
-            # Export each page to a separate file
-            for page_num in paginator.page_range:
-                page = paginator.page(page_num)
-
-                # Create a new dataset for the chunk
-                chunk = tablib.Dataset(headers=dataset.headers)
-                for row_dict in page.object_list:
-                    row = [row_dict[header] for header in dataset.headers]
-                    chunk.append(row)
-
-                # Export the chunk to a new file
-                filename = f"tmp/{table_name}_{page_num}.csv"
-                with open(filename, "w") as f:
-                    f.write(chunk.export("csv"))
-
-            logger.info(f"Successfully exported {table_name} into {num_files} files.")
+            resource = resourceclass()
+            headers = resource.get_export_headers()
+
+            # Order by pk so that the split between files is stable across runs
+            queryset = resource.get_queryset().order_by("pk")
+
+            start_time = time.perf_counter()
+            row_count = 0
+            stream = None
+            try:
+                for obj in queryset.iterator(chunk_size=self.chunk_size):
+                    if row_count % self.rows_per_file == 0:
+                        if stream is not None:
+                            stream.close()
+                        stream, writer = self._start_chunk(table_name, headers, filenames, open_chunk)
+                    writer.writerow(resource.export_resource(obj))
+                    row_count += 1
+
+                # An empty table still gets a file containing only the headers
+                if not filenames:
+                    stream, writer = self._start_chunk(table_name, headers, filenames, open_chunk)
+            finally:
+                if stream is not None:
+                    stream.close()
+
+            elapsed = time.perf_counter() - start_time
+            rows_per_second = row_count / elapsed if elapsed > 0 else row_count
+            logger.info(
+                f"Successfully exported {table_name} into {len(filenames)} files. "
+                f"{row_count} rows in {elapsed:.2f}s ({rows_per_second:.0f} rows/sec)"
+            )
 
         except AttributeError:
             logger.error(f"Resource class {resourcename} not found in registrar.admin")
         except Exception as e:
             logger.error(f"Failed to export {table_name}: {e}")
+
+        return filenames
+
+    def _start_chunk(self, table_name, headers, filenames, open_chunk):
+        """Opens the next csv file for table_name and writes its header row"""
+        filename = f"{table_name}_{len(filenames) + 1}.csv"
+        filenames.append(filename)
+        stream = open_chunk(filename)
+        writer = csv.writer(stream)
+        writer.writerow(headers)
+        return stream, writer
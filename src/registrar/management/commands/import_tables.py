@@ -1,23 +1,55 @@
 import argparse
+import csv
 import logging
 import os
+import time
 import pyzipper
 import tablib
 from django.apps import apps
 from django.conf import settings
-from django.db import transaction
+from django.core.exceptions import FieldDoesNotExist
+from django.core.management.color import no_style
+from django.db import connection, models, transaction
 from django.core.management import BaseCommand
 import registrar.admin
 
 logger = logging.getLogger(__name__)
 
 
+class ImportVerificationError(Exception):
+    """Raised when the rows merged into a table do not match the rows read from its csv files"""
+
+
 class Command(BaseCommand):
     help = "Imports tables from a zip file, exported_tables.zip, containing CSV files in the tmp directory."
 
     def add_arguments(self, parser):
         """Add command line arguments."""
         parser.add_argument("--skipEppSave", default=True, action=argparse.BooleanOptionalAction)
+        parser.add_argument(
+            "--copy",
+            default=False,
+            action=argparse.BooleanOptionalAction,
+            help="Bulk load each table with postgres COPY instead of importing row by row",
+        )
+        parser.add_argument(
+            "--deferConstraints",
+            default=False,
+            action=argparse.BooleanOptionalAction,
+            help="With --copy, import all tables in one transaction and check foreign keys once at commit",
+        )
+        parser.add_argument(
+            "--resetSequences",
+            default=True,
+            action=argparse.BooleanOptionalAction,
+            help="With --copy, reset primary key sequences after loading each table",
+        )
+        parser.add_argument(
+            "--verify",
+            default=True,
+            action=argparse.BooleanOptionalAction,
+            help="With --copy, compare row counts and checksums of the loaded rows against the csv files",
+        )
 
     def handle(self, **options):
         """Extracts CSV files from a zip archive and imports them into the respective tables"""
@@ -27,6 +59,14 @@ class Command(BaseCommand):
             return
 
         self.skip_epp_save = options.get("skipEppSave")
+        self.use_copy = options.get("copy", False)
+        self.defer_constraints = options.get("deferConstraints", False)
+        self.reset_sequences = options.get("resetSequences", True)
+        self.verify = options.get("verify", True)
+
+        if self.use_copy and not self.skip_epp_save:
+            logger.error("--copy loads rows directly into the database and cannot be combined with --no-skipEppSave")
+            return
 
         table_names = [
             "User",
@@ -56,9 +96,15 @@ class Command(BaseCommand):
             zipf.extractall("tmp")
             logger.info(f"Extracted zip file {zip_filename} into tmp directory")
 
+        if self.use_copy:
+            self.copy_import_tables(table_names)
+            return
+
         # Import each CSV file
         for table_name in table_names:
+            start_time = time.perf_counter()
             self.import_table(table_name)
+            logger.info(f"Imported {table_name} in {time.perf_counter() - start_time:.2f}s")
 
     def import_table(self, table_name):
         """Import data from a CSV file into the given table"""
@@ -98,6 +144,180 @@ class Command(BaseCommand):
                     os.remove(csv_filename)
                     logger.info(f"Removed temporary file {csv_filename}")
 
+    def copy_import_tables(self, table_names):
+        """Bulk loads each table with COPY, in the order given.
+
+        By default each table is loaded in its own transaction. With deferConstraints,
+        all tables share one transaction so foreign keys are only checked once at commit,
+        and a failure in any table rolls back the whole import."""
+        if not self.defer_constraints:
+            for table_name in table_names:
+                try:
+                    with transaction.atomic():
+                        self.copy_import_table(table_name)
+                except Exception as e:
+                    logger.error(f"Failed to import {table_name}: {e}")
+            return
+
+        try:
+            with transaction.atomic():
+                with connection.cursor() as cursor:
+                    cursor.execute("SET CONSTRAINTS ALL DEFERRED")
+                for table_name in table_names:
+                    self.copy_import_table(table_name)
+        except Exception as e:
+            logger.error(f"Failed to import tables, no changes were saved: {e}")
+
+    def copy_import_table(self, table_name):
+        """Loads all csv files for the given table into a staging table with COPY,
+        then merges the staged rows into the table, inserting new rows and updating
+        existing rows by primary key. Must be called inside of a transaction."""
+        model = apps.get_model("registrar", table_name)
+        pattern = f"{table_name}_"
+        csv_paths = [os.path.join("tmp", file) for file in sorted(os.listdir("tmp")) if file.startswith(pattern)]
+        if not csv_paths:
+            logger.info(f"No files found for {table_name}")
+            return
+
+        start_time = time.perf_counter()
+        with open(csv_paths[0], "r", newline="") as csvfile:
+            headers = next(csv.reader(csvfile))
+
+        staging_table = connection.ops.quote_name(f"import_staging_{model._meta.db_table}")
+        staging_columns = ", ".join(connection.ops.quote_name(header) for header in headers)
+        staging_definition = ", ".join(f"{connection.ops.quote_name(header)} text" for header in headers)
+        with connection.cursor() as cursor:
+            # Every column is staged as text so that rows load without constraint checks
+            cursor.execute(f"CREATE TEMP TABLE {staging_table} ({staging_definition}) ON COMMIT DROP")
+            for csv_path in csv_paths:
+                with open(csv_path, "r", newline="") as csvfile:
+                    cursor.copy_expert(f"COPY {staging_table} ({staging_columns}) FROM STDIN WITH CSV HEADER", csvfile)
+                os.remove(csv_path)
+                logger.info(f"Removed temporary file {csv_path}")
+
+            row_count = self._merge_staging_table(cursor, model, staging_table, headers)
+
+            if self.reset_sequences:
+                self._reset_sequences(cursor, model)
+
+        elapsed = time.perf_counter() - start_time
+        rows_per_second = row_count / elapsed if elapsed > 0 else row_count
+        logger.info(
+            f"Successfully imported {table_name} with COPY. "
+            f"{row_count} rows in {elapsed:.2f}s ({rows_per_second:.0f} rows/sec)"
+        )
+
+    def _merge_staging_table(self, cursor, model, staging_table, headers):
+        """Upserts rows from the staging table into the model's table, then replaces
+        the many to many relations of those rows. Returns the number of rows merged."""
+        qn = connection.ops.quote_name
+        table = qn(model._meta.db_table)
+        pk_field = model._meta.pk
+
+        columns = []
+        expressions = []
+        m2m_fields = []
+        for header in headers:
+            try:
+                field = model._meta.get_field(header)
+            except FieldDoesNotExist:
+                logger.warning(f"Skipping column {header}, which is not a field on {model.__name__}")
+                continue
+            if field.many_to_many:
+                m2m_fields.append(field)
+            elif field.concrete:
+                columns.append(field.column)
+                expressions.append(self._cast_expression(field, f"s.{qn(header)}"))
+
+        if pk_field.name not in headers:
+            raise ImportVerificationError(f"{model.__name__} files do not contain the primary key column")
+
+        staged_pk = self._cast_expression(pk_field, f"s.{qn(pk_field.name)}")
+        column_list = ", ".join(qn(column) for column in columns)
+        updates = ", ".join(f"{qn(column)} = EXCLUDED.{qn(column)}" for column in columns if column != pk_field.column)
+        conflict_action = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+        cursor.execute(
+            f"INSERT INTO {table} ({column_list}) "
+            f"SELECT {', '.join(expressions)} FROM {staging_table} s "
+            f"ON CONFLICT ({qn(pk_field.column)}) {conflict_action}"
+        )
+        row_count = cursor.rowcount
+
+        for field in m2m_fields:
+            self._merge_many_to_many(cursor, field, staging_table, staged_pk)
+
+        if self.verify:
+            self._verify_merge(cursor, model, staging_table, columns, expressions, staged_pk)
+
+        return row_count
+
+    def _merge_many_to_many(self, cursor, field, staging_table, staged_pk):
+        """Replaces the relations in the field's through table for every staged row.
+        Exported many to many columns hold a comma separated list of related ids."""
+        through = field.remote_field.through
+        if not through._meta.auto_created:
+            # Relations with an explicit through model are imported as their own table
+            return
+
+        qn = connection.ops.quote_name
+        through_table = qn(through._meta.db_table)
+        source_column = qn(field.m2m_column_name())
+        target_column = qn(field.m2m_reverse_name())
+        target_type = field.remote_field.model._meta.pk.rel_db_type(connection)
+        staged_value = f"s.{qn(field.name)}"
+        cursor.execute(
+            f"DELETE FROM {through_table} WHERE {source_column} IN (SELECT {staged_pk} FROM {staging_table} s)"
+        )
+        cursor.execute(
+            f"INSERT INTO {through_table} ({source_column}, {target_column}) "
+            f"SELECT {staged_pk}, related_id::{target_type} "
+            f"FROM {staging_table} s, unnest(string_to_array({staged_value}, ',')) AS related_id "
+            f"WHERE {staged_value} <> '' "
+            "ON CONFLICT DO NOTHING"
+        )
+
+    def _verify_merge(self, cursor, model, staging_table, columns, expressions, staged_pk):
+        """Compares the row count and an md5 checksum of the staged rows
+        with the rows now stored in the table under the same primary keys"""
+        qn = connection.ops.quote_name
+        table = qn(model._meta.db_table)
+        pk_column = qn(model._meta.pk.column)
+        cursor.execute(
+            f"SELECT count(*), md5(string_agg(ROW({', '.join(expressions)})::text, '|' ORDER BY {staged_pk})) "
+            f"FROM {staging_table} s"
+        )
+        staged_count, staged_checksum = cursor.fetchone()
+        cursor.execute(
+            f"SELECT count(*), md5(string_agg(ROW({', '.join(f't.{qn(c)}' for c in columns)})::text, '|' "
+            f"ORDER BY t.{pk_column})) "
+            f"FROM {table} t WHERE t.{pk_column} IN (SELECT {staged_pk} FROM {staging_table} s)"
+        )
+        stored_count, stored_checksum = cursor.fetchone()
+        if staged_count != stored_count or staged_checksum != stored_checksum:
+            raise ImportVerificationError(
+                f"Verification failed for {model.__name__}: staged {staged_count} rows ({staged_checksum}), "
+                f"found {stored_count} rows ({stored_checksum})"
+            )
+        logger.info(f"Verified {stored_count} rows of {model.__name__} (checksum {stored_checksum})")
+
+    def _reset_sequences(self, cursor, model):
+        """Moves the primary key sequences of the model and its
+        many to many tables past the largest imported id"""
+        sequence_models = [model] + [
+            field.remote_field.through
+            for field in model._meta.local_many_to_many
+            if field.remote_field.through._meta.auto_created
+        ]
+        for statement in connection.ops.sequence_reset_sql(no_style(), sequence_models):
+            cursor.execute(statement)
+
+    def _cast_expression(self, field, column_sql):
+        """Returns sql casting a staged text column to the type of the given field.
+        Empty csv values are loaded as null, so they become empty strings again for non-null text fields."""
+        if not field.null and isinstance(field, (models.CharField, models.TextField)):
+            column_sql = f"COALESCE({column_sql}, '')"
+        return f"{column_sql}::{field.db_type(connection)}"
+
     def clean_table(self, table_name):
         """Delete all rows in the given table"""
         try:
@@ -7,11 +7,10 @@ import os
 
 from django.core.management import BaseCommand
 from registrar.management.commands.utility.extra_transition_domain_helper import OrganizationDataLoader
-from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
+from registrar.management.commands.utility.terminal_helper import ScriptDataHelper, TerminalColors, TerminalHelper
 from registrar.management.commands.utility.transition_domain_arguments import TransitionDomainArguments
 from registrar.models import TransitionDomain, DomainInformation
-from django.core.paginator import Paginator
-from typing import List
+from typing import List, Set
 from registrar.models.domain import Domain
 
 from registrar.management.commands.utility.load_organization_error import (
@@ -28,6 +27,7 @@ class Command(BaseCommand):
     def __init__(self):
         super().__init__()
         self.domain_information_to_update: List[DomainInformation] = []
+        self.domain_information_ids_to_update: Set[int] = set()
 
         # Stores the domain_name for logging purposes
         self.domains_failed_to_update: List[str] = []
@@ -147,10 +147,15 @@ class Command(BaseCommand):
             raise LoadOrganizationError(code=LoadOrganizationErrorCodes.EMPTY_TRANSITION_DOMAIN_TABLE)
 
         # Grab each TransitionDomain we want to change.
-        transition_domains = TransitionDomain.objects.filter(
-            username__in=[item.username for item in target_transition_domains],
-            domain_name__in=[item.domain_name for item in target_transition_domains],
-        )
+        target_keys = {(item.username, item.domain_name) for item in target_transition_domains}
+        domain_names = {item.domain_name for item in target_transition_domains}
+        transition_domains = [
+            transition_domain
+            for transition_domain in ScriptDataHelper.filter_in_batches(
+                TransitionDomain.objects.all(), "domain_name", domain_names
+            )
+            if (transition_domain.username, transition_domain.domain_name) in target_keys
+        ]
 
         # This indicates that some form of data corruption happened.
         if len(target_transition_domains) != len(transition_domains):
@@ -159,18 +164,31 @@ class Command(BaseCommand):
         # Maps TransitionDomain <--> DomainInformation.
         # If any related organization fields have been updated,
         # we can assume that they modified this information themselves - thus we should not update it.
-        domain_informations = DomainInformation.objects.filter(
-            domain__name__in=[td.domain_name for td in transition_domains],
-            address_line1__isnull=True,
-            city__isnull=True,
-            state_territory__isnull=True,
-            zipcode__isnull=True,
+        domain_informations = ScriptDataHelper.filter_in_batches(
+            DomainInformation.objects.select_related("domain").filter(
+                address_line1__isnull=True,
+                city__isnull=True,
+                state_territory__isnull=True,
+                zipcode__isnull=True,
+            ),
+            "domain__name",
+            domain_names,
         )
         filtered_domain_informations_dict = {di.domain.name: di for di in domain_informations if di.domain is not None}
 
+        # Count the domains for names without a DomainInformation to update, to log why
+        missing_domain_names = domain_names - filtered_domain_informations_dict.keys()
+        domain_counts = {name: 0 for name in missing_domain_names}
+        for name in ScriptDataHelper.filter_in_batches(
+            Domain.objects.values_list("name", flat=True), "name", missing_domain_names
+        ):
+            domain_counts[name] += 1
+
         # === Create DomainInformation objects === #
         for item in transition_domains:
-            self.map_transition_domain_to_domain_information(item, filtered_domain_informations_dict, debug)
+            self.map_transition_domain_to_domain_information(
+                item, filtered_domain_informations_dict, debug, domain_counts
+            )
 
         # === Log results and return data === #
         if len(self.domains_failed_to_update) > 0:
@@ -198,13 +216,9 @@ class Command(BaseCommand):
 
     def bulk_update_domain_information(self, debug):
         """Performs a bulk_update operation on a list of DomainInformation objects"""
-        # Create a Paginator object. Bulk_update on the full dataset
-        # is too memory intensive for our current app config, so we can chunk this data instead.
-        batch_size = 1000
-        paginator = Paginator(self.domain_information_to_update, batch_size)
-        for page_num in paginator.page_range:
-            page = paginator.page(page_num)
-            DomainInformation.objects.bulk_update(page.object_list, self.changed_fields)
+        # Bulk_update on the full dataset is too memory intensive
+        # for our current app config, so this is done in chunks.
+        ScriptDataHelper.bulk_update_fields(DomainInformation, self.domain_information_to_update, self.changed_fields)
 
         if debug:
             logger.info(f"Updated these DomainInformations: {[item for item in self.domain_information_to_update]}")
@@ -215,14 +229,18 @@ class Command(BaseCommand):
             f"{TerminalColors.ENDC}"
         )
 
-    def map_transition_domain_to_domain_information(self, item, domain_informations_dict, debug):
+    def map_transition_domain_to_domain_information(self, item, domain_informations_dict, debug, domain_counts=None):
         """Attempts to return a DomainInformation object based on values from TransitionDomain.
         Any domains which cannot be updated will be stored in an array.
+
+        domain_counts: dict -> the number of Domains with each name that is missing from
+        domain_informations_dict, if already known.
         """
         does_not_exist: bool = self.is_domain_name_missing(item, domain_informations_dict)
         all_fields_are_none: bool = self.is_organization_data_missing(item)
         if does_not_exist:
-            self.handle_if_domain_name_missing(item.domain_name)
+            domain_count = domain_counts.get(item.domain_name) if domain_counts is not None else None
+            self.handle_if_domain_name_missing(item.domain_name, domain_count)
         elif all_fields_are_none:
             logger.info(
                 f"{TerminalColors.YELLOW}"
@@ -241,7 +259,10 @@ class Command(BaseCommand):
             current_domain_information.city = item.city
             current_domain_information.state_territory = item.state_territory
             current_domain_information.zipcode = item.zipcode
-            self.domain_information_to_update.append(current_domain_information)
+            # Several TransitionDomains can share a domain, but each DomainInformation is only written once
+            if current_domain_information.id not in self.domain_information_ids_to_update:
+                self.domain_information_ids_to_update.add(current_domain_information.id)
+                self.domain_information_to_update.append(current_domain_information)
 
             if debug:
                 logger.info(f"Updated {current_domain_information.domain.name}...")
@@ -255,7 +276,7 @@ class Command(BaseCommand):
         fields = [item.address_line, item.city, item.state_territory, item.zipcode]
         return all(field is None for field in fields)
 
-    def handle_if_domain_name_missing(self, domain_name):
+    def handle_if_domain_name_missing(self, domain_name, domain_count=None):
         """
         Infers what to log if we can't find a domain_name and updates the relevant lists.
 
@@ -266,12 +287,15 @@ class Command(BaseCommand):
 
         Args:
             domain_name (str): The name of the domain to check.
+            domain_count (int): The number of domains with this name, if already known.
         """  # noqa - E501 (harder to read)
-        domains = Domain.objects.filter(name=domain_name)
-        if domains.count() == 0:
+        if domain_count is None:
+            domain_count = Domain.objects.filter(name=domain_name).count()
+
+        if domain_count == 0:
             logger.error(f"Could not add {domain_name}. Domain does not exist.")
             self.domains_failed_to_update.append(domain_name)
-        elif domains.count() == 1:
+        elif domain_count == 1:
             logger.info(
                 f"{TerminalColors.YELLOW}"
                 f"Domain {domain_name} was updated by a user. Cannot update."
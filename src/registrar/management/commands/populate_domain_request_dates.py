@@ -10,10 +10,20 @@ logger = logging.getLogger(__name__)
 class Command(BaseCommand, PopulateScriptTemplate):
     help = "Loops through each domain request object and populates the last_status_update and first_submitted_date"
 
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        self.add_mass_update_arguments(parser)
+
     def handle(self, **kwargs):
         """Loops through each DomainRequest object and populates
         its last_status_update and first_submitted_date values"""
-        self.mass_update_records(DomainRequest, None, ["last_status_update", "first_submitted_date"])
+        self.mass_update_records(
+            DomainRequest,
+            None,
+            ["last_status_update", "first_submitted_date"],
+            batch_size=kwargs.get("batchSize", 1000),
+            resume_from_pk=kwargs.get("resumeFromPk"),
+        )
 
     def update_record(self, record: DomainRequest):
         """Defines how we update the first_submitted_date and last_status_update fields"""
@@ -0,0 +1,130 @@
+import logging
+
+from auditlog.models import LogEntry
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import BaseCommand
+from django.db.models import F, OuterRef, Q, Subquery
+
+from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
+from registrar.models import DomainRequest, DomainRequestStatusChange
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Copies the status history of each domain request from the audit log into the "
+        "DomainRequestStatusChange table. Only audit log entries older than a domain request's earliest "
+        "status change are copied, so changes recorded since the deploy are kept, and the command can be rerun."
+    )
+
+    # The fields whose changes appear in the status history
+    tracked_fields = ["status", "rejection_reason", "action_needed_reason"]
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=1000,
+            help="Number of status changes created per query",
+        )
+
+    def handle(self, **kwargs):
+        """Reads the audit log of each domain request, in order, up to its earliest status change,
+        and creates a status change for each entry which changed its status or a status reason"""
+        batch_size = kwargs.get("batchSize", 1000)
+
+        log_entries = self.get_log_entries_to_copy()
+
+        TerminalHelper.prompt_for_execution(
+            system_exit_on_terminate=True,
+            prompt_message=f"""
+            ==Proposed Changes==
+            Domain requests with audit log entries to copy: {log_entries.values("object_id").distinct().count()}
+            Audit log entries to read: {log_entries.count()}
+            """,
+            prompt_title="Do you wish to populate the domain request status history?",
+        )
+
+        created_count = 0
+        to_create = []
+        current_request_id = None
+        state: dict = {}
+        for log_entry in log_entries.iterator(chunk_size=batch_size):
+            if log_entry.object_id != current_request_id:
+                current_request_id = log_entry.object_id
+                state = {}
+
+            status_change = self.get_status_change(log_entry, state)
+            if status_change is not None:
+                to_create.append(status_change)
+
+            if len(to_create) >= batch_size:
+                DomainRequestStatusChange.objects.bulk_create(to_create)
+                created_count += len(to_create)
+                logger.info(f"Created {created_count} status changes. Last domain request: {current_request_id}")
+                to_create = []
+
+        if to_create:
+            DomainRequestStatusChange.objects.bulk_create(to_create)
+            created_count += len(to_create)
+
+        logger.info(
+            f"{TerminalColors.OKGREEN}"
+            f"============= FINISHED ===============\n"
+            f"Created {created_count} status changes"
+            f"{TerminalColors.ENDC}"
+        )
+
+    def get_log_entries_to_copy(self):
+        """Returns the audit log entries of each domain request which are older than its earliest
+        status change, or all of them if it has none, ordered by domain request then time.
+
+        Status changes are recorded on save from the deploy onwards, so a domain request changed
+        between the deploy and this command has a newer history which the audit log fills in."""
+        earliest_status_change = (
+            DomainRequestStatusChange.objects.filter(domain_request_id=OuterRef("object_id"))
+            .order_by("changed_at")
+            .values("changed_at")[:1]
+        )
+        return (
+            LogEntry.objects.filter(
+                content_type=ContentType.objects.get_for_model(DomainRequest),
+                object_id__in=DomainRequest.objects.values("id"),
+            )
+            .annotate(earliest_status_change=Subquery(earliest_status_change))
+            .filter(Q(earliest_status_change__isnull=True) | Q(timestamp__lt=F("earliest_status_change")))
+            .only("object_id", "changes", "actor_id", "timestamp")
+            .order_by("object_id", "timestamp", "id")
+        )
+
+    def get_status_change(self, log_entry, state):
+        """Returns an unsaved status change for log_entry, or None if it did not change the status
+        or a status reason. state holds the status and reasons of the domain request so far,
+        and is updated with the changes in log_entry."""
+        changes = log_entry.changes_dict
+        changed_fields = [field for field in self.tracked_fields if field in changes]
+        if not changed_fields:
+            return None
+
+        for field in changed_fields:
+            _, new_value = changes[field]
+            state[field] = None if new_value in (None, "None", "") else new_value
+
+        status = state.get("status")
+        if status is None:
+            # Older entries may change a reason without the status ever being logged
+            if "rejection_reason" in changed_fields:
+                status = DomainRequest.DomainRequestStatus.REJECTED
+            elif "action_needed_reason" in changed_fields:
+                status = DomainRequest.DomainRequestStatus.ACTION_NEEDED
+
+        return DomainRequestStatusChange(
+            domain_request_id=log_entry.object_id,
+            status=status,
+            rejection_reason=state.get("rejection_reason"),
+            action_needed_reason=state.get("action_needed_reason"),
+            actor_id=log_entry.actor_id,
+            changed_at=log_entry.timestamp,
+        )
@@ -17,6 +17,7 @@ class Command(BaseCommand, PopulateScriptTemplate):
     def add_arguments(self, parser):
         """Add command line arguments."""
         parser.add_argument("federal_cio_csv_path", help="A csv containing information about federal CIOs")
+        self.add_mass_update_arguments(parser)
 
     def handle(self, federal_cio_csv_path, **kwargs):
         """Loops through each FederalAgency object and attempts to update is_fceb and initials"""
@@ -36,7 +37,13 @@ class Command(BaseCommand, PopulateScriptTemplate):
                     self.federal_agency_dict[agency_name.strip()] = (initials, agency_status)
 
         # Update every federal agency record
-        self.mass_update_records(FederalAgency, {"agency__isnull": False}, ["acronym", "is_fceb"])
+        self.mass_update_records(
+            FederalAgency,
+            {"agency__isnull": False},
+            ["acronym", "is_fceb"],
+            batch_size=kwargs.get("batchSize", 1000),
+            resume_from_pk=kwargs.get("resumeFromPk"),
+        )
 
     def update_record(self, record: FederalAgency):
         """For each record, update the initials and is_fceb field if data exists for it"""
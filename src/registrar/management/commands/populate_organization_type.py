@@ -1,9 +1,8 @@
 import argparse
 import logging
 import os
-from typing import List
 from django.core.management import BaseCommand
-from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper, ScriptDataHelper
+from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
 from registrar.models import DomainInformation, DomainRequest
 from registrar.models.utility.generic_helper import CreateOrUpdateOrganizationTypeHelper
 
@@ -19,16 +18,6 @@ class Command(BaseCommand):
 
     def __init__(self):
         super().__init__()
-        # Get lists for DomainRequest
-        self.request_to_update: List[DomainRequest] = []
-        self.request_failed_to_update: List[DomainRequest] = []
-        self.request_skipped: List[DomainRequest] = []
-
-        # Get lists for DomainInformation
-        self.di_to_update: List[DomainInformation] = []
-        self.di_failed_to_update: List[DomainInformation] = []
-        self.di_skipped: List[DomainInformation] = []
-
         # Define a global variable for all domains with election offices
         self.domains_with_election_boards_set = set()
 
@@ -56,7 +45,7 @@ class Command(BaseCommand):
             system_exit_on_terminate=True,
             prompt_message=f"""
             ==Proposed Changes==
-            Number of DomainRequest objects to change: {len(domain_requests)}
+            Number of DomainRequest objects to change: {domain_requests.count()}
 
             Organization_type data will be added for all of these fields.
             """,
@@ -74,7 +63,7 @@ class Command(BaseCommand):
             system_exit_on_terminate=True,
             prompt_message=f"""
             ==Proposed Changes==
-            Number of DomainInformation objects to change: {len(domain_infos)}
+            Number of DomainInformation objects to change: {domain_infos.count()}
 
             Organization_type data will be added for all of these fields.
             """,
@@ -106,49 +95,32 @@ class Command(BaseCommand):
 
     def update_domain_requests(self, domain_requests):
         """
-        Updates the organization_type for a list of DomainRequest objects using the `sync_organization_type` function.
-        Results are then logged.
-
-        This function updates the following variables:
-        - self.request_to_update list is appended to if the field was updated successfully.
-        - self.request_skipped list is appended to if the field has `None` for `request.generic_org_type`.
-        - self.request_failed_to_update list is appended to if an exception is caught during update.
+        Updates the organization_type for a queryset of DomainRequest objects in SQL.
+        Approved requests for domains in the election board file are marked as election offices first.
+        Requests with `None` for `generic_org_type` are skipped. Results are then logged.
         """
-        for request in domain_requests:
-            try:
-                if request.generic_org_type is not None:
-                    domain_name = None
-                    if request.requested_domain is not None and request.requested_domain.name is not None:
-                        domain_name = request.requested_domain.name
-
-                    request_is_approved = request.status == DomainRequest.DomainRequestStatus.APPROVED
-                    if request_is_approved and domain_name is not None and not request.is_election_board:
-                        request.is_election_board = domain_name in self.domains_with_election_boards_set
-
-                    self.sync_organization_type(DomainRequest, request)
-                    self.request_to_update.append(request)
-                    logger.info(f"Updating {request} => {request.organization_type}")
-                else:
-                    self.request_skipped.append(request)
-                    logger.warning(f"Skipped updating {request}. No generic_org_type was found.")
-            except Exception as err:
-                self.request_failed_to_update.append(request)
-                logger.error(err)
-                logger.error(f"{TerminalColors.FAIL}" f"Failed to update {request}" f"{TerminalColors.ENDC}")
-
-        # Do a bulk update on the organization_type field
-        ScriptDataHelper.bulk_update_fields(
-            DomainRequest, self.request_to_update, ["organization_type", "is_election_board", "generic_org_type"]
+        skipped_count = domain_requests.filter(generic_org_type__isnull=True).count()
+
+        election_board_count = (
+            domain_requests.filter(
+                generic_org_type__isnull=False,
+                status=DomainRequest.DomainRequestStatus.APPROVED,
+                requested_domain__name__in=self.domains_with_election_boards_set,
+            )
+            .exclude(is_election_board=True)
+            .update(is_election_board=True)
+        )
+        logger.info(f"Marked {election_board_count} DomainRequest(s) as election offices")
+
+        updated_count = CreateOrUpdateOrganizationTypeHelper.bulk_update_organization_type(
+            domain_requests, DomainRequest.OrgChoicesElectionOffice.get_org_generic_to_org_election()
         )
 
         # Log what happened
         log_header = "============= FINISHED UPDATE FOR DOMAINREQUEST ==============="
-        TerminalHelper.log_script_run_summary(
-            self.request_to_update, self.request_failed_to_update, self.request_skipped, True, log_header
-        )
+        TerminalHelper.log_script_run_counts(updated_count, 0, skipped_count, log_header)
 
-        update_skipped_count = len(self.request_to_update)
-        if update_skipped_count > 0:
+        if skipped_count > 0:
             logger.warning(
                 f"""{TerminalColors.MAGENTA}
                 Note: Entries are skipped when generic_org_type is None
@@ -158,80 +130,34 @@ class Command(BaseCommand):
 
     def update_domain_informations(self, domain_informations):
         """
-        Updates the organization_type for a list of DomainInformation objects
-        and updates is_election_board if the domain is in the provided csv.
-        Results are then logged.
-
-        This function updates the following variables:
-        - self.di_to_update list is appended to if the field was updated successfully.
-        - self.di_skipped list is appended to if the field has `None` for `request.generic_org_type`.
-        - self.di_failed_to_update list is appended to if an exception is caught during update.
+        Updates the organization_type for a queryset of DomainInformation objects in SQL.
+        Domain information for domains in the election board file is marked as an election office first.
+        Records with `None` for `generic_org_type` are skipped. Results are then logged.
         """
-        for info in domain_informations:
-            try:
-                if info.generic_org_type is not None:
-                    domain_name = info.domain.name
-
-                    if not info.is_election_board:
-                        info.is_election_board = domain_name in self.domains_with_election_boards_set
-
-                    self.sync_organization_type(DomainInformation, info)
-
-                    self.di_to_update.append(info)
-                    logger.info(f"Updating {info} => {info.organization_type}")
-                else:
-                    self.di_skipped.append(info)
-                    logger.warning(f"Skipped updating {info}. No generic_org_type was found.")
-            except Exception as err:
-                self.di_failed_to_update.append(info)
-                logger.error(err)
-                logger.error(f"{TerminalColors.FAIL}" f"Failed to update {info}" f"{TerminalColors.ENDC}")
-
-        # Do a bulk update on the organization_type field
-        ScriptDataHelper.bulk_update_fields(
-            DomainInformation, self.di_to_update, ["organization_type", "is_election_board", "generic_org_type"]
+        skipped_count = domain_informations.filter(generic_org_type__isnull=True).count()
+
+        election_board_count = (
+            domain_informations.filter(
+                generic_org_type__isnull=False,
+                domain__name__in=self.domains_with_election_boards_set,
+            )
+            .exclude(is_election_board=True)
+            .update(is_election_board=True)
+        )
+        logger.info(f"Marked {election_board_count} DomainInformation(s) as election offices")
+
+        updated_count = CreateOrUpdateOrganizationTypeHelper.bulk_update_organization_type(
+            domain_informations, DomainRequest.OrgChoicesElectionOffice.get_org_generic_to_org_election()
         )
 
         # Log what happened
         log_header = "============= FINISHED UPDATE FOR DOMAININFORMATION ==============="
-        TerminalHelper.log_script_run_summary(
-            self.di_to_update, self.di_failed_to_update, self.di_skipped, True, log_header
-        )
+        TerminalHelper.log_script_run_counts(updated_count, 0, skipped_count, log_header)
 
-        update_skipped_count = len(self.di_skipped)
-        if update_skipped_count > 0:
+        if skipped_count > 0:
             logger.warning(
                 f"""{TerminalColors.MAGENTA}
                 Note: Entries are skipped when generic_org_type is None
                 {TerminalColors.ENDC}
                 """
             )
-
-    def sync_organization_type(self, sender, instance):
-        """
-        Updates the organization_type (without saving) to match
-        the is_election_board and generic_organization_type fields.
-        """
-
-        # Define mappings between generic org and election org.
-        # These have to be defined here, as you'd get a cyclical import error
-        # otherwise.
-
-        # For any given organization type, return the "_ELECTION" enum equivalent.
-        # For example: STATE_OR_TERRITORY => STATE_OR_TERRITORY_ELECTION
-        generic_org_map = DomainRequest.OrgChoicesElectionOffice.get_org_generic_to_org_election()
-
-        # For any given "_election" variant, return the base org type.
-        # For example: STATE_OR_TERRITORY_ELECTION => STATE_OR_TERRITORY
-        election_org_map = DomainRequest.OrgChoicesElectionOffice.get_org_election_to_org_generic()
-
-        # Manages the "organization_type" variable and keeps in sync with
-        # "is_election_board" and "generic_organization_type"
-        org_type_helper = CreateOrUpdateOrganizationTypeHelper(
-            sender=sender,
-            instance=instance,
-            generic_org_to_org_map=generic_org_map,
-            election_org_to_generic_org_map=election_org_map,
-        )
-
-        org_type_helper.create_or_update_organization_type(force_update=True)
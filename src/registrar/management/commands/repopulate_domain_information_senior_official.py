@@ -35,7 +35,11 @@ class Command(BaseCommand, PopulateScriptTemplate):
         self.ao_dict = self.read_csv_file_and_get_contacts(domain_info_csv_path)
 
         self.mass_update_records(
-            DomainInformation, filter_conditions={"senior_official__isnull": True}, fields_to_update=["senior_official"]
+            DomainInformation,
+            filter_conditions={"senior_official__isnull": True},
+            fields_to_update=["senior_official"],
+            batch_size=kwargs.get("batchSize", 1000),
+            resume_from_pk=kwargs.get("resumeFromPk"),
         )
 
     def add_arguments(self, parser):
@@ -43,6 +47,7 @@ class Command(BaseCommand, PopulateScriptTemplate):
         parser.add_argument(
             "--domain_info_csv_path", help="A csv containing the domain information id and the contact id"
         )
+        self.add_mass_update_arguments(parser)
 
     def read_csv_file_and_get_contacts(self, file):
         dict_data = {}
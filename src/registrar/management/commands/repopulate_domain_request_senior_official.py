@@ -40,6 +40,8 @@ class Command(BaseCommand, PopulateScriptTemplate):
                 "senior_official__isnull": True,
             },
             fields_to_update=["senior_official"],
+            batch_size=kwargs.get("batchSize", 1000),
+            resume_from_pk=kwargs.get("resumeFromPk"),
         )
 
     def add_arguments(self, parser):
@@ -47,6 +49,7 @@ class Command(BaseCommand, PopulateScriptTemplate):
         parser.add_argument(
             "--domain_request_csv_path", help="A csv containing the domain request id and the contact id"
         )
+        self.add_mass_update_arguments(parser)
 
     def read_csv_file_and_get_contacts(self, file):
         dict_data: dict = {}
@@ -0,0 +1,128 @@
+"""Runs the benchmark suite in src/benchmarks against a synthetic dataset, and stores the results as JSON"""
+
+import argparse
+import contextlib
+import json
+import logging
+import os
+from datetime import datetime
+
+from auditlog.context import disable_auditlog
+from django.conf import settings
+from django.core.management import BaseCommand, CommandError
+from django.db import connection, transaction
+from django.test import Client
+from django.test.utils import setup_test_environment, teardown_test_environment
+from waffle.testutils import override_flag
+
+from benchmarks.runner import build_report, compare_reports, run_scenario, write_report
+from benchmarks.scenarios import SCENARIOS
+from benchmarks.stubs import fake_services
+from registrar.fixtures.fixtures_benchmark import BenchmarkFixture
+from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the throughput and p50/p95 latency of the registrar's most used pages and APIs. "
+        "Creates a throwaway test database, loads a synthetic dataset of the given scale into it, "
+        "and stubs out the registry, SES and S3, so it runs offline against a local Postgres. "
+        "Results are written as JSON to benchmarks/results, to compare against other commits."
+    )
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--scale",
+            type=int,
+            default=100,
+            help="Number of domains, domain requests, members and invitations in the dataset",
+        )
+        parser.add_argument("--seed", type=int, default=0, help="Seed of the fake data in the dataset")
+        parser.add_argument("--iterations", type=int, default=50, help="Measured iterations of each scenario")
+        parser.add_argument("--warmup", type=int, default=5, help="Iterations of each scenario before measuring")
+        parser.add_argument(
+            "--only",
+            action="append",
+            default=[],
+            help="Only run scenarios whose name contains this text. Can be given more than once",
+        )
+        parser.add_argument(
+            "--output",
+            help="Where to write the results. Defaults to benchmarks/results/<timestamp>.json",
+        )
+        parser.add_argument("--baseline", help="A results file from an earlier run to compare against")
+        parser.add_argument(
+            "--keepdb",
+            action=argparse.BooleanOptionalAction,
+            help="Keep the test database between runs, as with ./manage.py test --keepdb",
+        )
+
+    def handle(self, **options):
+        """Sets up the test database and dataset, then runs each scenario"""
+        if settings.IS_PRODUCTION:
+            raise CommandError("Benchmarks load synthetic data, and can not be run in production.")
+        if options["iterations"] < 1:
+            raise CommandError("--iterations must be at least 1.")
+
+        scenarios = [
+            scenario
+            for scenario in SCENARIOS
+            if not options["only"] or any(text in scenario.name for text in options["only"])
+        ]
+        if not scenarios:
+            raise CommandError(f"No scenarios match {options['only']}.")
+
+        baseline = None
+        if options["baseline"]:
+            with open(options["baseline"]) as f:
+                baseline = json.load(f)
+
+        setup_test_environment()
+        old_database_name = connection.settings_dict["NAME"]
+        connection.creation.create_test_db(verbosity=0, autoclobber=True, keepdb=options["keepdb"])
+        try:
+            # Rolled back once the scenarios have run, so a database kept with --keepdb starts empty
+            with transaction.atomic():
+                with disable_auditlog():
+                    data = BenchmarkFixture.load(scale=options["scale"], seed=options["seed"])
+                with fake_services():
+                    results = [self.run_scenario(scenario, data, options) for scenario in scenarios]
+                transaction.set_rollback(True)
+        finally:
+            connection.creation.destroy_test_db(old_database_name, verbosity=0, keepdb=options["keepdb"])
+            teardown_test_environment()
+
+        report = build_report(results, scale=options["scale"], seed=options["seed"])
+        output = options["output"] or self.default_output()
+        write_report(report, output)
+        TerminalHelper.colorful_logger(logger.info, TerminalColors.OKGREEN, f"Wrote benchmark results to {output}")
+
+        if baseline is not None:
+            logger.info(f"Compared with {options['baseline']} (commit {baseline['commit']}):")
+            for line in compare_reports(report, baseline):
+                logger.info(line)
+
+    def run_scenario(self, scenario, data, options):
+        """Runs one scenario with a fresh client, logged in as the scenario's user"""
+        client = Client()
+        client.force_login(data["admin"] if scenario.as_admin else data["owner"])
+        with contextlib.ExitStack() as stack:
+            for flag in scenario.flags:
+                stack.enter_context(override_flag(flag, active=True))
+            if scenario.setup is not None:
+                stack.enter_context(scenario.setup(data))
+            return run_scenario(
+                scenario.name,
+                lambda i: scenario.run(client, data, i),
+                iterations=options["iterations"],
+                warmup=options["warmup"],
+            )
+
+    @staticmethod
+    def default_output():
+        results_dir = settings.BASE_DIR / "benchmarks" / "results"
+        os.makedirs(results_dir, exist_ok=True)
+        return results_dir / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}.json"
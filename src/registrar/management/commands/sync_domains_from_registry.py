@@ -0,0 +1,198 @@
+"""Syncs the data stored for each domain with the registry, so it does not go stale between views"""
+
+import argparse
+import logging
+import time
+from datetime import timedelta
+
+from django.core.management import BaseCommand
+from django.core.paginator import Paginator
+from django.db import transaction
+from django.db.models import F, Q
+from django.utils import timezone
+
+from epplibwrapper.errors import RegistryError
+from registrar.management.commands.utility.terminal_helper import TerminalColors, TerminalHelper
+from registrar.models import Domain
+from registrar.models.utility.audit_helper import AuditHelper
+from registrar.models.utility.contact_error import ContactError
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = (
+        "Syncs the expiration dates, hosts and contacts stored for each domain with the registry. "
+        "Domains which have gone longest without a sync are synced first, and the registry's data is "
+        "compared against a hash from the last sync so that hosts and contacts are only fetched when it changed. "
+        "The hash covers the domain info only: a change to just a contact's details or a host's IPs is not "
+        "picked up until the domain is synced with --force, so run with --force now and then as well. "
+        "Domains in the unknown state, and domains the registry does not have, are skipped. "
+        "Meant to be run on a schedule."
+    )
+
+    # The fields on Domain which a sync can change, along with last_synced_at
+    synced_fields = [
+        "last_synced_at",
+        "registry_data_hash",
+        "security_contact_registry_id",
+        "expiration_date",
+        "created_at",
+        "updated_at",
+    ]
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.min_seconds_between_domains = 0.0
+        self.next_sync_time = 0.0
+
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=100,
+            help="Number of domains loaded and saved at a time",
+        )
+        parser.add_argument(
+            "--syncedBeforeHours",
+            type=float,
+            default=24,
+            help="Only sync domains which have not been synced in this many hours",
+        )
+        parser.add_argument(
+            "--limitParse",
+            type=int,
+            default=0,
+            help="Sets a cap on the number of domains to sync, set to 0 to sync all of them",
+        )
+        parser.add_argument(
+            "--maxDomainsPerSecond",
+            type=float,
+            default=5,
+            help="Most domains synced per second, to spread the load on the registry. Set to 0 for no limit",
+        )
+        parser.add_argument(
+            "--force",
+            action=argparse.BooleanOptionalAction,
+            help="Fetch the hosts and contacts of every domain, even if the registry data has not changed",
+        )
+        parser.add_argument("--debug", action=argparse.BooleanOptionalAction, help="Increases log chattiness")
+
+    def handle(self, **options):
+        """Syncs the domains which are due, a batch at a time"""
+        batch_size = options.get("batchSize")
+        synced_before = timezone.now() - timedelta(hours=options.get("syncedBeforeHours"))
+        limit_parse = options.get("limitParse")
+        max_domains_per_second = options.get("maxDomainsPerSecond")
+        force = options.get("force")
+        debug = options.get("debug")
+
+        if max_domains_per_second > 0:
+            self.min_seconds_between_domains = 1 / max_domains_per_second
+
+        domain_ids = list(self.get_domains_to_sync(synced_before).values_list("id", flat=True))
+        if limit_parse > 0:
+            domain_ids = domain_ids[:limit_parse]
+
+        logger.info(
+            f"{TerminalColors.MAGENTA}"
+            f"Syncing {len(domain_ids)} domains last synced before {synced_before}"
+            f"{TerminalColors.ENDC}"
+        )
+
+        synced: list[str] = []
+        unchanged: list[str] = []
+        failed: list[str] = []
+        paginator = Paginator(domain_ids, batch_size)
+        for page_num in paginator.page_range:
+            batch_synced, batch_unchanged, batch_failed = self.sync_batch(paginator.page(page_num).object_list, force)
+            synced.extend(batch_synced)
+            unchanged.extend(batch_unchanged)
+            failed.extend(batch_failed)
+            logger.info(
+                f"{TerminalColors.OKBLUE}"
+                f"Synced {len(synced) + len(unchanged) + len(failed)} of {len(domain_ids)} domains"
+                f"{TerminalColors.ENDC}"
+            )
+
+        TerminalHelper.print_conditional(
+            debug,
+            f"{TerminalColors.OKCYAN}Updated these domains: {synced}{TerminalColors.ENDC}\n"
+            f"{TerminalColors.FAIL}Failed to sync these domains: {failed}{TerminalColors.ENDC}",
+        )
+        TerminalHelper.log_script_run_counts(
+            len(synced),
+            len(failed),
+            len(unchanged),
+            log_header="============= FINISHED SYNCING DOMAINS (skipped = unchanged in the registry) ===============",
+        )
+
+    def get_domains_to_sync(self, synced_before):
+        """Returns the domains due a sync, those never synced first, then those synced longest ago.
+        Ties go to the domains expiring soonest. Deleted domains and those in the unknown state,
+        which may not exist in the registry yet, are left out."""
+        return (
+            Domain.objects.exclude(state__in=[Domain.State.DELETED, Domain.State.UNKNOWN])
+            .filter(Q(last_synced_at__isnull=True) | Q(last_synced_at__lt=synced_before))
+            .order_by(
+                F("last_synced_at").asc(nulls_first=True),
+                F("expiration_date").asc(nulls_last=True),
+                "id",
+            )
+        )
+
+    def sync_batch(self, domain_ids, force):
+        """Syncs the domains with the given ids with the registry, then saves them with one query
+        for the domains whose registry data is unchanged and one for the rest.
+        Returns the names of the domains which were changed, unchanged and failed to sync."""
+        domains_by_id = Domain.objects.in_bulk(domain_ids)
+        audit = AuditHelper()
+        changed_domains = []
+        unchanged_ids = []
+        failed = []
+        for domain_id in domain_ids:
+            domain = domains_by_id.get(domain_id)
+            if domain is None:
+                continue
+
+            self.wait_for_rate_limit()
+            try:
+                changes = domain.sync_from_registry(force=force)
+            except (RegistryError, ContactError, KeyError) as err:
+                failed.append(domain.name)
+                logger.error(f"{TerminalColors.FAIL}Failed to sync {domain}{TerminalColors.ENDC}")
+                logger.error(err)
+                continue
+
+            if changes:
+                changes.pop("registry_data_hash", None)
+                audit.log_update(domain, changes)
+                changed_domains.append(domain)
+            else:
+                unchanged_ids.append(domain.id)
+
+        now = timezone.now()
+        with transaction.atomic():
+            if unchanged_ids:
+                Domain.objects.filter(id__in=unchanged_ids).update(last_synced_at=now)
+            if changed_domains:
+                for domain in changed_domains:
+                    # bulk_update does not set auto_now fields
+                    domain.updated_at = now
+                Domain.objects.bulk_update(changed_domains, self.synced_fields)
+            audit.save()
+
+        unchanged = [domains_by_id[domain_id].name for domain_id in unchanged_ids]
+        return [domain.name for domain in changed_domains], unchanged, failed
+
+    def wait_for_rate_limit(self):
+        """Sleeps as long as needed to keep to --maxDomainsPerSecond"""
+        if not self.min_seconds_between_domains:
+            return
+
+        now = time.monotonic()
+        if self.next_sync_time > now:
+            time.sleep(self.next_sync_time - now)
+            now = self.next_sync_time
+        self.next_sync_time = now + self.min_seconds_between_domains
@@ -17,6 +17,10 @@ class Command(BaseCommand, PopulateScriptTemplate):
     help = "Loops through each valid User object and updates its verification_type value"
     prompt_title = "Do you wish to update all Federal Agencies?"
 
+    def add_arguments(self, parser):
+        """Add command line arguments."""
+        self.add_mass_update_arguments(parser)
+
     def handle(self, **kwargs):
         """Loops through each valid User object and updates the value of its verification_type field"""
 
@@ -62,7 +66,11 @@ class Command(BaseCommand, PopulateScriptTemplate):
         # Get all existing domain requests. Select_related allows us to skip doing db queries.
         self.all_domain_infos = DomainInformation.objects.select_related("federal_agency")
         self.mass_update_records(
-            FederalAgency, filter_conditions={"agency__isnull": False}, fields_to_update=["federal_type"]
+            FederalAgency,
+            filter_conditions={"agency__isnull": False},
+            fields_to_update=["federal_type"],
+            batch_size=kwargs.get("batchSize", 1000),
+            resume_from_pk=kwargs.get("resumeFromPk"),
         )
 
     def update_record(self, record: FederalAgency):
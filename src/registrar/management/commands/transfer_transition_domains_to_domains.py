@@ -18,6 +18,7 @@ from registrar.models.contact import Contact
 from registrar.models.domain_request import DomainRequest
 from registrar.models.domain_information import DomainInformation
 from registrar.models.user import User
+from registrar.models.utility.audit_helper import batched_audit_log
 from registrar.models.federal_agency import FederalAgency
 from registrar.utility.constants import BranchChoices
 
@@ -740,6 +741,15 @@ class Command(BaseCommand):
     def handle(
         self,
         **options,
+    ):
+        """Transfers the transition domains, writing the audit log
+        entries for the domains and invitations it saves together."""
+        with batched_audit_log():
+            self.transfer_transition_domains(**options)
+
+    def transfer_transition_domains(
+        self,
+        **options,
     ):
         """Parse entries in TransitionDomain table
         and create (or update) corresponding entries in the
@@ -809,6 +809,10 @@ class OrganizationDataLoader:
 
         self.tds_to_update: List[TransitionDomain] = []
 
+        # Maps each domain name to its row in the organization_adhoc file.
+        # Built once by build_org_info_index rather than looked up per domain.
+        self.org_info_by_domain: Dict[str, OrganizationAdhoc | None] | None = None
+
     def update_organization_data_for_all(self):
         """Updates org address data for valid TransitionDomains"""
         all_transition_domains = TransitionDomain.objects.all()
@@ -822,9 +826,34 @@ class OrganizationDataLoader:
 
         return self.tds_to_update
 
+    def build_org_info_index(self):
+        """Resolves the organization_adhoc row of every domain in the domain_additional file
+        in a single pass, and stores the result in self.org_info_by_domain"""
+        domain_additional_file = self.parsed_data.file_data.get(EnumFilenames.DOMAIN_ADDITIONAL)
+        org_file = self.parsed_data.file_data.get(EnumFilenames.ORGANIZATION_ADHOC)
+        domain_additional_rows = domain_additional_file.data if domain_additional_file is not None else {}
+        org_rows = org_file.data if org_file is not None else {}
+
+        self.org_info_by_domain = {}
+        missing_org_ids = set()
+        for domain_name, domain_additional_row in domain_additional_rows.items():
+            org_row = org_rows.get(domain_additional_row.orgid)
+            if org_row is None:
+                missing_org_ids.add(domain_additional_row.orgid)
+            self.org_info_by_domain[domain_name] = org_row
+
+        if missing_org_ids:
+            file_name = EnumFilenames.ORGANIZATION_ADHOC.value[0]
+            logger.error(f"Ids {sorted(missing_org_ids, key=str)} do not exist for {file_name}")
+
+        return self.org_info_by_domain
+
     def prepare_transition_domains(self, transition_domains):
         """Parses org data for each transition domain,
         then appends it to the tds_to_update list"""
+        if self.org_info_by_domain is None:
+            self.build_org_info_index()
+
         for item in transition_domains:
             updated = self.parse_org_data(item.domain_name, item)
             self.tds_to_update.append(updated)
@@ -901,6 +930,11 @@ class OrganizationDataLoader:
     def get_org_info(self, domain_name) -> OrganizationAdhoc | None:
         """Maps an id given in get_domain_data to a organization_adhoc
         record which has its corresponding definition"""
+        if self.org_info_by_domain is not None:
+            if domain_name not in self.org_info_by_domain:
+                logger.error(f"Id {domain_name} does not exist for {EnumFilenames.DOMAIN_ADDITIONAL.value[0]}")
+            return self.org_info_by_domain.get(domain_name)
+
         # Get a row in the domain_additional file. The id is the domain_name.
         domain_additional_row = self.retrieve_row_by_id(EnumFilenames.DOMAIN_ADDITIONAL, domain_name)
         if domain_additional_row is None:
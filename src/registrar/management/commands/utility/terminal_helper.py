@@ -1,7 +1,9 @@
 import logging
 import sys
+import time
 from abc import ABC, abstractmethod
 from django.core.paginator import Paginator
+from django.db import transaction
 from django.db.models import Model
 from django.db.models.manager import BaseManager
 from typing import List
@@ -61,6 +63,55 @@ class ScriptDataHelper:
             page = paginator.page(page_num)
             model_class.objects.bulk_update(page.object_list, fields_to_update)
 
+    @staticmethod
+    def filter_in_batches(queryset, field_name, values, batch_size=1000):
+        """
+        Yields the records in queryset where field_name is one of values.
+
+        Values are queried batch_size at a time, so that a very long list of values
+        does not end up in a single IN clause.
+
+        Usage:
+            filter_in_batches(Domain.objects.all(), "name", domain_names)
+        """
+        paginator = Paginator(list(values), batch_size)
+        for page_num in paginator.page_range:
+            page = paginator.page(page_num)
+            yield from queryset.filter(**{f"{field_name}__in": page.object_list})
+
+
+class ScriptProgress:
+    """Keeps running counts for a script that processes records in batches,
+    and logs progress and throughput after each batch."""
+
+    def __init__(self, readable_class_name, total_count):
+        self.readable_class_name = readable_class_name
+        self.total_count = total_count
+        self.updated = 0
+        self.failed = 0
+        self.skipped = 0
+        self.last_pk = None
+        self.start_time = time.perf_counter()
+
+    @property
+    def processed(self):
+        return self.updated + self.failed + self.skipped
+
+    def add_batch(self, updated, failed, skipped, last_pk):
+        """Adds the counts of a finished batch and logs the current progress"""
+        self.updated += updated
+        self.failed += failed
+        self.skipped += skipped
+        self.last_pk = last_pk
+
+        elapsed = time.perf_counter() - self.start_time
+        records_per_second = self.processed / elapsed if elapsed > 0 else self.processed
+        logger.info(
+            f"{TerminalColors.OKBLUE}Processed {self.processed} of {self.total_count} {self.readable_class_name} "
+            f"records ({records_per_second:.0f} records/sec). "
+            f"To resume from here, use --resumeFromPk {self.last_pk}{TerminalColors.ENDC}"
+        )
+
 
 class PopulateScriptTemplate(ABC):
     """
@@ -86,10 +137,40 @@ class PopulateScriptTemplate(ABC):
         """
         raise NotImplementedError
 
-    def mass_update_records(self, object_class, filter_conditions, fields_to_update, debug=True, verbose=False):
+    def add_mass_update_arguments(self, parser):
+        """Adds the optional --batchSize and --resumeFromPk command line arguments,
+        which are passed on to mass_update_records."""
+        parser.add_argument(
+            "--batchSize",
+            type=int,
+            default=1000,
+            help="Number of records fetched and updated per transaction",
+        )
+        parser.add_argument(
+            "--resumeFromPk",
+            type=int,
+            default=None,
+            help="Only process records with a pk greater than this one, to resume an interrupted run",
+        )
+
+    def mass_update_records(
+        self,
+        object_class,
+        filter_conditions,
+        fields_to_update,
+        debug=True,
+        verbose=False,
+        batch_size=1000,
+        resume_from_pk=None,
+    ):
         """Loops through each valid "object_class" object - specified by filter_conditions - and
         updates fields defined by fields_to_update using update_record.
 
+        Records are streamed from the database in pk order, batch_size at a time, and each batch
+        is saved with a single bulk_update in its own transaction. Only counts are kept across
+        batches, so memory use does not grow with the size of the table. After each batch the
+        last processed pk is logged, which can be passed back in as resume_from_pk.
+
         Parameters:
             object_class: The Django model class that you want to perform the bulk update on.
                 This should be the actual class, not a string of the class name.
@@ -106,6 +187,12 @@ class PopulateScriptTemplate(ABC):
             verbose: Whether to print a detailed run summary *before* run confirmation.
                 Default: False.
 
+            batch_size: Number of records fetched and updated at a time.
+                Default: 1000.
+
+            resume_from_pk: If set, only records with a greater pk are processed.
+                Default: None.
+
         Raises:
             NotImplementedError: If you do not define update_record before using this function.
             TypeError: If custom_filter is not Callable.
@@ -116,14 +203,24 @@ class PopulateScriptTemplate(ABC):
         # apply custom filter
         records = self.custom_filter(records)
 
+        if resume_from_pk is not None:
+            records = records.filter(pk__gt=resume_from_pk)
+        records = records.order_by("pk")
+
         readable_class_name = self.get_class_name(object_class)
+        total_count = records.count()
 
         # for use in the execution prompt.
         proposed_changes = f"""==Proposed Changes==
-            Number of {readable_class_name} objects to change: {len(records)}
+            Number of {readable_class_name} objects to change: {total_count}
             These fields will be updated on each record: {fields_to_update}
             """
 
+        if resume_from_pk is not None:
+            proposed_changes = f"""{proposed_changes}
+            Resuming after the record with pk {resume_from_pk}
+            """
+
         if verbose:
             proposed_changes = f"""{proposed_changes}
             These records will be updated: {list(records.all())}
@@ -137,10 +234,11 @@ class PopulateScriptTemplate(ABC):
         )
         logger.info("Updating...")
 
+        progress = ScriptProgress(readable_class_name, total_count)
         to_update: List[object_class] = []
         to_skip: List[object_class] = []
         failed_to_update: List[object_class] = []
-        for record in records:
+        for record in records.iterator(chunk_size=batch_size):
             try:
                 if not self.should_skip_record(record):
                     self.update_record(record)
@@ -153,19 +251,32 @@ class PopulateScriptTemplate(ABC):
                 logger.error(err)
                 logger.error(fail_message)
 
-        # Do a bulk update on the desired field
-        ScriptDataHelper.bulk_update_fields(object_class, to_update, fields_to_update)
+            if len(to_update) + len(to_skip) + len(failed_to_update) >= batch_size:
+                self._flush_batch(object_class, fields_to_update, to_update, failed_to_update, to_skip, debug)
+                progress.add_batch(len(to_update), len(failed_to_update), len(to_skip), last_pk=record.pk)
+                to_update, to_skip, failed_to_update = [], [], []
+
+        if to_update or to_skip or failed_to_update:
+            self._flush_batch(object_class, fields_to_update, to_update, failed_to_update, to_skip, debug)
+            progress.add_batch(len(to_update), len(failed_to_update), len(to_skip), last_pk=record.pk)
 
         # Log what happened
-        TerminalHelper.log_script_run_summary(
-            to_update,
-            failed_to_update,
-            to_skip,
-            debug=debug,
+        TerminalHelper.log_script_run_counts(
+            progress.updated,
+            progress.failed,
+            progress.skipped,
             log_header=self.run_summary_header,
-            display_as_str=True,
         )
 
+    def _flush_batch(self, object_class, fields_to_update, to_update, failed_to_update, to_skip, debug):
+        """Saves one batch of updated records in a single transaction and logs its items in debug mode"""
+        if to_update:
+            with transaction.atomic():
+                object_class.objects.bulk_update(to_update, fields_to_update)
+
+        if debug:
+            TerminalHelper.log_script_run_items(to_update, failed_to_update, to_skip, display_as_str=True)
+
     def get_class_name(self, sender) -> str:
         """Returns the class name that we want to display for the terminal prompt.
         Example: DomainRequest => "Domain Request"
@@ -196,33 +307,38 @@ class TerminalHelper:
     ):
         """Prints success, failed, and skipped counts, as well as
         all affected objects."""
-        update_success_count = len(to_update)
-        update_failed_count = len(failed_to_update)
-        update_skipped_count = len(skipped)
+        if debug:
+            TerminalHelper.log_script_run_items(to_update, failed_to_update, skipped, display_as_str)
+
+        TerminalHelper.log_script_run_counts(len(to_update), len(failed_to_update), len(skipped), log_header)
 
+    @staticmethod
+    def log_script_run_items(to_update, failed_to_update, skipped, display_as_str=False):
+        """Prints all updated, skipped, and failed objects, if there are any."""
+        updated_display = [str(u) for u in to_update] if display_as_str else to_update
+        skipped_display = [str(s) for s in skipped] if display_as_str else skipped
+        failed_display = [str(f) for f in failed_to_update] if display_as_str else failed_to_update
+        debug_messages = {
+            "success": (f"{TerminalColors.OKCYAN}Updated: {updated_display}{TerminalColors.ENDC}\n"),
+            "skipped": (f"{TerminalColors.YELLOW}Skipped: {skipped_display}{TerminalColors.ENDC}\n"),
+            "failed": (f"{TerminalColors.FAIL}Failed: {failed_display}{TerminalColors.ENDC}\n"),
+        }
+
+        # Print out a list of everything that was changed, if we have any changes to log.
+        # Otherwise, don't print anything.
+        TerminalHelper.print_conditional(
+            True,
+            f"{debug_messages.get('success') if len(to_update) > 0 else ''}"
+            f"{debug_messages.get('skipped') if len(skipped) > 0 else ''}"
+            f"{debug_messages.get('failed') if len(failed_to_update) > 0 else ''}",
+        )
+
+    @staticmethod
+    def log_script_run_counts(update_success_count, update_failed_count, update_skipped_count, log_header=None):
+        """Prints success, failed, and skipped counts."""
         if log_header is None:
             log_header = "============= FINISHED ==============="
 
-        # Prepare debug messages
-        if debug:
-            updated_display = [str(u) for u in to_update] if display_as_str else to_update
-            skipped_display = [str(s) for s in skipped] if display_as_str else skipped
-            failed_display = [str(f) for f in failed_to_update] if display_as_str else failed_to_update
-            debug_messages = {
-                "success": (f"{TerminalColors.OKCYAN}Updated: {updated_display}{TerminalColors.ENDC}\n"),
-                "skipped": (f"{TerminalColors.YELLOW}Skipped: {skipped_display}{TerminalColors.ENDC}\n"),
-                "failed": (f"{TerminalColors.FAIL}Failed: {failed_display}{TerminalColors.ENDC}\n"),
-            }
-
-            # Print out a list of everything that was changed, if we have any changes to log.
-            # Otherwise, don't print anything.
-            TerminalHelper.print_conditional(
-                debug,
-                f"{debug_messages.get('success') if update_success_count > 0 else ''}"
-                f"{debug_messages.get('skipped') if update_skipped_count > 0 else ''}"
-                f"{debug_messages.get('failed') if update_failed_count > 0 else ''}",
-            )
-
         if update_failed_count == 0 and update_skipped_count == 0:
             logger.info(
                 f"""{TerminalColors.OKGREEN}
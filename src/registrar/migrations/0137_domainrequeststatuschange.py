@@ -0,0 +1,94 @@
+# Generated by Django 4.2.10 on 2024-11-12 15:04
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+import django.utils.timezone
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0136_domainrequest_requested_suborganization_and_more"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DomainRequestStatusChange",
+            fields=[
+                ("id", models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "status",
+                    models.CharField(
+                        blank=True,
+                        choices=[
+                            ("in review", "In review"),
+                            ("action needed", "Action needed"),
+                            ("approved", "Approved"),
+                            ("rejected", "Rejected"),
+                            ("ineligible", "Ineligible"),
+                            ("submitted", "Submitted"),
+                            ("withdrawn", "Withdrawn"),
+                            ("started", "Started"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                (
+                    "rejection_reason",
+                    models.TextField(
+                        blank=True,
+                        choices=[
+                            ("domain_purpose", "Purpose requirements not met"),
+                            ("requestor_not_eligible", "Requestor not eligible to make request"),
+                            ("org_has_domain", "Org already has a .gov domain"),
+                            ("contacts_not_verified", "Org contacts couldn't be verified"),
+                            ("org_not_eligible", "Org not eligible for a .gov domain"),
+                            ("naming_requirements", "Naming requirements not met"),
+                            ("other", "Other/Unspecified"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                (
+                    "action_needed_reason",
+                    models.TextField(
+                        blank=True,
+                        choices=[
+                            ("eligibility_unclear", "Unclear organization eligibility"),
+                            ("questionable_senior_official", "Questionable senior official"),
+                            ("already_has_domains", "Already has domains"),
+                            ("bad_name", "Doesn’t meet naming requirements"),
+                            ("other", "Other (no auto-email sent)"),
+                        ],
+                        null=True,
+                    ),
+                ),
+                ("changed_at", models.DateTimeField(default=django.utils.timezone.now)),
+                (
+                    "actor",
+                    models.ForeignKey(
+                        blank=True,
+                        help_text="Person who made the change",
+                        null=True,
+                        on_delete=django.db.models.deletion.SET_NULL,
+                        related_name="+",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+                (
+                    "domain_request",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="status_changes",
+                        to="registrar.domainrequest",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [
+                    models.Index(fields=["domain_request", "-changed_at"], name="registrar_d_domain__90a1bc_idx")
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,31 @@
+# Generated by Django 4.2.10 on 2024-11-14 16:21
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("registrar", "0137_domainrequeststatuschange"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="domain",
+            name="last_synced_at",
+            field=models.DateTimeField(
+                blank=True, editable=False, help_text="When this domain was last synced from the registry", null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="domain",
+            name="registry_data_hash",
+            field=models.CharField(
+                blank=True,
+                editable=False,
+                help_text="Hash of the registry's data for this domain as of the last sync",
+                max_length=64,
+                null=True,
+            ),
+        ),
+    ]
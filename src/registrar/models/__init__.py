@@ -1,6 +1,7 @@
 from auditlog.registry import auditlog
 from .contact import Contact
 from .domain_request import DomainRequest
+from .domain_request_status_change import DomainRequestStatusChange
 from .domain_information import DomainInformation
 from .domain import Domain
 from .draft_domain import DraftDomain
@@ -28,6 +29,7 @@ from .allowed_email import AllowedEmail
 __all__ = [
     "Contact",
     "DomainRequest",
+    "DomainRequestStatusChange",
     "DomainInformation",
     "Domain",
     "DraftDomain",
@@ -54,7 +56,8 @@ __all__ = [
 
 auditlog.register(Contact)
 auditlog.register(DomainRequest)
-auditlog.register(Domain)
+# The sync bookkeeping fields change on every registry sync, so they are left out of the history
+auditlog.register(Domain, exclude_fields=["last_synced_at", "registry_data_hash"])
 auditlog.register(DraftDomain)
 auditlog.register(DomainInvitation)
 auditlog.register(DomainInformation)
@@ -1,4 +1,6 @@
 from itertools import zip_longest
+import hashlib
+import json
 import logging
 import ipaddress
 import re
@@ -7,7 +9,7 @@ from typing import Optional
 
 from django_fsm import FSMField, transition, TransitionNotAllowed  # type: ignore
 
-from django.db import models
+from django.db import models, transaction
 from django.utils import timezone
 from typing import Any
 from registrar.models.host import Host
@@ -31,6 +33,7 @@ from epplibwrapper import (
     ErrorCode,
 )
 
+from registrar.models.utility.audit_helper import AuditHelper, batched_audit_log
 from registrar.models.utility.contact_error import ContactError, ContactErrorCodes
 
 from django.db.models import DateField, TextField
@@ -248,6 +251,22 @@ class Domain(TimeStampedModel, DomainHelper):
         req = commands.CheckDomain([domain_name])
         return registry.send(req, cleaned=True).res_data[0].avail
 
+    @classmethod
+    def available_many(cls, domains: list[str]) -> dict[str, bool]:
+        """Check if each of the given domains is available, in a single registry request.
+        Returns a dictionary of lowercased domain name to availability.
+
+        throws- RegistryError or InvalidDomainError"""
+        for domain in domains:
+            if not cls.string_could_be_domain(domain):
+                logger.warning("Not a valid domain: %s" % str(domain))
+                raise errors.InvalidDomainError()
+
+        domain_names = [domain.lower() for domain in domains]
+        req = commands.CheckDomain(domain_names)
+        res_data = registry.send(req, cleaned=True).res_data
+        return {item.name.lower(): item.avail for item in res_data}
+
     @classmethod
     def registered(cls, domain: str) -> bool:
         """Check if a domain is _not_ available."""
@@ -1088,6 +1107,21 @@ class Domain(TimeStampedModel, DomainHelper):
         help_text="Record of the last change event for ds data",
     )
 
+    last_synced_at = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="When this domain was last synced from the registry",
+    )
+
+    registry_data_hash = models.CharField(
+        max_length=64,
+        null=True,
+        blank=True,
+        editable=False,
+        help_text="Hash of the registry's data for this domain as of the last sync",
+    )
+
     def isActive(self):
         return self.state == Domain.State.CREATED
 
@@ -1363,6 +1397,16 @@ class Domain(TimeStampedModel, DomainHelper):
                     logger.error(e.code)
                     raise e
 
+    def _get_domain_info(self):
+        """Fetches info about this domain from the registry, without creating it.
+        Returns None if the registry does not have the domain."""
+        try:
+            return registry.send(commands.InfoDomain(name=self.name), cleaned=True)
+        except RegistryError as e:
+            if e.code == ErrorCode.OBJECT_DOES_NOT_EXIST:
+                return None
+            raise e
+
     def addRegistrant(self):
         """Adds a default registrant contact"""
         registrant = PublicContact.get_default_registrant()
@@ -1603,16 +1647,21 @@ class Domain(TimeStampedModel, DomainHelper):
             choices.SECURITY: None,
             choices.TECHNICAL: None,
         }
+        mapped_objects = []
         for domainContact in contact_data:
             req = commands.InfoContact(id=domainContact.contact)
             data = registry.send(req, cleaned=True).res_data[0]
 
             # Map the object we recieved from EPP to a PublicContact
-            mapped_object = self.map_epp_contact_to_public_contact(data, domainContact.contact, domainContact.type)
+            mapped_objects.append(
+                self.map_epp_contact_to_public_contact(data, domainContact.contact, domainContact.type)
+            )
 
-            # Find/create it in the DB
-            in_db = self._get_or_create_public_contact(mapped_object)
-            contacts_dict[in_db.contact_type] = in_db.registry_id
+        # Find/create them in the DB together
+        in_db = self._get_or_create_public_contacts(mapped_objects)
+        for mapped_object in mapped_objects:
+            contact = in_db[(mapped_object.registry_id, mapped_object.contact_type)]
+            contacts_dict[contact.contact_type] = contact.registry_id
         return contacts_dict
 
     def _get_or_create_contact(self, contact: PublicContact):
@@ -1824,21 +1873,83 @@ class Domain(TimeStampedModel, DomainHelper):
             data_response = self._get_or_create_domain()
             cache = self._extract_data_from_response(data_response)
             cleaned = self._clean_cache(cache, data_response)
-            self._update_hosts_and_contacts(cleaned, fetch_hosts, fetch_contacts)
-
-            if self.state == self.State.UNKNOWN:
-                self._fix_unknown_state(cleaned)
-            if fetch_hosts:
-                self._update_hosts_and_ips_in_db(cleaned)
-            if fetch_contacts:
-                self._update_security_contact_in_db(cleaned)
-            self._update_dates(cleaned)
+            # The contacts, hosts and dates refreshed here are audit logged together, on commit
+            with batched_audit_log():
+                self._update_hosts_and_contacts(cleaned, fetch_hosts, fetch_contacts)
+
+                if self.state == self.State.UNKNOWN:
+                    self._fix_unknown_state(cleaned)
+                if fetch_hosts:
+                    self._update_hosts_and_ips_in_db(cleaned)
+                if fetch_contacts:
+                    self._update_security_contact_in_db(cleaned)
+                self._update_dates(cleaned)
 
             self._cache = cleaned
 
         except RegistryError as e:
             logger.error(e)
 
+    def sync_from_registry(self, force=False):
+        """
+        Brings the hosts, contacts, security contact and dates stored for this domain in line
+        with the registry. Used by the sync_domains_from_registry command.
+
+        The registry's data for the domain is hashed, and when the hash matches the one from
+        the last sync, nothing is fetched past the domain info. Pass force to fetch the hosts
+        and contacts regardless.
+
+        The domain itself is not saved, so that many domains can be saved with one bulk_update.
+        Returns a dict of the name of each field changed on it to its (old, new) values,
+        apart from last_synced_at, which is always set. A domain the registry does not have
+        is skipped, rather than created as _get_or_create_domain would.
+
+        Contact details and host IPs are not part of the domain info, so a change to only
+        those is not seen until the domain is next synced with force.
+        """
+        data_response = self._get_domain_info()
+        self.last_synced_at = timezone.now()
+        if data_response is None:
+            logger.warning(f"sync_from_registry() -> {self.name} does not exist in the registry, skipping")
+            return {}
+
+        cleaned = self._clean_cache(self._extract_data_from_response(data_response), data_response)
+        registry_data_hash = self._hash_registry_data(cleaned)
+        if registry_data_hash == self.registry_data_hash and not force:
+            return {}
+
+        with batched_audit_log():
+            cleaned["contacts"] = self._get_contacts(cleaned.get("_contacts", []))
+            cleaned["hosts"] = self._get_hosts(cleaned.get("_hosts", []))
+            self._update_hosts_and_ips_in_db(cleaned)
+            self._cache = cleaned
+
+        new_values = {
+            "registry_data_hash": registry_data_hash,
+            "security_contact_registry_id": cleaned["contacts"][PublicContact.ContactTypeChoices.SECURITY] or "",
+            "expiration_date": cleaned.get("ex_date", self.expiration_date),
+            "created_at": cleaned.get("cr_date", self.created_at),
+        }
+        changes = {}
+        for field_name, new_value in new_values.items():
+            old_value = getattr(self, field_name)
+            if old_value != new_value:
+                changes[field_name] = (old_value, new_value)
+                setattr(self, field_name, new_value)
+        return changes
+
+    def _hash_registry_data(self, cleaned):
+        """Returns a hash of the domain info from the registry in cleaned. It changes whenever
+        the domain's dates, statuses, host names, contacts or DS data do."""
+        data = {
+            key: cleaned.get(key)
+            for key in ["cr_date", "ex_date", "up_date", "tr_date", "statuses", "_hosts", "_contacts", "registrant"]
+        }
+        data["dnssecdata"] = cleaned.get("dnssecdata")
+        # epplib returns dataclasses, whose repr includes all of their fields
+        serialized = json.dumps(data, sort_keys=True, default=repr)
+        return hashlib.sha256(serialized.encode()).hexdigest()
+
     def _extract_data_from_response(self, data_response):
         """extract data from response from registry"""
         data = data_response.res_data[0]
@@ -1906,44 +2017,69 @@ class Domain(TimeStampedModel, DomainHelper):
             cleaned: dict containing hosts.  Hosts are provided as a list of dicts, e.g.
                 [{"name": "ns1.example.com",}, {"name": "ns1.example.gov"}, "addrs": ["0.0.0.0"])]
         """
-        cleaned_hosts = cleaned["hosts"]
-        # Get all existing hosts from the database for this domain
-        existing_hosts_in_db = Host.objects.filter(domain=self)
-        # Identify hosts to delete
-        cleaned_host_names = set(cleaned_host["name"] for cleaned_host in cleaned_hosts)
-        hosts_to_delete_from_db = [
-            existing_host for existing_host in existing_hosts_in_db if existing_host.name not in cleaned_host_names
-        ]
-        # Delete hosts and their associated HostIP instances
-        for host_to_delete in hosts_to_delete_from_db:
-            # Delete associated HostIP instances
-            HostIP.objects.filter(host=host_to_delete).delete()
-            # Delete the host itself
-            host_to_delete.delete()
-        # Update or create Hosts and HostIPs
-        for cleaned_host in cleaned_hosts:
-            # Check if the cleaned_host already exists
-            host_in_db, host_created = Host.objects.get_or_create(domain=self, name=cleaned_host["name"])
-            # Check if the nameserver is a subdomain of the current domain
-            # If it is NOT a subdomain, we remove the IP address
+        # Work out the IPs each host should have. Nameservers which are not
+        # subdomains of this domain do not keep their IP addresses.
+        cleaned_ips_by_host_name: dict[str, set] = {}
+        for cleaned_host in cleaned["hosts"]:
             if not Domain.isSubdomain(self.name, cleaned_host["name"]):
                 cleaned_host["addrs"] = []
-            # Get cleaned list of ips for update
-            cleaned_ips = cleaned_host["addrs"]
-            if not host_created:
-                # Get all existing ips from the database for this host
-                existing_ips_in_db = HostIP.objects.filter(host=host_in_db)
-                # Identify IPs to delete
-                ips_to_delete_from_db = [
-                    existing_ip for existing_ip in existing_ips_in_db if existing_ip.address not in cleaned_ips
-                ]
-                # Delete IPs
-                for ip_to_delete in ips_to_delete_from_db:
-                    # Delete the ip
-                    ip_to_delete.delete()
-            # Update or create HostIP instances
-            for ip_address in cleaned_ips:
-                HostIP.objects.get_or_create(address=ip_address, host=host_in_db)
+            cleaned_ips_by_host_name.setdefault(cleaned_host["name"], set()).update(cleaned_host["addrs"] or [])
+
+        hosts_in_db, hosts_to_delete_from_db, ips_to_delete_from_db = self._compare_hosts_in_db(
+            cleaned_ips_by_host_name
+        )
+        hosts_to_create = [Host(domain=self, name=name) for name in cleaned_ips_by_host_name if name not in hosts_in_db]
+        has_ips_to_create = any(cleaned_ips_by_host_name.values())
+        if not (hosts_to_delete_from_db or ips_to_delete_from_db or hosts_to_create or has_ips_to_create):
+            # The database already matches the registry
+            return
+
+        # The deletes below are logged by django-auditlog per object, so they are batched with the creates
+        audit = AuditHelper()
+        with transaction.atomic(), batched_audit_log():
+            if ips_to_delete_from_db:
+                HostIP.objects.filter(id__in=ips_to_delete_from_db).delete()
+            if hosts_to_delete_from_db:
+                Host.objects.filter(id__in=hosts_to_delete_from_db).delete()
+
+            # bulk_create does not send the signals django-auditlog relies on, so these are logged by hand
+            for host in Host.objects.bulk_create(hosts_to_create):
+                hosts_in_db[host.name] = host
+                audit.log_create(host)
+
+            ips_to_create = [
+                HostIP(address=address, host=hosts_in_db[name])
+                for name, addresses in cleaned_ips_by_host_name.items()
+                for address in sorted(addresses)
+            ]
+            for host_ip in HostIP.objects.bulk_create(ips_to_create):
+                audit.log_create(host_ip)
+            audit.save()
+
+    def _compare_hosts_in_db(self, cleaned_ips_by_host_name):
+        """Helper for _update_hosts_and_ips_in_db.
+        Compares the registry's hosts and ips against the ones already stored for this domain,
+        which are loaded together. Returns the stored hosts to keep by name, and the ids of the
+        hosts and ips to delete. Ips which are already stored are removed from cleaned_ips_by_host_name,
+        so what remains in it are the ips which still need to be created."""
+        hosts_in_db = {}
+        hosts_to_delete_from_db = []
+        ips_to_delete_from_db = []
+        for host_in_db in Host.objects.filter(domain=self).prefetch_related("ip").order_by("id"):
+            if host_in_db.name not in cleaned_ips_by_host_name or host_in_db.name in hosts_in_db:
+                # Delete stale (or duplicated) hosts along with their ips
+                hosts_to_delete_from_db.append(host_in_db.id)
+                ips_to_delete_from_db.extend(host_ip.id for host_ip in host_in_db.ip.all())
+                continue
+
+            hosts_in_db[host_in_db.name] = host_in_db
+            cleaned_ips = cleaned_ips_by_host_name[host_in_db.name]
+            for host_ip in host_in_db.ip.all():
+                if host_ip.address in cleaned_ips:
+                    cleaned_ips.discard(host_ip.address)
+                else:
+                    ips_to_delete_from_db.append(host_ip.id)
+        return hosts_in_db, hosts_to_delete_from_db, ips_to_delete_from_db
 
     def _update_security_contact_in_db(self, cleaned):
         """Update security contact registry id in database if retrieved from registry.
@@ -2004,49 +2140,76 @@ class Domain(TimeStampedModel, DomainHelper):
     def _get_or_create_public_contact(self, public_contact: PublicContact):
         """Tries to find a PublicContact object in our DB.
         If it can't, it'll create it. Returns PublicContact"""
-        db_contact = PublicContact.objects.filter(
-            registry_id=public_contact.registry_id,
-            contact_type=public_contact.contact_type,
-            domain=self,
-        )
-
-        # If we find duplicates, log it and delete the oldest ones.
-        if db_contact.count() > 1:
-            logger.warning("_get_or_create_public_contact() -> Duplicate contacts found. Deleting duplicate.")
-
-            newest_duplicate = db_contact.order_by("-created_at").first()
-
-            duplicates_to_delete = db_contact.exclude(id=newest_duplicate.id)  # type: ignore
-
-            # Delete all duplicates
-            duplicates_to_delete.delete()
-
-            # Do a second filter to grab the latest content
-            db_contact = PublicContact.objects.filter(
-                registry_id=public_contact.registry_id,
-                contact_type=public_contact.contact_type,
-                domain=self,
-            )
-
-        # Save to DB if it doesn't exist already.
-        if db_contact.count() == 0:
-            # Doesn't run custom save logic, just saves to DB
-            public_contact.save(skip_epp_save=True)
-            logger.info(f"Created a new PublicContact: {public_contact}")
-            # Append the item we just created
-            return public_contact
-
-        existing_contact = db_contact.get()
-
-        # Does the item we're grabbing match what we have in our DB?
-        if existing_contact.email != public_contact.email or existing_contact.registry_id != public_contact.registry_id:
-            existing_contact.delete()
+        contacts = self._get_or_create_public_contacts([public_contact])
+        return contacts[(public_contact.registry_id, public_contact.contact_type)]
+
+    def _get_or_create_public_contacts(self, public_contacts: list[PublicContact]):
+        """Finds each of public_contacts in our DB, creating those that don't exist.
+
+        The existing contacts of this domain are loaded in one query, and the missing
+        ones are created in one query. Returns a dict of (registry_id, contact_type)
+        to the PublicContact stored for it."""
+        # Later contacts with the same registry id and type take precedence, as they would have been saved last
+        requested = {(contact.registry_id, contact.contact_type): contact for contact in public_contacts}
+
+        existing_contacts, contacts_to_delete = self._get_existing_public_contacts(requested)
+
+        result = {}
+        contacts_to_create = []
+        contacts_out_of_sync = []
+        for key, public_contact in requested.items():
+            existing_contact = existing_contacts.get(key)
+            if existing_contact is None:
+                contacts_to_create.append(public_contact)
+            elif existing_contact.email != public_contact.email:
+                # Does the item we're grabbing match what we have in our DB?
+                contacts_to_delete.append(existing_contact.id)
+                contacts_out_of_sync.append(public_contact)
+            else:
+                # If it already exists, we can assume that the DB instance was updated during set,
+                # so we should just use that.
+                result[key] = existing_contact
+
+        if contacts_to_delete:
+            PublicContact.objects.filter(id__in=contacts_to_delete).delete()
+
+        if contacts_to_create:
+            # Like save(skip_epp_save=True), this doesn't run the custom save logic.
+            # bulk_create does not send the signals django-auditlog relies on, so these are logged by hand
+            audit = AuditHelper()
+            for public_contact in PublicContact.objects.bulk_create(contacts_to_create):
+                logger.info(f"Created a new PublicContact: {public_contact}")
+                audit.log_create(public_contact)
+                result[(public_contact.registry_id, public_contact.contact_type)] = public_contact
+            audit.save()
+
+        for public_contact in contacts_out_of_sync:
             public_contact.save()
             logger.warning("Requested PublicContact is out of sync " "with DB.")
-            return public_contact
-
-        # If it already exists, we can assume that the DB instance was updated during set, so we should just use that.
-        return existing_contact
+            result[(public_contact.registry_id, public_contact.contact_type)] = public_contact
+
+        return result
+
+    def _get_existing_public_contacts(self, requested: dict):
+        """Helper for _get_or_create_public_contacts.
+        Loads the stored contacts of this domain for the (registry_id, contact_type) keys of requested,
+        in one query. Returns a dict of key to the newest stored contact, and the ids of older duplicates."""
+        existing_contacts = {}
+        duplicates = []
+        db_contacts = PublicContact.objects.filter(
+            domain=self, registry_id__in={registry_id for registry_id, _ in requested}
+        ).order_by("-created_at")
+        for db_contact in db_contacts:
+            key = (db_contact.registry_id, db_contact.contact_type)
+            if key not in requested:
+                continue
+            if key in existing_contacts:
+                # Only the newest duplicate is kept
+                logger.warning("_get_or_create_public_contacts() -> Duplicate contacts found. Deleting duplicate.")
+                duplicates.append(db_contact.id)
+            else:
+                existing_contacts[key] = db_contact
+        return existing_contacts, duplicates
 
     def _registrant_to_public_contact(self, registry_id: str):
         """EPPLib returns the registrant as a string,
@@ -1,4 +1,5 @@
 from __future__ import annotations
+from functools import cache
 from django.db import transaction
 
 from registrar.models.utility.domain_helper import DomainHelper
@@ -342,11 +343,24 @@ class DomainInformation(TimeStampedModel):
 
         return self
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Store the loaded organization type fields, so that sync_organization_type
+        # does not need to look them up on save
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(instance)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(self, fields)
+
     def save(self, *args, **kwargs):
         """Save override for custom properties"""
         self.sync_yes_no_form_fields()
         self.sync_organization_type()
         super().save(*args, **kwargs)
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(self, kwargs.get("update_fields"))
 
     @classmethod
     def create_from_da(cls, domain_request: DomainRequest, domain=None):
@@ -370,49 +384,120 @@ class DomainInformation(TimeStampedModel):
             )
             return existing_domain_info
 
-        # Get the fields that exist on both DomainRequest and DomainInformation
+        domain_info = cls._from_da(domain_request, domain)
+
+        # Save the instance and copy the many-to-many fields.
+        # Lumped under .atomic to ensure we don't make redundant DB calls.
+        # This bundles them all together, and then saves it in a single call.
+        with transaction.atomic():
+            domain_info.save()
+            cls._copy_many_to_many_from_da([domain_info])
+
+        return domain_info
+
+    @classmethod
+    def bulk_create_from_da(cls, domain_requests: list[DomainRequest], audit=None):
+        """Creates a DomainInformation for each of the given DomainRequests, linked to the
+        request's approved_domain. Requests which already have a DomainInformation are skipped.
+
+        All rows are inserted together, then the many-to-many relations are copied with one
+        insert per relation.
+
+        audit: AuditHelper -> if given, log entries for the new rows are added to it
+        rather than written here."""
+        existing_request_ids = set(
+            cls.objects.filter(domain_request__in=domain_requests).values_list("domain_request_id", flat=True)
+        )
+
+        created = []
+        for domain_request in domain_requests:
+            if domain_request.id in existing_request_ids:
+                logger.info(
+                    f"bulk_create_from_da() -> Skipping {domain_request}. "
+                    "A DomainInformation record already exists for it."
+                )
+                continue
+
+            domain_info = cls._from_da(domain_request, domain_request.approved_domain)
+            # bulk_create does not call save(), so sync the same properties it would
+            domain_info.sync_yes_no_form_fields()
+            domain_info.sync_organization_type()
+            created.append(domain_info)
+
+        with transaction.atomic():
+            cls.objects.bulk_create(created)
+            cls._copy_many_to_many_from_da(created)
+
+        if audit is not None:
+            for domain_info in created:
+                audit.log_create(domain_info)
+
+        return created
+
+    @classmethod
+    @cache
+    def _get_da_field_map(cls):
+        """Returns the attribute names of the concrete fields that DomainInformation
+        copies from DomainRequest, and the names of the many-to-many fields it copies.
+
+        This only depends on the models, so it is worked out once per process."""
         common_fields = DomainHelper.get_common_fields(DomainRequest, DomainInformation)
 
-        # Get a list of all many_to_many relations on DomainInformation (needs to be saved differently)
-        info_many_to_many_fields = DomainInformation._get_many_to_many_fields()
-
-        # Create a dictionary with only the common fields, and create a DomainInformation from it
-        da_dict = {}
-        da_many_to_many_dict = {}
-        for field in common_fields:
-            # If the field isn't many_to_many, populate the da_dict.
-            # If it is, populate da_many_to_many_dict as we need to save this later.
-            if hasattr(domain_request, field):
-                if field not in info_many_to_many_fields:
-                    da_dict[field] = getattr(domain_request, field)
-                else:
-                    da_many_to_many_dict[field] = getattr(domain_request, field).all()
-
-        # This will not happen in normal code flow, but having some redundancy doesn't hurt.
-        # da_dict should not have "id" under any circumstances.
-        # If it does have it, then this indicates that common_fields is overzealous in the data
-        # that it is returning. Try looking in DomainHelper.get_common_fields.
-        if "id" in da_dict:
-            logger.warning("create_from_da() -> Found attribute 'id' when trying to create")
-            da_dict.pop("id", None)
-
-        # Create a placeholder DomainInformation object
-        domain_info = DomainInformation(**da_dict)
+        attnames = []
+        for field in cls._meta.concrete_fields:
+            if field.primary_key or field.name not in common_fields:
+                continue
+            # Foreign keys are copied by id, so that copying does not fetch the related rows
+            if DomainRequest._meta.get_field(field.name).concrete:
+                attnames.append(field.attname)
+
+        many_to_many_fields = sorted(cls._get_many_to_many_fields() & common_fields)
+        return tuple(attnames), tuple(many_to_many_fields)
+
+    @classmethod
+    def _from_da(cls, domain_request: DomainRequest, domain=None):
+        """Returns an unsaved DomainInformation with the fields of domain_request"""
+        attnames, _ = cls._get_da_field_map()
+        domain_info = cls(**{attname: getattr(domain_request, attname) for attname in attnames})
 
         # Add the domain_request and domain fields
         domain_info.domain_request = domain_request
         if domain:
             domain_info.domain = domain
+        return domain_info
 
-        # Save the instance and set the many-to-many fields.
-        # Lumped under .atomic to ensure we don't make redundant DB calls.
-        # This bundles them all together, and then saves it in a single call.
-        with transaction.atomic():
-            domain_info.save()
-            for field, value in da_many_to_many_dict.items():
-                getattr(domain_info, field).set(value)
+    @classmethod
+    def _copy_many_to_many_from_da(cls, domain_infos):
+        """Copies the many-to-many relations of each saved DomainInformation's domain request,
+        reading and inserting the through table rows once per relation"""
+        if not domain_infos:
+            return
+
+        info_ids = {domain_info.domain_request_id: domain_info.id for domain_info in domain_infos}
+        _, many_to_many_fields = cls._get_da_field_map()
+        for field in many_to_many_fields:
+            request_through, request_column, related_column = cls._get_through_columns(DomainRequest, field)
+            rows = request_through.objects.filter(**{f"{request_column}__in": list(info_ids)}).values_list(
+                request_column, related_column
+            )
 
-        return domain_info
+            info_through, info_column, info_related_column = cls._get_through_columns(DomainInformation, field)
+            info_through.objects.bulk_create(
+                [
+                    info_through(**{info_column: info_ids[request_id], info_related_column: related_id})
+                    for request_id, related_id in rows
+                ]
+            )
+
+    @staticmethod
+    def _get_through_columns(model, field):
+        """Returns the through model of a many-to-many field, and the attribute names
+        of its foreign keys to the model and to the related model"""
+        m2m_field = model._meta.get_field(field)
+        through = m2m_field.remote_field.through
+        source = through._meta.get_field(m2m_field.m2m_field_name()).attname
+        target = through._meta.get_field(m2m_field.m2m_reverse_field_name()).attname
+        return through, source, target
 
     @staticmethod
     def _get_many_to_many_fields():
@@ -8,6 +8,7 @@ from django_fsm import FSMField, transition  # type: ignore
 from django.utils import timezone
 from registrar.models.domain import Domain
 from registrar.models.federal_agency import FederalAgency
+from registrar.models.utility.audit_helper import get_current_actor
 from registrar.models.utility.generic_helper import CreateOrUpdateOrganizationTypeHelper
 from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
 from registrar.utility.constants import BranchChoices
@@ -671,6 +672,18 @@ class DomainRequest(TimeStampedModel):
         # Store original values for caching purposes. Used to compare them on save.
         self._cache_status_and_status_reasons()
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Store the loaded organization type fields, so that sync_organization_type
+        # does not need to look them up on save
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(instance)
+        return instance
+
+    def refresh_from_db(self, using=None, fields=None):
+        super().refresh_from_db(using=using, fields=fields)
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(self, fields)
+
     def save(self, *args, **kwargs):
         """Save override for custom properties"""
         self.sync_organization_type()
@@ -679,8 +692,14 @@ class DomainRequest(TimeStampedModel):
         if self._cached_status != self.status:
             self.last_status_update = timezone.now().date()
 
+        adding = self._state.adding
+        # Taken before saving, so that the status change is dated before its audit log entry
+        saved_at = timezone.now()
         super().save(*args, **kwargs)
 
+        if adding or self._status_or_reason_changed(kwargs.get("update_fields")):
+            self._record_status_change(changed_at=saved_at)
+
         # Handle custom status emails.
         # An email is sent out when a, for example, action_needed_reason is changed or added.
         statuses_that_send_custom_emails = [self.DomainRequestStatus.ACTION_NEEDED, self.DomainRequestStatus.REJECTED]
@@ -689,6 +708,24 @@ class DomainRequest(TimeStampedModel):
 
         # Update the cached values after saving
         self._cache_status_and_status_reasons()
+        CreateOrUpdateOrganizationTypeHelper.cache_org_type_fields(self, kwargs.get("update_fields"))
+
+    def _status_or_reason_changed(self, update_fields=None):
+        """Checks if the status or a status reason changed since they were cached,
+        only counting the fields that were saved when update_fields is given"""
+        changed = {
+            "status": self._cached_status != self.status,
+            "rejection_reason": self._cached_rejection_reason != self.rejection_reason,
+            "action_needed_reason": self._cached_action_needed_reason != self.action_needed_reason,
+        }
+        if update_fields is not None:
+            changed = {field: value for field, value in changed.items() if field in update_fields}
+        return any(changed.values())
+
+    def _record_status_change(self, changed_at=None):
+        """Adds the current status and reasons to the status history"""
+        DomainRequestStatusChange = apps.get_model("registrar.DomainRequestStatusChange")
+        DomainRequestStatusChange.from_domain_request(self, actor=get_current_actor(), changed_at=changed_at).save()
 
     def send_custom_status_update_email(self, status):
         """Helper function to send out a second status email when the status remains the same,
@@ -1327,16 +1364,12 @@ class DomainRequest(TimeStampedModel):
         return self.purpose is not None
 
     def _has_other_contacts_and_filled(self):
-        # Other Contacts Radio button is Yes and if all required fields are filled
-        return (
-            self.has_other_contacts()
-            and self.other_contacts.filter(
-                first_name__isnull=False,
-                last_name__isnull=False,
-                title__isnull=False,
-                email__isnull=False,
-                phone__isnull=False,
-            ).exists()
+        # Other Contacts Radio button is Yes and if all required fields are filled.
+        # Checked in python so that prefetched other_contacts are reused
+        required_fields = ["first_name", "last_name", "title", "email", "phone"]
+        return any(
+            all(getattr(contact, field) is not None for field in required_fields)
+            for contact in self.other_contacts.all()
         )
 
     def _has_no_other_contacts_gives_rationale(self):
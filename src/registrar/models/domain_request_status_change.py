@@ -0,0 +1,84 @@
+from django.db import models
+from django.utils import timezone
+
+from .domain_request import DomainRequest
+
+
+class DomainRequestStatusChange(models.Model):
+    """
+    A change to the status, rejection reason or action needed reason of a domain request.
+
+    These are written when a domain request is saved with a new status or reason, and make up
+    the status history shown on the domain request admin page. Older history can be copied over
+    from the audit log with the populate_domain_request_status_history command.
+    """
+
+    domain_request = models.ForeignKey(
+        "registrar.DomainRequest",
+        on_delete=models.CASCADE,
+        related_name="status_changes",
+    )
+
+    status = models.CharField(
+        choices=DomainRequest.DomainRequestStatus.choices,
+        null=True,
+        blank=True,
+    )
+
+    rejection_reason = models.TextField(
+        choices=DomainRequest.RejectionReasons.choices,
+        null=True,
+        blank=True,
+    )
+
+    action_needed_reason = models.TextField(
+        choices=DomainRequest.ActionNeededReasons.choices,
+        null=True,
+        blank=True,
+    )
+
+    actor = models.ForeignKey(
+        "registrar.User",
+        null=True,
+        blank=True,
+        on_delete=models.SET_NULL,
+        related_name="+",
+        help_text="Person who made the change",
+    )
+
+    changed_at = models.DateTimeField(default=timezone.now)
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["domain_request", "-changed_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.domain_request_id}: {self.status} at {self.changed_at}"
+
+    @classmethod
+    def from_domain_request(cls, domain_request, actor=None, changed_at=None):
+        """Returns an unsaved status change with the current status and reasons of domain_request"""
+        return cls(
+            domain_request=domain_request,
+            status=domain_request.status,
+            rejection_reason=domain_request.rejection_reason,
+            action_needed_reason=domain_request.action_needed_reason,
+            actor=actor,
+            changed_at=changed_at or timezone.now(),
+        )
+
+    def as_history_entry(self):
+        """Returns the labels shown for this change in the status history table"""
+        entry = {
+            "status": DomainRequest.DomainRequestStatus.get_status_label(self.status),
+            "actor": self.actor,
+            "timestamp": self.changed_at,
+        }
+        if self.status == DomainRequest.DomainRequestStatus.REJECTED and self.rejection_reason:
+            entry["rejection_reason"] = DomainRequest.RejectionReasons.get_rejection_reason_label(self.rejection_reason)
+        if self.status == DomainRequest.DomainRequestStatus.ACTION_NEEDED and self.action_needed_reason:
+            entry["action_needed_reason"] = DomainRequest.ActionNeededReasons.get_action_needed_reason_label(
+                self.action_needed_reason
+            )
+        return entry
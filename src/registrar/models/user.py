@@ -1,15 +1,18 @@
 import logging
 
 from django.contrib.auth.models import AbstractUser
-from django.db import models
+from django.db import models, transaction
 from django.db.models import Q
+from django.utils import timezone
 
 from registrar.models import DomainInformation, UserDomainRole
+from registrar.models.utility.audit_helper import AuditHelper
 from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices
 
 from .domain_invitation import DomainInvitation
 from .portfolio_invitation import PortfolioInvitation
 from .transition_domain import TransitionDomain
+from .user_portfolio_permission import UserPortfolioPermission
 from .verified_by_staff import VerifiedByStaff
 from .domain import Domain
 from .domain_request import DomainRequest
@@ -384,18 +387,56 @@ class User(AbstractUser):
 
     def check_domain_invitations_on_login(self):
         """When a user first arrives on the site, we need to retrieve any domain
-        invitations that match their email address."""
-        for invitation in DomainInvitation.objects.filter(
-            email__iexact=self.email, status=DomainInvitation.DomainInvitationStatus.INVITED
-        ):
-            try:
-                invitation.retrieve()
-                invitation.save()
-            except RuntimeError:
-                # retrieving should not fail because of a missing user, but
-                # if it does fail, log the error so a new user can continue
-                # logging in
-                logger.warn("Failed to retrieve invitation %s", invitation, exc_info=True)
+        invitations that match their email address.
+
+        All matching invitations are retrieved together: missing manager roles
+        are created in one insert and the invitations are marked retrieved in one update."""
+        audit = AuditHelper()
+        with transaction.atomic():
+            invitations = list(
+                DomainInvitation.objects.select_for_update(of=("self",))
+                .select_related("domain")
+                .filter(email__iexact=self.email, status=DomainInvitation.DomainInvitationStatus.INVITED)
+            )
+            if not invitations:
+                return
+
+            domain_ids = {invitation.domain_id for invitation in invitations}
+            existing_domain_ids = set(
+                UserDomainRole.objects.filter(user=self, domain_id__in=domain_ids).values_list("domain_id", flat=True)
+            )
+            for invitation in invitations:
+                if invitation.domain_id in existing_domain_ids:
+                    # something strange happened and this role already existed when
+                    # the invitation was retrieved. Log that this occurred.
+                    logger.warn("Invitation %s was retrieved for a role that already exists.", invitation)
+
+            new_domain_ids = domain_ids - existing_domain_ids
+            UserDomainRole.objects.bulk_create(
+                [
+                    UserDomainRole(user=self, domain_id=domain_id, role=UserDomainRole.Roles.MANAGER)
+                    for domain_id in new_domain_ids
+                ],
+                ignore_conflicts=True,
+            )
+            for role in UserDomainRole.objects.filter(user=self, domain_id__in=new_domain_ids).select_related(
+                "user", "domain"
+            ):
+                audit.log_create(role)
+
+            self._mark_invitations_retrieved(
+                DomainInvitation, invitations, DomainInvitation.DomainInvitationStatus.RETRIEVED, audit
+            )
+            audit.save()
+
+    def _mark_invitations_retrieved(self, invitation_class, invitations, retrieved_status, audit):
+        """Set the status of all given invitations to retrieved in one query.
+        Invitations are protected FSM fields, so the in-memory objects are not updated."""
+        invitation_class.objects.filter(pk__in=[invitation.pk for invitation in invitations]).update(
+            status=retrieved_status, updated_at=timezone.now()
+        )
+        for invitation in invitations:
+            audit.log_update(invitation, {"status": (invitation.status, retrieved_status)})
 
     def create_domain_and_invite(self, transition_domain: TransitionDomain):
         transition_domain_name = transition_domain.domain_name
@@ -418,24 +459,86 @@ class User(AbstractUser):
 
     def check_portfolio_invitations_on_login(self):
         """When a user first arrives on the site, we need to retrieve any portfolio
-        invitations that match their email address."""
-        for invitation in PortfolioInvitation.objects.filter(
-            email__iexact=self.email, status=PortfolioInvitation.PortfolioInvitationStatus.INVITED
-        ):
-            only_single_portfolio = (
-                not flag_is_active_for_user(self, "multiple_portfolios") and self.get_first_portfolio() is None
+        invitations that match their email address.
+
+        Feature flags and the user's current portfolio are checked once, then all
+        retrievable invitations are redeemed with bulk writes."""
+        audit = AuditHelper()
+        with transaction.atomic():
+            invitations = list(
+                PortfolioInvitation.objects.select_for_update(of=("self",))
+                .select_related("portfolio")
+                .filter(email__iexact=self.email, status=PortfolioInvitation.PortfolioInvitationStatus.INVITED)
             )
-            if only_single_portfolio or flag_is_active(None, "multiple_portfolios"):
-                try:
-                    invitation.retrieve()
-                    invitation.save()
-                except RuntimeError:
-                    # retrieving should not fail because of a missing user, but
-                    # if it does fail, log the error so a new user can continue
-                    # logging in
-                    logger.warn("Failed to retrieve invitation %s", invitation, exc_info=True)
-            else:
-                logger.warn("User already has a portfolio, did not retrieve invitation %s", invitation, exc_info=True)
+            if not invitations:
+                return
+
+            user_has_multiple_portfolios_flag = flag_is_active_for_user(self, "multiple_portfolios")
+            has_portfolio = self.get_first_portfolio() is not None
+            multiple_portfolios_flag = None
+
+            to_retrieve = []
+            for invitation in invitations:
+                only_single_portfolio = not user_has_multiple_portfolios_flag and not has_portfolio
+                if not only_single_portfolio and multiple_portfolios_flag is None:
+                    multiple_portfolios_flag = flag_is_active(None, "multiple_portfolios")
+                if only_single_portfolio or multiple_portfolios_flag:
+                    to_retrieve.append(invitation)
+                    # retrieving this invitation gives the user a portfolio
+                    has_portfolio = True
+                else:
+                    logger.warn(
+                        "User already has a portfolio, did not retrieve invitation %s", invitation, exc_info=True
+                    )
+
+            if to_retrieve:
+                self._create_portfolio_permissions(to_retrieve, audit)
+                self._mark_invitations_retrieved(
+                    PortfolioInvitation, to_retrieve, PortfolioInvitation.PortfolioInvitationStatus.RETRIEVED, audit
+                )
+            audit.save()
+
+    def _create_portfolio_permissions(self, invitations, audit):
+        """Create or update the user's portfolio permissions for the given invitations,
+        with one insert for new permissions and one update for existing ones"""
+        existing_permissions = {
+            permission.portfolio_id: permission
+            for permission in UserPortfolioPermission.objects.filter(
+                user=self, portfolio_id__in=[invitation.portfolio_id for invitation in invitations]
+            ).select_related("user")
+        }
+
+        to_create = []
+        to_update = []
+        for invitation in invitations:
+            permission = existing_permissions.get(invitation.portfolio_id)
+            if permission is None:
+                permission = UserPortfolioPermission(user=self, portfolio_id=invitation.portfolio_id)
+                to_create.append(permission)
+            changes = {}
+            if invitation.roles and len(invitation.roles) > 0:
+                changes["roles"] = (permission.roles, invitation.roles)
+                permission.roles = invitation.roles
+            if invitation.additional_permissions and len(invitation.additional_permissions) > 0:
+                changes["additional_permissions"] = (
+                    permission.additional_permissions,
+                    invitation.additional_permissions,
+                )
+                permission.additional_permissions = invitation.additional_permissions
+            if permission.pk is not None and changes:
+                # bulk_update does not fill in auto_now fields
+                permission.updated_at = timezone.now()
+                to_update.append(permission)
+                audit.log_update(permission, changes)
+
+        UserPortfolioPermission.objects.bulk_create(to_create, ignore_conflicts=True)
+        UserPortfolioPermission.objects.bulk_update(to_update, ["roles", "additional_permissions", "updated_at"])
+
+        created_portfolio_ids = [permission.portfolio_id for permission in to_create]
+        for permission in UserPortfolioPermission.objects.filter(
+            user=self, portfolio_id__in=created_portfolio_ids
+        ).select_related("user"):
+            audit.log_create(permission)
 
     def on_each_login(self):
         """Callback each time the user is authenticated.
@@ -447,8 +550,9 @@ class User(AbstractUser):
         as a transition domain and update our domainInfo objects accordingly.
         """
 
-        self.check_domain_invitations_on_login()
-        self.check_portfolio_invitations_on_login()
+        with transaction.atomic():
+            self.check_domain_invitations_on_login()
+            self.check_portfolio_invitations_on_login()
 
     def is_org_user(self, request):
         has_organization_feature_flag = flag_is_active(request, "organization_feature")
@@ -0,0 +1,272 @@
+"""Helpers for keeping the django-auditlog history complete when rows are written in bulk.
+
+bulk_create, bulk_update and QuerySet.update do not send the model signals that
+django-auditlog listens to, so code that writes registered models in bulk should
+record the equivalent log entries itself with AuditHelper.
+
+Code that saves registered models one at a time, many times over (such as refreshing a
+domain from the registry, or a migration script) can instead wrap that work in
+batched_audit_log, so that the log entries are written together when it commits."""
+
+import contextlib
+import copy
+import logging
+from contextvars import ContextVar
+from dataclasses import dataclass
+
+from auditlog.cid import get_cid
+from auditlog.context import auditlog_disabled, auditlog_value
+from auditlog.diff import model_instance_diff
+from auditlog.models import LogEntry
+from auditlog.registry import auditlog
+from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_save
+from django.utils.encoding import smart_str
+
+logger = logging.getLogger(__name__)
+
+
+def get_current_actor():
+    """Returns the user that django-auditlog records as the actor of the current request, if any.
+
+    django-auditlog does not store the actor in its context, but adds it to each LogEntry in a
+    pre_save signal receiver, so it is read by sending that signal for an unsaved LogEntry."""
+    entry = LogEntry()
+    pre_save.send(sender=LogEntry, instance=entry, raw=False, using=None, update_fields=None)
+    return entry.actor
+
+
+class AuditHelper:
+    """Builds django-auditlog LogEntry rows for instances saved in bulk,
+    and writes them with a single query."""
+
+    def __init__(self):
+        self.entries: list[LogEntry] = []
+        # The actor and remote address are read now, as the entries may be written
+        # on commit, after the request that made the changes has been handled.
+        self.actor = get_current_actor()
+        try:
+            self.remote_addr = auditlog_value.get().get("remote_addr")
+        except LookupError:
+            self.remote_addr = None
+
+    def log_create(self, instance):
+        """Record that instance was created. The instance must already have a pk."""
+        self._add(instance, LogEntry.Action.CREATE, model_instance_diff(None, instance))
+
+    def log_update(self, instance, changes):
+        """Record that instance was updated.
+
+        changes is a dict of field name to [old value, new value], as django-auditlog stores them."""
+        diff = {field: [str(old), str(new)] for field, (old, new) in changes.items()}
+        self._add(instance, LogEntry.Action.UPDATE, diff)
+
+    def _add(self, instance, action, changes):
+        """Queue a log entry, skipping unregistered models and empty diffs like django-auditlog does"""
+        if not auditlog.contains(instance.__class__) or not changes:
+            return
+
+        pk = instance.pk
+        self.entries.append(
+            LogEntry(
+                content_type=ContentType.objects.get_for_model(instance.__class__),
+                object_pk=str(pk),
+                object_id=pk if isinstance(pk, int) else None,
+                object_repr=str(instance),
+                action=action,
+                changes=changes,
+                cid=get_cid(),
+            )
+        )
+
+    def save(self):
+        """Write all queued log entries in one query, unless auditing is disabled"""
+        batch = _audit_batch.get()
+        if batch is not None and batch is not self:
+            # Inside batched_audit_log, the batch writes these along with its own entries
+            batch.entries.extend(self.entries)
+            self.entries = []
+            return
+
+        if not self.entries or auditlog_disabled.get():
+            self.entries = []
+            return
+
+        # django-auditlog fills in the actor and remote address from its context
+        # in a pre_save signal, which bulk_create does not send
+        for entry in self.entries:
+            entry.actor = self.actor
+            entry.remote_addr = self.remote_addr
+
+        LogEntry.objects.bulk_create(self.entries)
+        logger.debug(f"Wrote {len(self.entries)} audit log entries")
+        self.entries = []
+
+
+@dataclass
+class _PendingChange:
+    """The changes made to one object inside batched_audit_log, not yet turned into a log entry"""
+
+    action: int
+    # The object as it was before the batch, or None if it was created in the batch
+    old: object
+    # The object as it was last saved
+    new: object = None
+    # The fields to diff, or None for all fields
+    fields: set | None = None
+
+
+class AuditBatch(AuditHelper):
+    """Collects the audit log entries of registered models saved inside batched_audit_log.
+
+    Saves of the same object are combined into one entry, diffed from the object's state before
+    its first save in the batch to its state after the last one. Only the first save of an object
+    reads its previous state from the database, and saves which end up changing nothing (such as
+    setting a field and then setting it back) do not add an entry."""
+
+    def __init__(self):
+        super().__init__()
+        self.pending: dict[tuple, _PendingChange] = {}
+
+    def before_save(self, instance, update_fields=None):
+        """Remember the stored state of instance the first time it is saved in the batch"""
+        if instance._state.adding or instance.pk is None:
+            return
+
+        key = (instance.__class__, instance.pk)
+        fields = set(update_fields) if update_fields is not None else None
+        pending = self.pending.get(key)
+        if pending is None:
+            old = instance.__class__._default_manager.filter(pk=instance.pk).first()
+            self.pending[key] = _PendingChange(LogEntry.Action.UPDATE, old, fields=fields)
+        elif pending.fields is not None:
+            pending.fields = pending.fields | fields if fields is not None else None
+
+    def after_save(self, instance, created):
+        """Remember the saved state of instance"""
+        key = (instance.__class__, instance.pk)
+        if created:
+            self.pending[key] = _PendingChange(LogEntry.Action.CREATE, None)
+
+        pending = self.pending.get(key)
+        if pending is not None:
+            # A copy, as the instance may be changed again before the batch is written
+            pending.new = copy.copy(instance)
+
+    def after_delete(self, instance):
+        """Add the entry for the pending changes of instance, then one for its deletion"""
+        pending = self.pending.pop((instance.__class__, instance.pk), None)
+        if pending is not None:
+            self._add_pending(pending)
+        self._add(instance, LogEntry.Action.DELETE, model_instance_diff(instance, None))
+
+    def log_m2m_change(self, instance, field_name, operation, changed_objects):
+        """Add an entry for objects added to or removed from a many to many field of instance"""
+        objects = [smart_str(changed_object) for changed_object in changed_objects]
+        if objects:
+            changes = {field_name: {"type": "m2m", "operation": operation, "objects": objects}}
+            self._add(instance, LogEntry.Action.UPDATE, changes)
+
+    def _add_pending(self, pending):
+        if pending.new is not None:
+            changes = model_instance_diff(pending.old, pending.new, fields_to_check=pending.fields)
+            self._add(pending.new, pending.action, changes)
+
+    def save(self):
+        """Write the entries for every object changed in the batch in one query"""
+        for pending in self.pending.values():
+            self._add_pending(pending)
+        self.pending = {}
+        super().save()
+
+
+_audit_batch: ContextVar[AuditBatch | None] = ContextVar("audit_batch", default=None)
+
+
+@contextlib.contextmanager
+def batched_audit_log():
+    """
+    Buffers the django-auditlog entries of registered models saved inside this block, and writes
+    them with a single bulk_create once the surrounding transaction commits (or straight away
+    when there is none). If the transaction is rolled back, the entries are discarded with it.
+
+    Unlike auditlog's disable_auditlog, every change is still logged. Nested blocks write their
+    entries along with the outermost one, and nothing is batched while auditlog is disabled.
+
+    Usage:
+    with batched_audit_log():
+        for domain in domains:
+            domain.save()
+    """
+    if _audit_batch.get() is not None or auditlog_disabled.get():
+        yield
+        return
+
+    batch = AuditBatch()
+    batch_token = _audit_batch.set(batch)
+    # The batch records the changes itself, so django-auditlog's own receivers are switched off
+    disabled_token = auditlog_disabled.set(True)
+    try:
+        yield
+    finally:
+        auditlog_disabled.reset(disabled_token)
+        _audit_batch.reset(batch_token)
+        transaction.on_commit(batch.save)
+
+
+def _batch_before_save(sender, instance, raw=False, update_fields=None, **kwargs):
+    batch = _audit_batch.get()
+    if batch is not None and not raw:
+        batch.before_save(instance, update_fields)
+
+
+def _batch_after_save(sender, instance, created, raw=False, **kwargs):
+    batch = _audit_batch.get()
+    if batch is not None and not raw:
+        batch.after_save(instance, created)
+
+
+def _batch_after_delete(sender, instance, **kwargs):
+    batch = _audit_batch.get()
+    if batch is not None and instance.pk is not None:
+        batch.after_delete(instance)
+
+
+def _make_batch_m2m_changed(registered_model, field_name):
+    """Returns an m2m_changed receiver for field_name on registered_model, like django-auditlog's"""
+
+    def batch_m2m_changed(sender, instance, action, model, pk_set, **kwargs):
+        batch = _audit_batch.get()
+        if batch is None or not isinstance(instance, registered_model):
+            return
+
+        if action == "post_clear":
+            changed_objects = model.objects.all()
+        elif action in ["post_add", "post_remove"]:
+            changed_objects = model.objects.filter(pk__in=pk_set)
+        else:
+            return
+        operation = "add" if action == "post_add" else "delete"
+        batch.log_m2m_change(instance, field_name, operation, changed_objects)
+
+    return batch_m2m_changed
+
+
+def connect_batched_audit_log_receivers():
+    """Connects the receivers which record changes made inside batched_audit_log,
+    for each model registered with django-auditlog. Called once the app is ready."""
+    for model in auditlog.get_models():
+        label = model._meta.label
+        pre_save.connect(_batch_before_save, sender=model, dispatch_uid=f"batched_audit_log_pre_save_{label}")
+        post_save.connect(_batch_after_save, sender=model, dispatch_uid=f"batched_audit_log_post_save_{label}")
+        post_delete.connect(_batch_after_delete, sender=model, dispatch_uid=f"batched_audit_log_post_delete_{label}")
+
+        # django-auditlog has no public accessor for the many to many fields it tracks
+        for field_name in auditlog._registry[model]["m2m_fields"]:
+            m2m_changed.connect(
+                _make_batch_m2m_changed(model, field_name),
+                sender=getattr(model, field_name).through,
+                weak=False,
+                dispatch_uid=f"batched_audit_log_m2m_changed_{label}_{field_name}",
+            )
@@ -0,0 +1,182 @@
+"""Approves many domain requests together, for bulk onboarding from the admin"""
+
+import logging
+from dataclasses import dataclass, field
+
+from django.apps import apps
+from django.db import transaction
+from django.utils import timezone
+
+from registrar.models.utility.audit_helper import AuditHelper, get_current_actor
+from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class BulkApprovalResult:
+    """The domain requests that were approved, and the reason each of the others was not"""
+
+    approved: list = field(default_factory=list)
+    # (domain request, error message) for each request which was not approved
+    failed: list[tuple] = field(default_factory=list)
+
+
+class DomainRequestBulkApproval:
+    """
+    Approves a set of domain requests with a fixed number of queries.
+
+    This does what DomainRequest.approve does for each request, but validates every
+    request up front (checking all requested names against existing domains in one query),
+    then creates the domains, domain information and manager roles with bulk inserts in
+    a single transaction. Requests that cannot be approved are reported in the result
+    rather than stopping the others.
+
+    Approval emails are sent once the transaction has committed, so that a slow mail
+    server does not hold the transaction open.
+
+    Usage:
+    result = DomainRequestBulkApproval().approve(DomainRequest.objects.filter(...))
+    """
+
+    def __init__(self, send_email=True):
+        self.send_email = send_email
+
+    def approve(self, domain_requests) -> BulkApprovalResult:
+        """Approves each request in the domain_requests queryset that can be approved"""
+        DomainRequest = apps.get_model("registrar.DomainRequest")
+        result = BulkApprovalResult()
+        audit = AuditHelper()
+
+        with transaction.atomic():
+            requests = list(
+                domain_requests.select_for_update(of=("self",))
+                .select_related("requested_domain", "creator", "investigator", "federal_agency")
+                .order_by("id")
+            )
+            to_approve = self._validate(requests, result)
+            if not to_approve:
+                return result
+
+            Domain = apps.get_model("registrar.Domain")
+            domains = Domain.objects.bulk_create(
+                [Domain(name=domain_request.requested_domain.name) for domain_request in to_approve]
+            )
+            for domain in domains:
+                audit.log_create(domain)
+
+            non_federal_agency = None
+            if any(domain_request.federal_agency is None for domain_request in to_approve):
+                FederalAgency = apps.get_model("registrar.FederalAgency")
+                non_federal_agency = FederalAgency.objects.filter(agency="Non-Federal Agency").first()
+
+            now = timezone.now()
+            for domain_request, domain in zip(to_approve, domains):
+                changes = {"status": (domain_request.status, DomainRequest.DomainRequestStatus.APPROVED)}
+                if domain_request.federal_agency is None and non_federal_agency is not None:
+                    changes["federal_agency"] = (None, non_federal_agency)
+                    domain_request.federal_agency = non_federal_agency
+                if domain_request.status == DomainRequest.DomainRequestStatus.REJECTED:
+                    changes["rejection_reason"] = (domain_request.rejection_reason, None)
+                    domain_request.rejection_reason = None
+                elif domain_request.status == DomainRequest.DomainRequestStatus.ACTION_NEEDED:
+                    changes["action_needed_reason"] = (domain_request.action_needed_reason, None)
+                    domain_request.action_needed_reason = None
+                changes["approved_domain"] = (domain_request.approved_domain, domain)
+
+                domain_request.status = DomainRequest.DomainRequestStatus.APPROVED
+                domain_request.approved_domain = domain
+                domain_request.last_status_update = now.date()
+                # bulk_update does not set auto_now fields
+                domain_request.updated_at = now
+                audit.log_update(domain_request, changes)
+
+            DomainRequest.objects.bulk_update(
+                to_approve,
+                [
+                    "status",
+                    "approved_domain",
+                    "federal_agency",
+                    "rejection_reason",
+                    "action_needed_reason",
+                    "last_status_update",
+                    "updated_at",
+                ],
+            )
+
+            DomainRequestStatusChange = apps.get_model("registrar.DomainRequestStatusChange")
+            actor = get_current_actor()
+            DomainRequestStatusChange.objects.bulk_create(
+                [
+                    DomainRequestStatusChange.from_domain_request(domain_request, actor=actor, changed_at=now)
+                    for domain_request in to_approve
+                ]
+            )
+
+            DomainInformation = apps.get_model("registrar.DomainInformation")
+            DomainInformation.bulk_create_from_da(to_approve, audit=audit)
+
+            UserDomainRole = apps.get_model("registrar.UserDomainRole")
+            roles = UserDomainRole.objects.bulk_create(
+                [
+                    UserDomainRole(
+                        user=domain_request.creator,
+                        domain=domain_request.approved_domain,
+                        role=UserDomainRole.Roles.MANAGER,
+                    )
+                    for domain_request in to_approve
+                ]
+            )
+            for role in roles:
+                audit.log_create(role)
+
+            audit.save()
+            result.approved = to_approve
+            transaction.on_commit(lambda: self._send_emails(to_approve))
+
+        logger.info(f"Bulk approved {len(result.approved)} domain requests, {len(result.failed)} failed")
+        return result
+
+    def _validate(self, requests, result):
+        """Returns the requests which can be approved, adding the others to result.failed"""
+        DomainRequest = apps.get_model("registrar.DomainRequest")
+        Domain = apps.get_model("registrar.Domain")
+
+        names = [domain_request.requested_domain.name for domain_request in requests if domain_request.requested_domain]
+        names_in_use = set(Domain.objects.filter(name__in=names).values_list("name", flat=True))
+
+        to_approve = []
+        for domain_request in requests:
+            error_message = None
+            if not DomainRequest.approve._django_fsm.has_transition(domain_request.status):
+                error_message = f"Cannot approve a request with status {domain_request.get_status_display()}."
+            elif domain_request.creator.is_restricted():
+                error_message = "This action is not permitted for domain requests with a restricted creator."
+            elif domain_request.investigator is None:
+                error_message = FSMDomainRequestError.get_error_message(FSMErrorCodes.NO_INVESTIGATOR)
+            elif not domain_request.investigator.is_staff:
+                error_message = FSMDomainRequestError.get_error_message(FSMErrorCodes.INVESTIGATOR_NOT_STAFF)
+            elif domain_request.requested_domain is None:
+                error_message = "Cannot approve a request without a requested domain."
+            elif domain_request.requested_domain.name in names_in_use:
+                error_message = FSMDomainRequestError.get_error_message(FSMErrorCodes.APPROVE_DOMAIN_IN_USE)
+
+            if error_message is not None:
+                result.failed.append((domain_request, error_message))
+                continue
+
+            # A name requested twice in the same batch is only approved for the first request
+            names_in_use.add(domain_request.requested_domain.name)
+            to_approve.append(domain_request)
+
+        return to_approve
+
+    def _send_emails(self, approved):
+        """Sends the approval email for each approved request"""
+        for domain_request in approved:
+            domain_request._send_status_update_email(
+                "domain request approved",
+                "emails/status_change_approved.txt",
+                "emails/status_change_approved_subject.txt",
+                send_email=self.send_email,
+            )
@@ -6,6 +6,7 @@ from django.http import JsonResponse
 
 from api.views import DOMAIN_API_MESSAGES, check_domain_available
 from registrar.utility import errors
+from registrar.utility.domain_availability import DomainAvailabilityCache
 from epplibwrapper.errors import RegistryError
 from registrar.utility.enums import ValidationReturnType
 
@@ -28,14 +29,19 @@ class DomainHelper:
         return bool(cls.DOMAIN_REGEX.match(domain))
 
     @classmethod
-    def validate(cls, domain: str, blank_ok=False) -> str:
-        """Attempt to determine if a domain name could be requested."""
+    def validate(cls, domain: str, blank_ok=False, availability: DomainAvailabilityCache | None = None) -> str:
+        """Attempt to determine if a domain name could be requested.
+
+        If an availability cache is given, a recent registry result for this domain is reused."""
         # Split into pieces for the linter
         domain = cls._validate_domain_string(domain, blank_ok)
 
         if domain != "":
             try:
-                if not check_domain_available(domain):
+                available = (
+                    availability.is_available(domain) if availability is not None else check_domain_available(domain)
+                )
+                if not available:
                     raise errors.DomainUnavailableError()
             except RegistryError as err:
                 raise errors.RegistrySystemError() from err
@@ -73,7 +79,7 @@ class DomainHelper:
         return domain
 
     @classmethod
-    def validate_and_handle_errors(cls, domain, return_type, blank_ok=False):
+    def validate_and_handle_errors(cls, domain, return_type, blank_ok=False, availability=None):
         """
         Validates a domain and returns an appropriate response based on the validation result.
 
@@ -84,6 +90,7 @@ class DomainHelper:
             domain (str): The domain to validate.
             return_type (ValidationReturnType): Determines the type of response (JSON or form validation error).
             blank_ok (bool, optional): If True, blank input does not raise an exception. Defaults to False.
+            availability (DomainAvailabilityCache, optional): Reuses recent registry checks. Defaults to None.
 
         Returns:
             tuple: The validated domain (or None if validation failed), and the response (success or error).
@@ -103,7 +110,7 @@ class DomainHelper:
 
         try:
             # Attempt to validate the domain
-            validated = cls.validate(domain, blank_ok)
+            validated = cls.validate(domain, blank_ok, availability)
 
         # Get a list of each possible exception, and the code to return
         except tuple(error_map.keys()) as error:
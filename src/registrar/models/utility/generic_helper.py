@@ -3,6 +3,7 @@
 import time
 import logging
 from urllib.parse import urlparse, urlunparse, urlencode
+from django.db.models import BooleanField, Case, CharField, F, Value, When
 from django.urls import resolve, Resolver404
 
 logger = logging.getLogger(__name__)
@@ -43,6 +44,8 @@ class CreateOrUpdateOrganizationTypeHelper:
     A helper that manages the "organization_type" field in DomainRequest and DomainInformation
     """
 
+    ORG_TYPE_FIELDS = ("generic_org_type", "is_election_board", "organization_type")
+
     def __init__(self, sender, instance, generic_org_to_org_map, election_org_to_generic_org_map):
         # The "model type"
         self.sender = sender
@@ -103,39 +106,101 @@ class CreateOrUpdateOrganizationTypeHelper:
 
     def _handle_existing_instance(self, force_update_when_no_changes_are_found=False):
         # == Init variables == #
+        current_values = self._get_current_values()
+        if current_values is None:
+            # this should only happen when import_export utility attempts to import
+            # a new row and already has an id
+            return
+
+        # Check the new and old values
+        generic_org_type_changed = self.instance.generic_org_type != current_values["generic_org_type"]
+        is_election_board_changed = self.instance.is_election_board != current_values["is_election_board"]
+        organization_type_changed = self.instance.organization_type != current_values["organization_type"]
+
+        # == Check for invalid conditions before proceeding == #
+        if organization_type_changed and (generic_org_type_changed or is_election_board_changed):
+            # Since organization type is linked with generic_org_type and election board,
+            # we have to update one or the other, not both.
+            # This will not happen in normal flow as it is not possible otherwise.
+            raise ValueError("Cannot update organization_type and generic_org_type simultaneously.")
+        elif not organization_type_changed and (not generic_org_type_changed and not is_election_board_changed):
+            # No changes found
+            if force_update_when_no_changes_are_found:
+                # If we want to force an update anyway, we can treat this record like
+                # its a new one in that we check for "None" values rather than changes.
+                self._handle_new_instance()
+        else:
+            # == Update the linked values == #
+            # Find out which field needs updating
+            organization_type_needs_update = generic_org_type_changed or is_election_board_changed
+            generic_org_type_needs_update = organization_type_changed
+
+            # Update the field
+            self._update_fields(organization_type_needs_update, generic_org_type_needs_update)
+
+    def _get_current_values(self):
+        """Returns the stored values of the organization type fields, or None if the record
+        is not in the database. Values remembered when the instance was loaded or last saved
+        are used when available, so that most saves do not need to query for them."""
+        cached_values = getattr(self.instance, "_cached_org_type_fields", None)
+        if cached_values is not None:
+            return cached_values
+
         try:
             # Instance is already in the database, fetch its current state
             current_instance = self.sender.objects.get(id=self.instance.id)
-
-            # Check the new and old values
-            generic_org_type_changed = self.instance.generic_org_type != current_instance.generic_org_type
-            is_election_board_changed = self.instance.is_election_board != current_instance.is_election_board
-            organization_type_changed = self.instance.organization_type != current_instance.organization_type
-
-            # == Check for invalid conditions before proceeding == #
-            if organization_type_changed and (generic_org_type_changed or is_election_board_changed):
-                # Since organization type is linked with generic_org_type and election board,
-                # we have to update one or the other, not both.
-                # This will not happen in normal flow as it is not possible otherwise.
-                raise ValueError("Cannot update organization_type and generic_org_type simultaneously.")
-            elif not organization_type_changed and (not generic_org_type_changed and not is_election_board_changed):
-                # No changes found
-                if force_update_when_no_changes_are_found:
-                    # If we want to force an update anyway, we can treat this record like
-                    # its a new one in that we check for "None" values rather than changes.
-                    self._handle_new_instance()
-            else:
-                # == Update the linked values == #
-                # Find out which field needs updating
-                organization_type_needs_update = generic_org_type_changed or is_election_board_changed
-                generic_org_type_needs_update = organization_type_changed
-
-                # Update the field
-                self._update_fields(organization_type_needs_update, generic_org_type_needs_update)
         except self.sender.DoesNotExist:
-            # this exception should only be raised when import_export utility attempts to import
-            # a new row and already has an id
-            pass
+            return None
+        return {field: getattr(current_instance, field) for field in self.ORG_TYPE_FIELDS}
+
+    @classmethod
+    def cache_org_type_fields(cls, instance, fields=None):
+        """Remembers the organization type fields of an instance as they are stored in the
+        database. Call this when the instance is loaded, refreshed or saved.
+
+        fields: the fields which were loaded or saved, when not all of them were."""
+        if fields is not None and not set(cls.ORG_TYPE_FIELDS).isdisjoint(fields):
+            if not set(cls.ORG_TYPE_FIELDS).issubset(fields):
+                # Only some were written, so the stored values have to be fetched when needed
+                instance._cached_org_type_fields = None
+                return
+        elif fields is not None:
+            # None of the fields were written, so what was remembered is still right
+            return
+
+        if any(field not in instance.__dict__ for field in cls.ORG_TYPE_FIELDS):
+            # A field was deferred, so the stored values have to be fetched when needed
+            instance._cached_org_type_fields = None
+        else:
+            instance._cached_org_type_fields = {field: instance.__dict__[field] for field in cls.ORG_TYPE_FIELDS}
+
+    @staticmethod
+    def bulk_update_organization_type(queryset, generic_org_to_org_map):
+        """Sets organization_type from generic_org_type and is_election_board on every record in
+        queryset with a single UPDATE, following the same rules as a save does for a new record.
+        Records without a generic_org_type are left unchanged.
+
+        Like any QuerySet.update, this does not call save() or write audit log entries.
+        Returns the number of records updated."""
+        election_org_types = {str(generic): str(election) for generic, election in generic_org_to_org_map.items()}
+
+        organization_type = Case(
+            *[
+                When(generic_org_type=generic, is_election_board=True, then=Value(election))
+                for generic, election in election_org_types.items()
+            ],
+            default=F("generic_org_type"),
+            output_field=CharField(),
+        )
+        # Election board is reset for records which can't have one. For example, federal.
+        is_election_board = Case(
+            When(generic_org_type__in=list(election_org_types), then=F("is_election_board")),
+            default=Value(None),
+            output_field=BooleanField(null=True),
+        )
+        return queryset.filter(generic_org_type__isnull=False).update(
+            organization_type=organization_type, is_election_board=is_election_board
+        )
 
     def _update_fields(self, organization_type_needs_update, generic_org_type_needs_update):
         """
@@ -2,14 +2,25 @@
 Contains middleware used in settings.py
 """
 
+import json
 import logging
+import random
+import time
 from urllib.parse import parse_qs
+from django.conf import settings
 from django.urls import reverse
 from django.http import HttpResponseRedirect
+from epplibwrapper.metrics import EPP_METRICS
 from registrar.models import User
 from waffle.decorators import flag_is_active
 
 from registrar.models.utility.generic_helper import replace_url_queryparams
+from registrar.utility.request_profiling import (
+    RequestProfile,
+    get_current_profile,
+    profile_request,
+    record_epp_command,
+)
 
 logger = logging.getLogger(__name__)
 
@@ -169,3 +180,60 @@ class CheckPortfolioMiddleware:
             request.session["portfolio"] = request.user.get_first_portfolio()
         else:
             request.session["portfolio"] = request.user.get_first_portfolio()
+
+
+class RequestProfilingMiddleware:
+    """
+    Logs where the time of a request goes: how many database queries it made (and how many of
+    those repeated an earlier one), how many registry commands it sent, its calls to SES and S3,
+    and how long its templates took to render.
+
+    A share of requests is profiled at random, set by REQUEST_PROFILING_SAMPLE_RATE, and staff
+    can profile a single request by sending the X-Profile-Request header. The profile is logged
+    as one JSON line, and returned in a Server-Timing header when REQUEST_PROFILING_SERVER_TIMING
+    is on or the header was sent.
+    """
+
+    header = "X-Profile-Request"
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        EPP_METRICS.add_listener(record_epp_command)
+
+    def __call__(self, request):
+        requested = self._is_requested_by_staff(request)
+        if not requested and random.random() >= settings.REQUEST_PROFILING_SAMPLE_RATE:  # nosec
+            return self.get_response(request)
+
+        profile = RequestProfile(method=request.method, path=request.path)
+        with profile_request(profile):
+            response = self.get_response(request)
+
+        logger.info("Request profile: %s", json.dumps(profile.as_dict(response.status_code)))
+        if requested or settings.REQUEST_PROFILING_SERVER_TIMING:
+            response["Server-Timing"] = profile.server_timing()
+        return response
+
+    def process_template_response(self, request, response):
+        """Times the rendering of responses whose templates render after the view returns"""
+        profile = get_current_profile()
+        if profile is None:
+            return response
+
+        render = response.render
+
+        def timed_render():
+            started_at = time.perf_counter()
+            try:
+                return render()
+            finally:
+                profile.record_template_render(time.perf_counter() - started_at)
+
+        response.render = timed_render
+        return response
+
+    def _is_requested_by_staff(self, request):
+        if self.header not in request.headers:
+            return False
+        user = getattr(request, "user", None)
+        return user is not None and user.is_authenticated and user.is_staff
@@ -5,7 +5,9 @@ from contextlib import contextmanager
 import random
 from string import ascii_uppercase
 import uuid
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from unittest.mock import MagicMock, Mock, patch
 from typing import List, Dict
 from django.contrib.sessions.middleware import SessionMiddleware
@@ -29,6 +31,7 @@ from registrar.models import (
     FederalAgency,
     UserPortfolioPermission,
     Portfolio,
+    PortfolioInvitation,
 )
 from epplibwrapper import (
     commands,
@@ -40,6 +43,7 @@ from epplibwrapper import (
     responses,
 )
 from registrar.models.user_domain_role import UserDomainRole
+from registrar.models.utility.portfolio_helper import UserPortfolioRoleChoices
 
 from registrar.models.utility.contact_error import ContactError, ContactErrorCodes
 
@@ -1461,20 +1465,32 @@ class MockEppLib(TestCase):
         )
 
     def mockCheckDomainCommand(self, _request, cleaned):
-        if "gsa.gov" in getattr(_request, "names", None):
-            return self._mockDomainName("gsa.gov", False)
-        elif "igorville.gov" in getattr(_request, "names", None):
-            return self._mockDomainName("igorville.gov", True)
-        elif "top-level-agency.gov" in getattr(_request, "names", None):
-            return self._mockDomainName("top-level-agency.gov", True)
-        elif "city.gov" in getattr(_request, "names", None):
-            return self._mockDomainName("city.gov", True)
-        elif "city1.gov" in getattr(_request, "names", None):
-            return self._mockDomainName("city1.gov", True)
-        elif "errordomain.gov" in getattr(_request, "names", None):
+        names = getattr(_request, "names", None)
+        if "errordomain.gov" in names:
             raise RegistryError("Registry cannot find domain availability.")
-        else:
-            return self._mockDomainName("domainnotfound.gov", False)
+        if len(names) > 1:
+            # batched checks get one result per name
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(
+                        name=name, avail=self.mockCheckDomainAvailability.get(name, False), reason=None
+                    )
+                    for name in names
+                ]
+            )
+        for name, avail in self.mockCheckDomainAvailability.items():
+            if name in names:
+                return self._mockDomainName(name, avail)
+        return self._mockDomainName("domainnotfound.gov", False)
+
+    # availability returned by mockCheckDomainCommand
+    mockCheckDomainAvailability = {
+        "gsa.gov": False,
+        "igorville.gov": True,
+        "top-level-agency.gov": True,
+        "city.gov": True,
+        "city1.gov": True,
+    }
 
     def mockSend(self, _request, cleaned):
         """Mocks the registry.send function used inside of domain.py
@@ -1755,3 +1771,135 @@ def get_wsgi_request_object(client, user, url="/"):
     request = client.get(url).wsgi_request
     request.user = user
     return request
+
+
+class ScaledDataFactory:
+    """
+    Seeds the objects listed by the registrar's views at a chosen size, for query budget tests.
+
+    Each step adds, for the given user and portfolio: a domain the user manages in the portfolio,
+    a submitted domain request the user created, a portfolio member who manages that domain and
+    one shared domain, a portfolio invitation with a domain invitation to the shared domain, and
+    another portfolio, created by the member.
+    Calling seed with a larger count adds steps until there are that many of each.
+    """
+
+    def __init__(self, user, portfolio):
+        self.user = user
+        self.portfolio = portfolio
+        self.count = 0
+        self.shared_domain = self.create_domain("shared")
+        self.domains: list[Domain] = []
+        self.members: list[User] = []
+
+    def seed(self, count):
+        """Adds objects until there are count of each"""
+        for i in range(self.count, count):
+            self.add_step(i)
+        self.count = max(self.count, count)
+
+    def create_domain(self, prefix):
+        """Creates a ready domain in the portfolio, managed by the user"""
+        domain = Domain.objects.create(
+            name=f"{prefix}.gov", state=Domain.State.READY, expiration_date=timezone.now().date() + timedelta(days=365)
+        )
+        DomainInformation.objects.create(
+            creator=self.user, domain=domain, portfolio=self.portfolio, organization_name="Scaled org"
+        )
+        UserDomainRole.objects.create(user=self.user, domain=domain, role=UserDomainRole.Roles.MANAGER)
+        return domain
+
+    def add_step(self, i):
+        domain = self.create_domain(f"scaled{i}")
+        self.domains.append(domain)
+
+        completed_domain_request(
+            status=DomainRequest.DomainRequestStatus.SUBMITTED,
+            user=self.user,
+            name=f"scaled-request{i}.gov",
+            portfolio=self.portfolio,
+        )
+
+        member = User.objects.create(
+            username=f"scaled_member{i}",
+            first_name="Member",
+            last_name=str(i),
+            email=f"scaled_member{i}@igorville.gov",
+        )
+        self.members.append(member)
+        UserPortfolioPermission.objects.create(
+            user=member, portfolio=self.portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+        )
+        UserDomainRole.objects.bulk_create(
+            [
+                UserDomainRole(user=member, domain=domain, role=UserDomainRole.Roles.MANAGER),
+                UserDomainRole(user=member, domain=self.shared_domain, role=UserDomainRole.Roles.MANAGER),
+            ]
+        )
+
+        email = f"scaled_invited{i}@igorville.gov"
+        PortfolioInvitation.objects.create(
+            email=email, portfolio=self.portfolio, roles=[UserPortfolioRoleChoices.ORGANIZATION_MEMBER]
+        )
+        DomainInvitation.objects.create(email=email, domain=self.shared_domain)
+
+        Portfolio.objects.create(creator=member, organization_name=f"Scaled portfolio {i}")
+
+
+class QueryBudgetMixin:
+    """
+    Adds assertQueryCountConstant to a TestCase, to catch N+1 queries in views.
+
+    The query counts of every view checked by the test class are logged as a report
+    of per-view query budgets once the class has run.
+    """
+
+    # The sizes views are requested at: the small one is under a page of results,
+    # the large one is a full page
+    query_budget_sizes = (2, 10)
+
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # view name: {size: query count}
+        cls.query_budgets: Dict[str, Dict[int, int]] = {}
+
+    @classmethod
+    def tearDownClass(cls):
+        super().tearDownClass()
+        if cls.query_budgets:
+            report = "\n".join(
+                f"  {name}: " + ", ".join(f"{count} queries for {size}" for size, count in counts.items())
+                for name, counts in sorted(cls.query_budgets.items())
+            )
+            logger.info(f"Query budgets for {cls.__name__}:\n{report}")
+
+    def assertQueryCountConstant(self, name, get_response, seed, max_queries=None):
+        """
+        Fails if get_response makes more queries once seed has added more data.
+
+        seed is called with each of query_budget_sizes in turn, and should add objects until the view
+        lists that many. get_response makes the request and returns the response, which must be a 200.
+        It is called once before the queries are counted, so that what is cached by the first request
+        (such as waffle flags and content types) is not counted.
+        If max_queries is given, the view must also make no more than that many queries.
+        """
+        counts = {}
+        for size in self.query_budget_sizes:
+            seed(size)
+            get_response()
+            with CaptureQueriesContext(connection) as queries:
+                response = get_response()
+            self.assertEqual(response.status_code, 200, f"{name} returned {response.status_code}")
+            counts[size] = len(queries)
+        self.query_budgets[name] = counts
+
+        small_size, large_size = self.query_budget_sizes[0], self.query_budget_sizes[-1]
+        self.assertLessEqual(
+            counts[large_size],
+            counts[small_size],
+            f"{name} made {counts[small_size]} queries for {small_size} rows but {counts[large_size]} "
+            f"for {large_size}. Load related objects with select_related or prefetch_related.",
+        )
+        if max_queries is not None:
+            self.assertLessEqual(counts[large_size], max_queries, f"{name} went over its budget of {max_queries}")
@@ -1,11 +1,15 @@
 from datetime import datetime
 from django.utils import timezone
 import re
+import time
+from django.db import connection
 from django.test import RequestFactory, Client, TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from django.contrib.admin.sites import AdminSite
 from contextlib import ExitStack
 from api.tests.common import less_console_noise_decorator
 from django.contrib import messages
+from django.contrib.contenttypes.models import ContentType
 from django.urls import reverse
 from registrar.admin import (
     DomainRequestAdmin,
@@ -24,7 +28,10 @@ from registrar.models import (
     SeniorOfficial,
     Portfolio,
     AllowedEmail,
+    UserDomainRole,
 )
+from registrar.models.utility.bulk_approval import DomainRequestBulkApproval
+from registrar.utility.errors import FSMDomainRequestError, FSMErrorCodes
 from .common import (
     MockSESClient,
     completed_domain_request,
@@ -37,6 +44,7 @@ from .common import (
     GenericTestHelper,
 )
 from unittest.mock import patch
+from auditlog.models import LogEntry  # type: ignore
 
 from django.conf import settings
 import boto3_mocking  # type: ignore
@@ -245,6 +253,33 @@ class TestDomainRequestAdmin(MockEppLib):
         assert_status_count(normalized_content, "Action needed - Unclear organization eligibility", 1)
         assert_status_count(normalized_content, "Rejected - Purpose requirements not met", 1)
 
+    @less_console_noise_decorator
+    def test_status_logs_ignore_other_audit_log_entries(self):
+        """
+        Tests that the status history only shows changes to this domain request,
+        and not audit log entries of other objects with the same id.
+        """
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED)
+        LogEntry.objects.create(
+            content_type=ContentType.objects.get_for_model(Contact),
+            object_pk=str(domain_request.pk),
+            object_id=domain_request.pk,
+            object_repr="unrelated",
+            action=LogEntry.Action.UPDATE,
+            changes={"status": ["None", DomainRequest.DomainRequestStatus.INELIGIBLE]},
+        )
+
+        self.client.force_login(self.superuser)
+        response = self.client.get(
+            "/admin/registrar/domainrequest/{}/change/".format(domain_request.pk),
+            follow=True,
+        )
+        self.assertEqual(response.status_code, 200)
+
+        normalized_content = " ".join(response.content.decode("utf-8").split())
+        self.assertEqual(normalized_content.count("<td> Submitted </td>"), 1)
+        self.assertEqual(normalized_content.count("<td> Ineligible </td>"), 0)
+
     @less_console_noise_decorator
     def test_collaspe_toggle_button_markup(self):
         """
@@ -989,6 +1024,176 @@ class TestDomainRequestAdmin(MockEppLib):
         self.transition_state_and_send_email(domain_request, DomainRequest.DomainRequestStatus.APPROVED)
         self.assertEqual(len(self.mock_client.EMAILS_SENT), 3)
 
+    @less_console_noise_decorator
+    def test_approve_selected_action(self):
+        """The approve selected action approves each valid request, sends the approval emails
+        once the changes are committed, and reports the requests it could not approve."""
+        _creator = User.objects.create(
+            username="MrMeoward",
+            first_name="Meoward",
+            last_name="Jones",
+            email="meoward.jones@igorville.gov",
+        )
+        AllowedEmail.objects.get_or_create(email=_creator.email)
+        submitted = DomainRequest.DomainRequestStatus.SUBMITTED
+        first = completed_domain_request(status=submitted, user=_creator, name="first.gov")
+        second = completed_domain_request(
+            status=DomainRequest.DomainRequestStatus.REJECTED, user=_creator, name="second.gov"
+        )
+        second.rejection_reason = DomainRequest.RejectionReasons.OTHER
+        second.save()
+        in_use = completed_domain_request(status=submitted, user=_creator, name="inuse.gov")
+        Domain.objects.create(name="inuse.gov")
+        started = completed_domain_request(status=DomainRequest.DomainRequestStatus.STARTED, name="started.gov")
+        no_investigator = completed_domain_request(status=submitted, name="noinvestigator.gov")
+        no_investigator.investigator = None
+        no_investigator.save()
+
+        request = self.factory.post("/admin/registrar/domainrequest/")
+        request.user = self.superuser
+        queryset = DomainRequest.objects.filter(id__in=[first.id, second.id, in_use.id, started.id, no_investigator.id])
+        with boto3_mocking.clients.handler_for("sesv2", self.mock_client):
+            with patch.object(self.admin, "message_user") as message_user:
+                with self.captureOnCommitCallbacks(execute=True):
+                    self.admin.approve_selected(request, queryset)
+
+        for domain_request in [first, second]:
+            domain_request.refresh_from_db()
+            self.assertEqual(domain_request.status, DomainRequest.DomainRequestStatus.APPROVED)
+            self.assertEqual(domain_request.approved_domain.name, domain_request.requested_domain.name)
+            self.assertEqual(domain_request.approved_domain.domain_info.domain_request, domain_request)
+            self.assertEqual(domain_request.approved_domain.domain_info.other_contacts.count(), 1)
+            self.assertTrue(
+                UserDomainRole.objects.filter(
+                    user=_creator, domain=domain_request.approved_domain, role=UserDomainRole.Roles.MANAGER
+                ).exists()
+            )
+        self.assertIsNone(second.rejection_reason)
+
+        for domain_request in [in_use, started, no_investigator]:
+            domain_request.refresh_from_db()
+            self.assertNotEqual(domain_request.status, DomainRequest.DomainRequestStatus.APPROVED)
+            self.assertIsNone(domain_request.approved_domain)
+
+        messages_sent = [call.args[1] for call in message_user.call_args_list]
+        self.assertIn("Approved 2 domain request(s).", messages_sent)
+        self.assertIn(
+            f"Could not approve inuse.gov: "
+            f"{FSMDomainRequestError.get_error_message(FSMErrorCodes.APPROVE_DOMAIN_IN_USE)}",
+            messages_sent,
+        )
+        self.assertIn(
+            f"Could not approve noinvestigator.gov: "
+            f"{FSMDomainRequestError.get_error_message(FSMErrorCodes.NO_INVESTIGATOR)}",
+            messages_sent,
+        )
+        self.assertEqual(len(messages_sent), 4)
+
+        self.assertEqual(len(self.mock_client.EMAILS_SENT), 2)
+        self.assert_email_is_accurate("Congratulations! Your .gov domain request has been approved.", 0, _creator.email)
+
+        # The status change is recorded for the status history
+        self.assertTrue(
+            LogEntry.objects.filter(
+                content_type=ContentType.objects.get_for_model(DomainRequest),
+                object_id=first.id,
+                changes__status__1=DomainRequest.DomainRequestStatus.APPROVED,
+            ).exists()
+        )
+
+    @less_console_noise_decorator
+    def test_bulk_approval_query_count(self):
+        """Approving many requests takes the same number of queries as approving a few"""
+
+        def approve(count, prefix):
+            domain_requests = [
+                completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED, name=f"{prefix}{i}.gov")
+                for i in range(count)
+            ]
+            queryset = DomainRequest.objects.filter(id__in=[domain_request.id for domain_request in domain_requests])
+            with CaptureQueriesContext(connection) as queries:
+                result = DomainRequestBulkApproval(send_email=False).approve(queryset)
+            self.assertEqual(len(result.approved), count)
+            return len(queries)
+
+        few_queries = approve(2, "few")
+        many_queries = approve(40, "many")
+        logger.info(f"Bulk approval queries: {few_queries} for 2 requests, {many_queries} for 40 requests")
+        self.assertLessEqual(many_queries, few_queries)
+
+    @less_console_noise_decorator
+    def test_change_form_only_renders_linked_relations(self):
+        """The change form only renders the websites and contacts linked to the request,
+        so its size and render time do not grow with the Website and Contact tables"""
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.IN_REVIEW)
+        url = "/admin/registrar/domainrequest/{}/change/".format(domain_request.pk)
+        self.client.force_login(self.superuser)
+
+        def render_change_form():
+            start = time.perf_counter()
+            response = self.client.get(url, follow=True)
+            elapsed = time.perf_counter() - start
+            self.assertEqual(response.status_code, 200)
+            return response, elapsed
+
+        small_response, small_elapsed = render_change_form()
+
+        unlinked_count = 500
+        Website.objects.bulk_create([Website(website=f"unlinked{i}.com") for i in range(unlinked_count)])
+        Contact.objects.bulk_create(
+            [Contact(first_name="Unlinked", last_name=f"Contact{i}") for i in range(unlinked_count)]
+        )
+        large_response, large_elapsed = render_change_form()
+
+        logger.info(
+            f"Domain request change form: {len(small_response.content)} bytes in {small_elapsed:.3f}s, "
+            f"{len(large_response.content)} bytes in {large_elapsed:.3f}s "
+            f"with {unlinked_count} more websites and contacts"
+        )
+        # The linked rows are still rendered
+        self.assertContains(large_response, "city.com")
+        self.assertContains(large_response, "city1.gov")
+        # But none of the others are
+        self.assertNotContains(large_response, "unlinked1.com")
+        self.assertNotContains(large_response, "Contact1")
+        self.assertLessEqual(len(large_response.content), len(small_response.content) + 1024)
+
+    @less_console_noise_decorator
+    def test_relation_autocomplete_is_searched_and_paginated(self):
+        """Websites and contacts for the change form are searched on the server, a page at a time"""
+        Website.objects.bulk_create([Website(website=f"searchable{i:02}.com") for i in range(30)])
+        Website.objects.create(website="other.com")
+        self.client.force_login(self.superuser)
+
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "registrar",
+                "model_name": "domainrequest",
+                "field_name": "current_websites",
+                "term": "searchable",
+            },
+        )
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(len(data["results"]), 20)
+        self.assertTrue(data["pagination"]["more"])
+        self.assertEqual(data["results"][0]["text"], "searchable00.com")
+
+        response = self.client.get(
+            reverse("admin:autocomplete"),
+            {
+                "app_label": "registrar",
+                "model_name": "domainrequest",
+                "field_name": "current_websites",
+                "term": "searchable",
+                "page": 2,
+            },
+        )
+        data = response.json()
+        self.assertEqual(len(data["results"]), 10)
+        self.assertFalse(data["pagination"]["more"])
+
     @less_console_noise_decorator
     def test_save_model_sends_rejected_email_purpose_not_met(self):
         """When transitioning to rejected on a domain request, an email is sent
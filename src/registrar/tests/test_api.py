@@ -1,3 +1,4 @@
+from unittest.mock import patch
 from django.urls import reverse
 from django.test import TestCase, Client
 from registrar.models import FederalAgency, SeniorOfficial, User, DomainRequest
@@ -5,6 +6,7 @@ from django.contrib.auth import get_user_model
 from registrar.tests.common import create_superuser, create_user, completed_domain_request
 
 from api.tests.common import less_console_noise_decorator
+from epplibwrapper.metrics import EPPMetrics
 from registrar.utility.constants import BranchChoices
 
 
@@ -244,3 +246,38 @@ class GetRejectionEmailForUserJsonTest(TestCase):
             },
         )
         self.assertEqual(response.status_code, 302)
+
+
+class GetEppMetricsJsonTest(TestCase):
+    def setUp(self):
+        self.client = Client()
+        self.superuser = create_superuser()
+        self.analyst_user = create_user()
+        p = "password"
+        self.user = get_user_model().objects.create_user(username="testuser", password=p)
+        self.api_url = reverse("get-epp-metrics-json")
+
+    def tearDown(self):
+        User.objects.all().delete()
+
+    @less_console_noise_decorator
+    def test_get_epp_metrics_json_analyst(self):
+        """Test that an analyst can fetch the EPP metrics."""
+        self.client.force_login(self.analyst_user)
+        metrics = EPPMetrics()
+        metrics.record_command("InfoDomain", seconds=0.05, lock_wait_seconds=0.01)
+        with patch("registrar.views.utility.api_views.EPP_METRICS", metrics):
+            response = self.client.get(self.api_url)
+        self.assertEqual(response.status_code, 200)
+        data = response.json()
+        self.assertEqual(data["reconnects"], 0)
+        self.assertEqual(data["commands"]["InfoDomain"]["count"], 1)
+        self.assertEqual(data["commands"]["InfoDomain"]["latency_ms"]["p50"], 50.0)
+
+    @less_console_noise_decorator
+    def test_get_epp_metrics_json_regular(self):
+        """Test that a regular user is redirected away from the EPP metrics."""
+        p = "password"
+        self.client.login(username="testuser", password=p)
+        response = self.client.get(self.api_url)
+        self.assertEqual(response.status_code, 302)
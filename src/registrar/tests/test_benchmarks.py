@@ -0,0 +1,54 @@
+from unittest.mock import Mock
+
+from django.test import TestCase
+
+from api.tests.common import less_console_noise_decorator
+from benchmarks.runner import BenchmarkResult, compare_reports, percentile, run_scenario
+
+
+class TestBenchmarkRunner(TestCase):
+    """Tests for how the benchmark runner measures scenarios and compares results"""
+
+    def test_percentile(self):
+        """Percentiles are taken by the nearest rank"""
+        values = list(range(1, 101))
+        self.assertEqual(percentile(values, 50), 50)
+        self.assertEqual(percentile(values, 95), 95)
+        self.assertEqual(percentile([3, 1, 2], 50), 2)
+        self.assertIsNone(percentile([], 50))
+
+    @less_console_noise_decorator
+    def test_run_scenario(self):
+        """Warmup iterations are not measured, and iterations with an error response are counted"""
+        run_iteration = Mock(side_effect=lambda i: [Mock(status_code=500 if i == 3 else 200)])
+
+        result = run_scenario("scenario", run_iteration, iterations=4, warmup=2)
+
+        self.assertEqual(run_iteration.call_count, 6)
+        summary = result.as_dict()
+        self.assertEqual(summary["iterations"], 4)
+        self.assertEqual(summary["warmup"], 2)
+        self.assertEqual(summary["errors"], 1)
+        self.assertIsNotNone(summary["throughput_per_second"])
+        self.assertLessEqual(summary["latency_ms"]["p50"], summary["latency_ms"]["p95"])
+
+    def test_compare_reports(self):
+        """Scenarios in both reports are compared, and ones with a much larger p95 are marked slower"""
+
+        def report(scale, **p95s):
+            scenarios = {}
+            for name, p95 in p95s.items():
+                result = BenchmarkResult(name=name, warmup=0, latencies_ms=[p95], total_seconds=p95 / 1000)
+                scenarios[name] = result.as_dict()
+            return {"commit": "abc", "scale": scale, "scenarios": scenarios}
+
+        baseline = report(100, steady=10.0, regressed=10.0, removed=10.0)
+        current = report(1000, steady=11.0, regressed=20.0, added=10.0)
+
+        lines = compare_reports(current, baseline)
+
+        self.assertEqual(len(lines), 3)
+        self.assertEqual(lines[0], "steady: p50 10.0ms -> 11.0ms (+10%), p95 10.0ms -> 11.0ms (+10%)")
+        self.assertTrue(lines[1].startswith("regressed:"))
+        self.assertTrue(lines[1].endswith("SLOWER"))
+        self.assertEqual(lines[2], "Note: the baseline was run at scale 100, not 1000")
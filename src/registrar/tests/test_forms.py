@@ -4,9 +4,12 @@ import json
 from django.test import TestCase, RequestFactory
 from api.views import available
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from registrar.forms.domain_request_wizard import (
     AlternativeDomainForm,
     CurrentSitesForm,
+    CurrentSitesFormSet,
     DotGovDomainForm,
     SeniorOfficialForm,
     OrganizationContactForm,
@@ -18,7 +21,8 @@ from registrar.forms.domain_request_wizard import (
     AboutYourOrganizationForm,
 )
 from registrar.forms.domain import ContactForm
-from registrar.tests.common import MockEppLib
+from registrar.models import DomainRequest, Website
+from registrar.tests.common import MockEppLib, completed_domain_request
 from django.contrib.auth import get_user_model
 
 
@@ -408,3 +412,58 @@ class TestContactForm(TestCase):
     def test_contact_form_email_invalid2(self):
         form = ContactForm(data={"email": "@"})
         self.assertEqual(form.errors["email"], ["Enter a valid email address."])
+
+
+class TestRegistrarFormSetToDatabase(TestCase):
+    """Test that formsets only write the rows which changed"""
+
+    def setUp(self):
+        self.domain_request = self._create_domain_request("city.gov")
+
+    def _create_domain_request(self, name):
+        """A domain request with two current websites"""
+        domain_request = completed_domain_request(has_current_website=False, name=name)
+        for website in ["http://a.com", "http://b.com"]:
+            domain_request.current_websites.add(Website.objects.create(website=website))
+        return domain_request
+
+    def tearDown(self):
+        DomainRequest.objects.all().delete()
+        Website.objects.all().delete()
+        get_user_model().objects.all().delete()
+
+    def _save_websites(self, websites):
+        """Saves a current websites formset with the given websites, returns the write queries made"""
+        data = {"form-TOTAL_FORMS": str(len(websites)), "form-INITIAL_FORMS": "2"}
+        for index, website in enumerate(websites):
+            data[f"form-{index}-website"] = website
+        formset = CurrentSitesFormSet(data, domain_request=self.domain_request)
+        self.assertTrue(formset.is_valid())
+
+        with CaptureQueriesContext(connection) as queries:
+            formset.to_database(self.domain_request)
+        return [query["sql"] for query in queries if query["sql"].split(" ", 1)[0] in ("INSERT", "UPDATE", "DELETE")]
+
+    def _saved_websites(self):
+        return list(self.domain_request.current_websites.order_by("website").values_list("website", flat=True))
+
+    def test_unchanged_rows_are_not_written(self):
+        """Only the domain request itself is saved when the formset did not change"""
+        writes = self._save_websites(["http://a.com", "http://b.com"])
+        self.assertEqual(len(writes), 1)
+        self.assertIn("registrar_domainrequest", writes[0])
+
+    def test_changes_are_applied(self):
+        """Changed, blank and new rows are updated, deleted and created"""
+        self._save_websites(["http://c.com", "", "http://d.com", "http://e.com"])
+        self.assertEqual(self._saved_websites(), ["http://c.com", "http://d.com", "http://e.com"])
+        self.assertFalse(Website.objects.filter(website="http://b.com").exists())
+
+    def test_write_count_does_not_grow_with_rows(self):
+        """New rows are created in bulk"""
+        one_new_row = self._save_websites(["http://a.com", "http://b.com", "http://new.com"])
+
+        self.domain_request = self._create_domain_request("city2.gov")
+        many_new_rows = self._save_websites(["http://a.com", "http://b.com"] + [f"http://{i}.com" for i in range(10)])
+
+        self.assertEqual(len(many_new_rows), len(one_new_row))
@@ -1,8 +1,11 @@
 import copy
+import io
+import os
 import boto3_mocking  # type: ignore
 from datetime import date, datetime, time
 from django.core.management import call_command
-from django.test import TestCase, override_settings
+from django.db import connection
+from django.test import TestCase, TransactionTestCase, override_settings
 from registrar.models.senior_official import SeniorOfficial
 from registrar.utility.constants import BranchChoices
 from django.utils import timezone
@@ -12,10 +15,13 @@ import pyzipper
 from django.core.management.base import CommandError
 from registrar.management.commands.clean_tables import Command as CleanTablesCommand
 from registrar.management.commands.export_tables import Command as ExportTablesCommand
+from registrar.management.commands.import_tables import Command as ImportTablesCommand
+from registrar.management.commands.update_first_ready import Command as UpdateFirstReadyCommand
 from registrar.models import (
     User,
     Domain,
     DomainRequest,
+    DomainRequestStatusChange,
     Contact,
     Website,
     DomainInvitation,
@@ -27,10 +33,12 @@ from registrar.models import (
     FederalAgency,
     Portfolio,
     Suborganization,
+    Host,
+    HostIP,
 )
 import tablib
-from unittest.mock import patch, call, MagicMock, mock_open
-from epplibwrapper import commands, common
+from unittest.mock import patch, call, MagicMock
+from epplibwrapper import commands, common, ErrorCode, RegistryError
 
 from .common import MockEppLib, less_console_noise, completed_domain_request, MockSESClient
 from api.tests.common import less_console_noise_decorator
@@ -136,6 +144,37 @@ class TestPopulateVerificationType(MockEppLib):
         self.assertEqual(self.untouched_user.verification_type, User.VerificationTypeChoices.GRANDFATHERED)
         self.assertEqual(self.fixture_user.verification_type, User.VerificationTypeChoices.FIXTURE_USER)
 
+    @less_console_noise_decorator
+    def test_verification_type_script_updates_in_batches(self):
+        """Ensures that records are saved in batches of batchSize"""
+        with patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+            return_value=True,
+        ):
+            with patch.object(User.objects, "bulk_update", wraps=User.objects.bulk_update) as bulk_update:
+                call_command("populate_verification_type", "--batchSize", "2")
+
+        # Every user without a verification type is updated, two at a time
+        self.assertFalse(User.objects.filter(verification_type__isnull=True).exists())
+        for batch_call in bulk_update.call_args_list:
+            self.assertLessEqual(len(batch_call.args[0]), 2)
+
+    @less_console_noise_decorator
+    def test_verification_type_script_resumes_from_pk(self):
+        """Ensures that records up to and including resumeFromPk are not processed"""
+        with patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+            return_value=True,
+        ):
+            call_command("populate_verification_type", "--resumeFromPk", str(self.grandfathered_user.pk))
+
+        self.regular_user.refresh_from_db()
+        self.grandfathered_user.refresh_from_db()
+        self.invited_user.refresh_from_db()
+        self.assertIsNone(self.regular_user.verification_type)
+        self.assertIsNone(self.grandfathered_user.verification_type)
+        self.assertEqual(self.invited_user.verification_type, User.VerificationTypeChoices.INVITED)
+
 
 class TestPopulateOrganizationType(MockEppLib):
     """Tests for the populate_organization_type script"""
@@ -550,6 +589,69 @@ class TestPopulateFirstReady(TestCase):
             self.assertEqual(first_ready, None)
 
 
+class TestUpdateFirstReady(TestCase):
+    """Tests for the update_first_ready script"""
+
+    @less_console_noise_decorator
+    def setUp(self):
+        """Creates ready domains with and without a transition domain"""
+        super().setUp()
+        self.created_at_date = date(2022, 12, 31)
+        created_at = timezone.make_aware(datetime.combine(self.created_at_date, time(12)), timezone=timezone.utc)
+
+        self.out_of_sync = self.create_domain("outofsync.gov", first_ready=date(2023, 6, 1), created_at=created_at)
+        self.missing = self.create_domain("missing.gov", first_ready=None, created_at=created_at)
+        self.in_sync = self.create_domain("insync.gov", first_ready=self.created_at_date, created_at=created_at)
+        self.not_transitioned = self.create_domain(
+            "nottransitioned.gov", first_ready=date(2023, 6, 1), created_at=created_at, transition_domain=False
+        )
+
+    def tearDown(self):
+        """Deletes all DB objects related to migrations"""
+        super().tearDown()
+        TransitionDomain.objects.all().delete()
+        Domain.objects.all().delete()
+
+    @staticmethod
+    def create_domain(name, first_ready, created_at, transition_domain=True):
+        domain = Domain.objects.create(name=name, state=Domain.State.READY, first_ready=first_ready)
+        # created_at is set on create, so it is overwritten afterwards
+        Domain.objects.filter(pk=domain.pk).update(created_at=created_at)
+        if transition_domain:
+            TransitionDomain.objects.create(username="test@igorville.gov", domain_name=name)
+        return domain
+
+    def run_update_first_ready(self):
+        with less_console_noise():
+            with patch(
+                "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+                return_value=True,
+            ):
+                call_command("update_first_ready")
+
+    @less_console_noise_decorator
+    def test_custom_filter_runs_in_the_database(self):
+        """The filter is a single query, run when the records are read"""
+        command = UpdateFirstReadyCommand()
+        with self.assertNumQueries(0):
+            records = command.custom_filter(Domain.objects.filter(state=Domain.State.READY))
+        with self.assertNumQueries(1):
+            names = sorted(records.values_list("name", flat=True))
+        self.assertEqual(names, ["missing.gov", "outofsync.gov"])
+
+    @less_console_noise_decorator
+    def test_update_first_ready(self):
+        """Only domains with a transition domain and an out of sync first_ready are updated"""
+        self.run_update_first_ready()
+
+        for domain in [self.out_of_sync, self.missing, self.in_sync]:
+            domain.refresh_from_db()
+            self.assertEqual(domain.first_ready, self.created_at_date)
+
+        self.not_transitioned.refresh_from_db()
+        self.assertEqual(self.not_transitioned.first_ready, date(2023, 6, 1))
+
+
 class TestPatchAgencyInfo(TestCase):
     @less_console_noise_decorator
     def setUp(self):
@@ -949,25 +1051,29 @@ class TestExportTables(MockEppLib):
     def tearDown(self):
         self.logger_patcher.stop()
 
-    @less_console_noise_decorator
-    @patch("os.makedirs")
-    @patch("os.path.exists")
-    @patch("os.remove")
-    @patch("pyzipper.AESZipFile")
-    @patch("registrar.management.commands.export_tables.getattr")
-    @patch("builtins.open", new_callable=mock_open)
-    @patch("os.listdir")
-    def test_handle(
-        self, mock_listdir, mock_open, mock_getattr, mock_zipfile, mock_remove, mock_path_exists, mock_makedirs
-    ):
-        """test that the handle method properly exports tables"""
-        # Mock os.makedirs to do nothing
-        mock_makedirs.return_value = None
+    def _mock_zip_entries(self, mock_zipfile):
+        """Captures the contents of every file written into the mocked zip archive"""
+        entries = {}
+
+        class ZipEntry(io.BytesIO):
+            def __init__(self, name):
+                super().__init__()
+                self.name = name
+
+            def close(self):
+                entries[self.name] = self.getvalue().decode("utf-8")
+                super().close()
 
-        # Mock os.path.exists to always return True
-        mock_path_exists.return_value = True
+        zipfile_instance = mock_zipfile.return_value.__enter__.return_value
+        zipfile_instance.open.side_effect = lambda name, mode: ZipEntry(name)
+        return entries
 
-        # Check that the export_table function was called for each table
+    @less_console_noise_decorator
+    @patch("registrar.management.commands.export_tables.os.makedirs")
+    @patch("registrar.management.commands.export_tables.pyzipper.AESZipFile")
+    def test_handle(self, mock_zipfile, mock_makedirs):
+        """test that the handle method streams every table into the zip archive"""
+        Website.objects.create(website="igorville.gov")
         table_names = [
             "User",
             "Contact",
@@ -982,42 +1088,49 @@ class TestExportTables(MockEppLib):
             "Host",
             "PublicContact",
         ]
+        entries = self._mock_zip_entries(mock_zipfile)
 
-        # Mock directory listing
-        mock_listdir.side_effect = lambda path: [f"{table}_1.csv" for table in table_names]
-
-        # Mock the resource class and its export method
-        mock_dataset = tablib.Dataset()
-        mock_dataset.headers = ["header1", "header2"]
-        mock_dataset.append(["row1_col1", "row1_col2"])
-        mock_resource_class = MagicMock()
-        mock_resource_class().export.return_value = mock_dataset
-        mock_getattr.return_value = mock_resource_class
-
-        command_instance = ExportTablesCommand()
-        command_instance.handle()
+        self.command.handle()
 
         # Check that os.makedirs was called once to create the tmp directory
         mock_makedirs.assert_called_once_with("tmp", exist_ok=True)
 
-        # Check that the CSV file was written
-        for table_name in table_names:
-            # Check that os.remove was called
-            mock_remove.assert_any_call(f"tmp/{table_name}_1.csv")
-
-        # Check that the zipfile was created and files were added
+        # Check that the zipfile was created and a file was added for each table,
+        # including the tables that are empty
         mock_zipfile.assert_called_once_with("tmp/exported_tables.zip", "w", compression=pyzipper.ZIP_DEFLATED)
-        zipfile_instance = mock_zipfile.return_value.__enter__.return_value
         for table_name in table_names:
-            zipfile_instance.write.assert_any_call(f"tmp/{table_name}_1.csv", f"{table_name}_1.csv")
+            self.assertIn(f"{table_name}_1.csv", entries)
+            self.logger_mock.info.assert_any_call(f"Adding {table_name}_1.csv to tmp/exported_tables.zip")
 
-        # Verify logging for added files
-        for table_name in table_names:
-            self.logger_mock.info.assert_any_call(f"Added {table_name}_1.csv to tmp/exported_files.zip")
+        # Check that the exported file can be read back by import_tables
+        dataset = tablib.Dataset().load(entries["Website_1.csv"], format="csv")
+        self.assertIn("website", dataset.headers)
+        self.assertEqual(dataset["website"], ["igorville.gov"])
 
-        # Verify logging for removed files
-        for table_name in table_names:
-            self.logger_mock.info.assert_any_call(f"Removed {table_name}_1.csv")
+    @less_console_noise_decorator
+    @patch("registrar.management.commands.export_tables.pyzipper.AESZipFile")
+    def test_export_table_splits_rows_into_files(self, mock_zipfile):
+        """test that export_table writes at most rows_per_file rows to each file"""
+        for name in ["city1.gov", "city2.gov", "city3.gov", "city4.gov", "city5.gov"]:
+            Website.objects.create(website=name)
+        entries = self._mock_zip_entries(mock_zipfile)
+        zipf = mock_zipfile.return_value.__enter__.return_value
+
+        self.command.rows_per_file = 2
+        self.command.chunk_size = 1
+        filenames = self.command.export_table(
+            "Website", open_chunk=lambda filename: self.command.open_zip_entry(zipf, filename)
+        )
+
+        self.assertEqual(filenames, ["Website_1.csv", "Website_2.csv", "Website_3.csv"])
+        exported = []
+        for filename in filenames:
+            dataset = tablib.Dataset().load(entries[filename], format="csv")
+            self.assertLessEqual(len(dataset), 2)
+            exported.extend(dataset["website"])
+
+        # Rows are written in primary key order, without duplicates or gaps
+        self.assertEqual(exported, ["city1.gov", "city2.gov", "city3.gov", "city4.gov", "city5.gov"])
 
     @patch("registrar.management.commands.export_tables.getattr")
     def test_export_table_handles_missing_resource_class(self, mock_getattr):
@@ -1039,7 +1152,7 @@ class TestExportTables(MockEppLib):
         """Test that general exceptions in the handle method are handled correctly"""
         with less_console_noise():
             mock_resource_class = MagicMock()
-            mock_resource_class().export.side_effect = Exception("Test Exception")
+            mock_resource_class().get_queryset.side_effect = Exception("Test Exception")
             mock_getattr.return_value = mock_resource_class
 
             # Import the command to avoid any locale or gettext issues
@@ -1050,6 +1163,57 @@ class TestExportTables(MockEppLib):
             self.logger_mock.error.assert_called_with("Failed to export TestTable: Test Exception")
 
 
+class TestExportTablesInParallel(TransactionTestCase):
+    """Test the export_tables script with worker processes.
+    The workers have their own database connections, so the test data has to be committed."""
+
+    # Restores the rows created by data migrations after the tables are flushed
+    serialized_rollback = True
+
+    def tearDown(self):
+        super().tearDown()
+        if os.path.exists("tmp/exported_tables.zip"):
+            os.remove("tmp/exported_tables.zip")
+
+    def _export(self, *args):
+        """Runs export_tables and returns the rows of each table, across all of its files, and the file names"""
+        call_command("export_tables", *args)
+
+        def file_order(filename):
+            table_name, number = filename.removesuffix(".csv").rsplit("_", 1)
+            return table_name, int(number)
+
+        rows_by_table = {}
+        with pyzipper.AESZipFile("tmp/exported_tables.zip", "r") as zipf:
+            filenames = sorted(zipf.namelist(), key=file_order)
+            for filename in filenames:
+                table_name, _ = file_order(filename)
+                dataset = tablib.Dataset().load(zipf.read(filename).decode("utf-8"), format="csv")
+                rows_by_table.setdefault(table_name, []).extend(dataset.dict)
+        return rows_by_table, filenames
+
+    @less_console_noise_decorator
+    def test_parallel_export_matches_single_worker(self):
+        """test that exporting with several workers and small files writes the same rows as one worker"""
+        websites = [f"parallel{i}.gov" for i in range(5)]
+        for website in websites:
+            Website.objects.create(website=website)
+        # Adds two more websites, and rows with foreign keys and many to many relations
+        completed_domain_request(name="parallel.gov")
+
+        parallel_rows, parallel_files = self._export("--workers", "2", "--rowsPerFile", "2")
+        single_rows, _ = self._export("--workers", "1", "--rowsPerFile", "2")
+
+        # 7 websites are split into files of at most 2 rows
+        self.assertEqual(
+            [filename for filename in parallel_files if filename.startswith("Website_")],
+            ["Website_1.csv", "Website_2.csv", "Website_3.csv", "Website_4.csv"],
+        )
+        self.assertEqual([row["website"] for row in parallel_rows["Website"]][:5], websites)
+        self.assertEqual(len(parallel_rows["DomainRequest"]), 1)
+        self.assertEqual(parallel_rows, single_rows)
+
+
 class TestImportTables(TestCase):
     """Test the import_tables script"""
 
@@ -1177,6 +1341,100 @@ class TestImportTables(TestCase):
             # Check that logger.error was called with the correct message
             mock_logger.error.assert_called_once_with("Zip file tmp/exported_tables.zip does not exist.")
 
+    @less_console_noise_decorator
+    def test_copy_import_table(self):
+        """Test that copy_import_table bulk loads new rows, updates existing rows and resets the sequence"""
+        existing = Website.objects.create(website="old.gov")
+        os.makedirs("tmp", exist_ok=True)
+        with open("tmp/Website_1.csv", "w", newline="") as csvfile:
+            csvfile.write("id,created_at,updated_at,website\r\n")
+            csvfile.write(f"{existing.id},2024-01-01 00:00:00,2024-01-01 00:00:00,updated.gov\r\n")
+            csvfile.write(f"{existing.id + 100},2024-01-01 00:00:00,2024-01-01 00:00:00,new.gov\r\n")
+
+        command = ImportTablesCommand()
+        command.reset_sequences = True
+        command.verify = True
+        with patch("registrar.management.commands.import_tables.logger") as mock_logger:
+            command.copy_import_table("Website")
+            logged = [str(info_call.args[0]) for info_call in mock_logger.info.call_args_list]
+            self.assertTrue(any(message.startswith("Verified 2 rows of Website") for message in logged))
+
+        existing.refresh_from_db()
+        self.assertEqual(existing.website, "updated.gov")
+        self.assertTrue(Website.objects.filter(id=existing.id + 100, website="new.gov").exists())
+        self.assertFalse(os.path.exists("tmp/Website_1.csv"))
+
+        # New rows are created after the largest imported id
+        self.assertGreater(Website.objects.create(website="next.gov").id, existing.id + 100)
+
+    def _domain_request_rows(self):
+        """Returns the stored values of every domain request, with the ids of its many to many relations.
+        Exported datetimes are only precise to the second."""
+
+        def exported_value(value):
+            return value.replace(microsecond=0) if isinstance(value, datetime) else value
+
+        rows = []
+        for domain_request in DomainRequest.objects.order_by("pk"):
+            row = {
+                field.attname: exported_value(getattr(domain_request, field.attname))
+                for field in DomainRequest._meta.concrete_fields
+            }
+            for field in DomainRequest._meta.many_to_many:
+                row[field.name] = sorted(getattr(domain_request, field.name).values_list("pk", flat=True))
+            rows.append(row)
+        return rows
+
+    def _sequence_value(self, model):
+        """Returns the last value of the model's primary key sequence"""
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT pg_get_serial_sequence(%s, %s)", [model._meta.db_table, model._meta.pk.column])
+            sequence = cursor.fetchone()[0]
+            cursor.execute(f"SELECT last_value FROM {sequence}")
+            return sequence, cursor.fetchone()[0]
+
+    @less_console_noise_decorator
+    def test_copy_import_round_trip(self):
+        """Test that domain requests exported by export_tables are imported unchanged by import_tables --copy,
+        including foreign keys, booleans, datetimes and many to many relations, and that sequences are reset"""
+        completed_domain_request(name="roundtrip1.gov", status=DomainRequest.DomainRequestStatus.SUBMITTED)
+        completed_domain_request(
+            name="roundtrip2.gov", is_election_board=True, has_other_contacts=False, has_anything_else=False
+        )
+        expected = self._domain_request_rows()
+        largest_id = expected[-1]["id"]
+
+        call_command("export_tables")
+        self.addCleanup(os.remove, "tmp/exported_tables.zip")
+
+        # Remove the domain requests and their relations, and move the sequence back,
+        # so the import has to recreate the rows and reset the sequence itself
+        DomainRequest.objects.all().delete()
+        sequence, _ = self._sequence_value(DomainRequest)
+        with connection.cursor() as cursor:
+            cursor.execute("SELECT setval(%s, 1, false)", [sequence])
+
+        with patch("registrar.management.commands.import_tables.logger") as mock_logger:
+            call_command("import_tables", "--copy", "--verify", "--resetSequences")
+
+        mock_logger.error.assert_not_called()
+        logged = [str(info_call.args[0]) for info_call in mock_logger.info.call_args_list]
+        self.assertTrue(any(message.startswith("Verified 2 rows of DomainRequest") for message in logged))
+
+        self.assertEqual(self._domain_request_rows(), expected)
+        self.assertEqual(self._sequence_value(DomainRequest), (sequence, largest_id))
+        self.assertGreater(completed_domain_request(name="roundtrip3.gov").id, largest_id)
+
+    @patch("registrar.management.commands.import_tables.logger")
+    def test_handle_copy_requires_skip_epp_save(self, mock_logger):
+        """Test that --copy refuses to run when PublicContacts should be saved to the registry"""
+        with less_console_noise():
+            call_command("import_tables", "--copy", "--no-skipEppSave")
+
+            mock_logger.error.assert_called_once_with(
+                "--copy loads rows directly into the database and cannot be combined with --no-skipEppSave"
+            )
+
 
 class TestTransferFederalAgencyType(TestCase):
     """Tests for the transfer_federal_agency_type script"""
@@ -1547,3 +1805,206 @@ class TestCreateFederalPortfolio(TestCase):
         # Notes and creator should be untouched
         self.assertEqual(existing_portfolio.notes, "Old notes")
         self.assertEqual(existing_portfolio.creator, self.user)
+
+
+class TestPopulateDomainRequestStatusHistory(MockEppLib):
+    """Tests for the populate_domain_request_status_history command"""
+
+    @less_console_noise_decorator
+    def setUp(self):
+        super().setUp()
+        self.domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED)
+        self.domain_request.in_review()
+        self.domain_request.save()
+        self.domain_request.action_needed()
+        self.domain_request.action_needed_reason = DomainRequest.ActionNeededReasons.ALREADY_HAS_DOMAINS
+        self.domain_request.save()
+        self.domain_request.reject()
+        self.domain_request.rejection_reason = DomainRequest.RejectionReasons.DOMAIN_PURPOSE
+        self.domain_request.save()
+
+    def tearDown(self):
+        super().tearDown()
+        DomainInformation.objects.all().delete()
+        DomainRequest.objects.all().delete()
+        Domain.objects.all().delete()
+        Contact.objects.all().delete()
+        Website.objects.all().delete()
+        User.objects.all().delete()
+
+    @less_console_noise_decorator
+    def run_populate_domain_request_status_history(self):
+        with patch(
+            "registrar.management.commands.utility.terminal_helper.TerminalHelper.query_yes_no_exit",  # noqa
+            return_value=True,
+        ):
+            call_command("populate_domain_request_status_history")
+
+    def get_status_history(self):
+        return list(
+            DomainRequestStatusChange.objects.filter(domain_request=self.domain_request)
+            .order_by("changed_at", "id")
+            .values_list("status", "rejection_reason", "action_needed_reason")
+        )
+
+    def test_populate_status_history_from_audit_log(self):
+        """The status history created from the audit log matches the one recorded on save"""
+        expected_history = self.get_status_history()
+        self.assertEqual(
+            [status for status, _, _ in expected_history],
+            [
+                DomainRequest.DomainRequestStatus.SUBMITTED,
+                DomainRequest.DomainRequestStatus.IN_REVIEW,
+                DomainRequest.DomainRequestStatus.ACTION_NEEDED,
+                DomainRequest.DomainRequestStatus.REJECTED,
+            ],
+        )
+
+        DomainRequestStatusChange.objects.all().delete()
+        self.run_populate_domain_request_status_history()
+
+        self.assertEqual(self.get_status_history(), expected_history)
+
+    def test_populate_status_history_does_not_duplicate_history(self):
+        """Audit log entries for status changes which were already recorded are not copied again"""
+        expected_history = self.get_status_history()
+
+        self.run_populate_domain_request_status_history()
+        self.run_populate_domain_request_status_history()
+
+        self.assertEqual(self.get_status_history(), expected_history)
+
+    @less_console_noise_decorator
+    def test_populate_status_history_before_changes_since_deploy(self):
+        """A domain request changed after the deploy, and before the command ran, gets its
+        older history from the audit log, ahead of the change recorded since"""
+        expected_history = self.get_status_history()
+        DomainRequestStatusChange.objects.all().delete()
+
+        # Changed after the deploy, which records a status change on save
+        self.domain_request.rejection_reason = DomainRequest.RejectionReasons.NAMING_REQUIREMENTS
+        self.domain_request.save()
+        changes_since_deploy = self.get_status_history()
+        self.assertEqual(len(changes_since_deploy), 1)
+
+        self.run_populate_domain_request_status_history()
+
+        self.assertEqual(self.get_status_history(), expected_history + changes_since_deploy)
+
+
+class TestSyncDomainsFromRegistry(MockEppLib):
+    """Tests for the sync_domains_from_registry command"""
+
+    def setUp(self):
+        super().setUp()
+        self.domain = Domain.objects.create(
+            name="fake.gov", state=Domain.State.READY, expiration_date=date(2022, 5, 25)
+        )
+        self.deleted_domain = Domain.objects.create(name="deletedsync.gov", state=Domain.State.DELETED)
+
+    def tearDown(self):
+        PublicContact.objects.all().delete()
+        HostIP.objects.all().delete()
+        Host.objects.all().delete()
+        Domain.objects.all().delete()
+        super().tearDown()
+
+    def run_sync_domains_from_registry(self, **options):
+        with less_console_noise():
+            call_command("sync_domains_from_registry", maxDomainsPerSecond=0, **options)
+
+    def sent_command_types(self):
+        return [type(sent_call.args[0]) for sent_call in self.mockedSendFunction.call_args_list]
+
+    def test_sync_updates_domain_from_registry(self):
+        """Syncing stores the registry's expiration date, hosts and contacts for the domain"""
+        self.run_sync_domains_from_registry()
+
+        self.domain.refresh_from_db()
+        self.assertEqual(self.domain.expiration_date, date(2023, 5, 25))
+        self.assertEqual(self.domain.security_contact_registry_id, "securityContact")
+        self.assertIsNotNone(self.domain.last_synced_at)
+        self.assertIsNotNone(self.domain.registry_data_hash)
+        self.assertTrue(Host.objects.filter(domain=self.domain, name="fake.host.com").exists())
+        self.assertTrue(PublicContact.objects.filter(domain=self.domain, registry_id="securityContact").exists())
+
+        self.deleted_domain.refresh_from_db()
+        self.assertIsNone(self.deleted_domain.last_synced_at)
+
+    def test_sync_of_unchanged_domain_only_fetches_domain_info(self):
+        """When the registry data is unchanged since the last sync, only last_synced_at is updated"""
+        self.run_sync_domains_from_registry()
+        self.domain.refresh_from_db()
+        first_synced_at = self.domain.last_synced_at
+        self.mockedSendFunction.reset_mock()
+
+        self.run_sync_domains_from_registry(syncedBeforeHours=0)
+
+        self.assertEqual(self.sent_command_types(), [commands.InfoDomain])
+        self.domain.refresh_from_db()
+        self.assertGreater(self.domain.last_synced_at, first_synced_at)
+
+    def test_force_fetches_hosts_and_contacts(self):
+        """With --force, the hosts and contacts are fetched even when the registry data is unchanged"""
+        self.run_sync_domains_from_registry()
+        self.mockedSendFunction.reset_mock()
+
+        self.run_sync_domains_from_registry(syncedBeforeHours=0, force=True)
+
+        self.assertIn(commands.InfoHost, self.sent_command_types())
+        self.assertIn(commands.InfoContact, self.sent_command_types())
+
+    def test_recently_synced_domains_are_skipped(self):
+        """Domains synced within --syncedBeforeHours are not synced again"""
+        self.run_sync_domains_from_registry()
+        self.mockedSendFunction.reset_mock()
+
+        self.run_sync_domains_from_registry()
+
+        self.mockedSendFunction.assert_not_called()
+
+    def test_sync_continues_past_registry_errors(self):
+        """A domain the registry fails on is left unsynced, without stopping the others"""
+        failing_domain = Domain.objects.create(name="failingsync.gov", state=Domain.State.READY)
+
+        def side_effect(_request, cleaned):
+            if isinstance(_request, commands.InfoDomain) and _request.name == "failingsync.gov":
+                raise RegistryError(code=ErrorCode.COMMAND_FAILED)
+            return self.mockSend(_request, cleaned)
+
+        self.mockedSendFunction.side_effect = side_effect
+        self.run_sync_domains_from_registry()
+
+        failing_domain.refresh_from_db()
+        self.assertIsNone(failing_domain.last_synced_at)
+        self.domain.refresh_from_db()
+        self.assertIsNotNone(self.domain.last_synced_at)
+
+    def test_unknown_domains_are_not_synced(self):
+        """Domains in the unknown state are left out of the sync"""
+        unknown_domain = Domain.objects.create(name="unknownsync.gov", state=Domain.State.UNKNOWN)
+
+        self.run_sync_domains_from_registry()
+
+        unknown_domain.refresh_from_db()
+        self.assertIsNone(unknown_domain.last_synced_at)
+        self.assertEqual(unknown_domain.state, Domain.State.UNKNOWN)
+        self.assertNotIn(commands.CreateDomain, self.sent_command_types())
+
+    def test_domain_missing_from_registry_is_skipped(self):
+        """A domain the registry does not have is skipped, and not created in the registry"""
+        missing_domain = Domain.objects.create(name="missingsync.gov", state=Domain.State.READY)
+
+        def side_effect(_request, cleaned):
+            if isinstance(_request, commands.InfoDomain) and _request.name == "missingsync.gov":
+                raise RegistryError(code=ErrorCode.OBJECT_DOES_NOT_EXIST)
+            return self.mockSend(_request, cleaned)
+
+        self.mockedSendFunction.side_effect = side_effect
+        self.run_sync_domains_from_registry()
+
+        self.assertNotIn(commands.CreateDomain, self.sent_command_types())
+        missing_domain.refresh_from_db()
+        self.assertEqual(missing_domain.state, Domain.State.READY)
+        self.assertIsNotNone(missing_domain.last_synced_at)
+        self.assertIsNone(missing_domain.registry_data_hash)
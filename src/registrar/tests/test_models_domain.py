@@ -4,7 +4,9 @@ Feature being tested: Registry Integration
 This file tests the various ways in which the registrar interacts with the registry.
 """
 
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 from django.db.utils import IntegrityError
 from unittest.mock import MagicMock, patch, call
 import datetime
@@ -259,6 +261,37 @@ class TestDomainCache(MockEppLib):
             self.assertEqual(cached_contact, in_db.registry_id)
             self.assertEqual(domain.security_contact.email, "123test@mail.gov")
 
+    def test_get_or_create_public_contacts(self):
+        """
+        Scenario: Contacts fetched from the registry are stored together
+            When some of a domain's contacts are already stored
+            Then the missing contacts are created, a contact passed twice is stored once,
+                and the stored contacts are found in one query afterwards
+        """
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="bulkcontacts.gov")
+            contacts = [
+                PublicContact.get_default_administrative(),
+                PublicContact.get_default_technical(),
+                PublicContact.get_default_security(),
+            ]
+            for contact in contacts:
+                contact.domain = domain
+            contacts[0].save(skip_epp_save=True)
+
+            in_db = domain._get_or_create_public_contacts(contacts + [contacts[1]])
+
+            self.assertEqual(
+                set(in_db.keys()),
+                {(contact.registry_id, contact.contact_type) for contact in contacts},
+            )
+            self.assertEqual(in_db[(contacts[0].registry_id, contacts[0].contact_type)].id, contacts[0].id)
+            self.assertEqual(PublicContact.objects.filter(domain=domain).count(), 3)
+
+            with self.assertNumQueries(1):
+                in_db_again = domain._get_or_create_public_contacts(contacts)
+            self.assertEqual(in_db_again, in_db)
+
     def test_errors_map_epp_contact_to_public_contact(self):
         """
         Scenario: Registrant gets invalid data from EPPLib
@@ -599,6 +632,44 @@ class TestDomainAvailable(MockEppLib):
             self.assertFalse(available)
             patcher.stop()
 
+    def test_domain_available_many(self):
+        """
+        Scenario: Testing the availability of several domains at once
+            Should return the availability of each domain
+
+            Validate a single CheckDomain command is called with every domain
+        """
+
+        def side_effect(_request, cleaned):
+            return MagicMock(
+                res_data=[
+                    responses.check.CheckDomainResultData(name="available.gov", avail=True, reason=None),
+                    responses.check.CheckDomainResultData(name="unavailable.gov", avail=False, reason="In Use"),
+                ],
+            )
+
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                mocked_send.side_effect = side_effect
+
+                available = Domain.available_many(["Available.gov", "unavailable.gov"])
+                mocked_send.assert_called_once_with(
+                    commands.CheckDomain(["available.gov", "unavailable.gov"]),
+                    cleaned=True,
+                )
+                self.assertEqual(available, {"available.gov": True, "unavailable.gov": False})
+
+    def test_domain_available_many_with_invalid_error(self):
+        """
+        Scenario: Testing the availability of several domains when one is invalid
+            Should throw InvalidDomainError without contacting the registry
+        """
+        with less_console_noise():
+            with patch("registrar.models.domain.registry.send") as mocked_send:
+                with self.assertRaises(errors.InvalidDomainError):
+                    Domain.available_many(["available.gov", "invalid-string"])
+                mocked_send.assert_not_called()
+
     def test_domain_available_with_invalid_error(self):
         """
         Scenario: Testing whether an invalid domain is available
@@ -873,7 +944,7 @@ class TestRegistrantContacts(MockEppLib):
     def test_security_email_stored_on_fetch_cache(self):
         """
         Scenario: Security email is stored in db when security contact is retrieved from fetch_cache.
-            Verify the success of this by asserting get_or_create calls to db.
+            Verify the success of this by checking the hosts and ips stored.
             The mocked data for the EPP calls for the freeman.gov domain returns a security
             contact with registry id of securityContact when InfoContact is called
         """
@@ -1692,21 +1763,10 @@ class TestRegistrantNameservers(MockEppLib):
             # make the domain
             domain, _ = Domain.objects.get_or_create(name="meow.gov", state=Domain.State.READY)
 
-            # mock the get_or_create methods for Host and HostIP
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.meow.gov")
-                # Retrieve the mocked_host from the return value of the mock
-                actual_mocked_host, _ = mock_host_get_or_create.return_value
-                mock_host_ip_get_or_create.assert_called_with(address="2.0.0.8", host=actual_mocked_host)
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 1)
+            self.assertStoredHosts(domain, {"fake.meow.gov": ["2.0.0.8"]})
 
     def test_nameservers_stored_on_fetch_cache_a_subdomain_without_ip(self):
         """
@@ -1717,19 +1777,10 @@ class TestRegistrantNameservers(MockEppLib):
             # make the domain
             domain, _ = Domain.objects.get_or_create(name="subdomainwoip.gov", state=Domain.State.READY)
 
-            # mock the get_or_create methods for Host and HostIP
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.subdomainwoip.gov")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+            self.assertStoredHosts(domain, {"fake.subdomainwoip.gov": []})
 
     def test_nameservers_stored_on_fetch_cache_not_subdomain_with_ip(self):
         """
@@ -1745,18 +1796,10 @@ class TestRegistrantNameservers(MockEppLib):
         with less_console_noise():
             domain, _ = Domain.objects.get_or_create(name="fake.gov", state=Domain.State.READY)
 
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
-
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
 
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.host.com")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+            self.assertStoredHosts(domain, {"fake.host.com": []})
 
     def test_nameservers_stored_on_fetch_cache_not_subdomain_without_ip(self):
         """
@@ -1766,17 +1809,95 @@ class TestRegistrantNameservers(MockEppLib):
         with less_console_noise():
             domain, _ = Domain.objects.get_or_create(name="fakemeow.gov", state=Domain.State.READY)
 
-            with patch.object(Host.objects, "get_or_create") as mock_host_get_or_create, patch.object(
-                HostIP.objects, "get_or_create"
-            ) as mock_host_ip_get_or_create:
-                mock_host_get_or_create.return_value = (Host(domain=domain), True)
-                mock_host_ip_get_or_create.return_value = (HostIP(), True)
+            # force fetch_cache to be called, which will return above documented mocked hosts
+            domain.nameservers
+
+            self.assertStoredHosts(domain, {"fake.meow.com": []})
+
+    def test_update_hosts_and_ips_in_db_reconciles_stored_hosts(self):
+        """
+        Scenario: Hosts and ips already stored for a domain differ from the registry
+            When the hosts are fetched from the registry
+            Then stale hosts and ips are deleted, missing ones are created, and the rest are kept
+        """
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="reconcile.gov", state=Domain.State.READY)
+            kept_host = Host.objects.create(domain=domain, name="ns1.reconcile.gov")
+            kept_ip = HostIP.objects.create(host=kept_host, address="1.1.1.1")
+            HostIP.objects.create(host=kept_host, address="2.2.2.2")
+            stale_host = Host.objects.create(domain=domain, name="ns9.reconcile.gov")
+            HostIP.objects.create(host=stale_host, address="9.9.9.9")
+
+            domain._update_hosts_and_ips_in_db(
+                {
+                    "hosts": [
+                        {"name": "ns1.reconcile.gov", "addrs": ["1.1.1.1", "3.3.3.3"]},
+                        {"name": "ns2.reconcile.gov", "addrs": ["4.4.4.4"]},
+                        {"name": "ns1.example.com", "addrs": ["5.5.5.5"]},
+                    ]
+                }
+            )
+
+            self.assertStoredHosts(
+                domain,
+                {
+                    "ns1.reconcile.gov": ["1.1.1.1", "3.3.3.3"],
+                    "ns2.reconcile.gov": ["4.4.4.4"],
+                    "ns1.example.com": [],
+                },
+            )
+            self.assertTrue(Host.objects.filter(id=kept_host.id).exists())
+            self.assertTrue(HostIP.objects.filter(id=kept_ip.id).exists())
+            self.assertFalse(Host.objects.filter(id=stale_host.id).exists())
+
+    def test_update_hosts_and_ips_in_db_skips_writes_when_unchanged(self):
+        """
+        Scenario: The hosts and ips stored for a domain already match the registry
+            When the hosts are fetched from the registry
+            Then the stored hosts are read in a fixed number of queries and nothing is written
+        """
+        with less_console_noise():
+            domain, _ = Domain.objects.get_or_create(name="unchanged.gov", state=Domain.State.READY)
+            cleaned = {
+                "hosts": [{"name": f"ns{i}.unchanged.gov", "addrs": [f"1.1.1.{i}", f"2.2.2.{i}"]} for i in range(10)]
+            }
+            domain._update_hosts_and_ips_in_db(cleaned)
+
+            with CaptureQueriesContext(connection) as queries:
+                domain._update_hosts_and_ips_in_db(cleaned)
+
+            # One query for the hosts, and one for their ips
+            self.assertEqual(len(queries), 2)
+            self.assertEqual(HostIP.objects.filter(host__domain=domain).count(), 20)
 
-                # force fetch_cache to be called, which will return above documented mocked hosts
-                domain.nameservers
-                mock_host_get_or_create.assert_called_once_with(domain=domain, name="fake.meow.com")
-                mock_host_ip_get_or_create.assert_not_called()
-                self.assertEqual(mock_host_ip_get_or_create.call_count, 0)
+    def test_update_hosts_and_ips_in_db_query_count(self):
+        """
+        Scenario: The ips of a domain's nameservers are replaced in the registry
+            When the hosts are fetched from the registry
+            Then the same number of queries are made however many ips are replaced
+        """
+        with less_console_noise():
+
+            def count_replacement_queries(domain, host_count):
+                def hosts(address_prefix, extra_host=False):
+                    hosts = [
+                        {"name": f"ns{i}.{domain.name}", "addrs": [f"{address_prefix}.{i}"]} for i in range(host_count)
+                    ]
+                    if extra_host:
+                        hosts.append({"name": f"extra.{domain.name}", "addrs": [f"{address_prefix}.255"]})
+                    return {"hosts": hosts}
+
+                domain._update_hosts_and_ips_in_db(hosts("1.1.1"))
+                with CaptureQueriesContext(connection) as queries:
+                    domain._update_hosts_and_ips_in_db(hosts("2.2.2", extra_host=True))
+                self.assertEqual(Host.objects.filter(domain=domain).count(), host_count + 1)
+                self.assertFalse(HostIP.objects.filter(host__domain=domain, address__startswith="1.1.1").exists())
+                return len(queries)
+
+            few, _ = Domain.objects.get_or_create(name="few.gov", state=Domain.State.READY)
+            many, _ = Domain.objects.get_or_create(name="many.gov", state=Domain.State.READY)
+
+            self.assertEqual(count_replacement_queries(few, 2), count_replacement_queries(many, 20))
 
     @skip("not implemented yet")
     def test_update_is_unsuccessful(self):
@@ -1795,6 +1916,14 @@ class TestRegistrantNameservers(MockEppLib):
         with self.assertRaises(RegistryError):
             domain.nameservers = [("ns1.failednameserver.gov", ["4.5.6"])]
 
+    def assertStoredHosts(self, domain, expected):
+        """Asserts that the hosts stored for domain, and their ips, are those in expected"""
+        stored = {
+            host.name: sorted(host_ip.address for host_ip in host.ip.all())
+            for host in Host.objects.filter(domain=domain).prefetch_related("ip")
+        }
+        self.assertEqual(stored, {name: sorted(addresses) for name, addresses in expected.items()})
+
     def tearDown(self):
         HostIP.objects.all().delete()
         Host.objects.all().delete()
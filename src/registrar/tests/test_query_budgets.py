@@ -0,0 +1,203 @@
+"""
+Query budget tests: each view is requested at two data sizes, and fails if it makes more
+queries with more data. This catches N+1 queries, which the behavior tests do not.
+
+To cover a new list view, add a test which seeds its data with ScaledDataFactory
+(or its own seed function) and calls assertQueryCountConstant.
+"""
+
+from django.test import Client
+from django.urls import reverse
+from waffle.testutils import override_flag
+
+from api.tests.common import less_console_noise_decorator
+from registrar.models import (
+    Contact,
+    Domain,
+    DomainInformation,
+    DomainInvitation,
+    DomainRequest,
+    DraftDomain,
+    Portfolio,
+    PortfolioInvitation,
+    User,
+    UserDomainRole,
+    UserPortfolioPermission,
+    Website,
+)
+from registrar.models.utility.portfolio_helper import UserPortfolioPermissionChoices, UserPortfolioRoleChoices
+from .common import (
+    MockEppLib,
+    QueryBudgetMixin,
+    ScaledDataFactory,
+    completed_domain_request,
+    create_superuser,
+    create_test_user,
+)
+
+
+class TestQueryBudgets(QueryBudgetMixin, MockEppLib):
+    """The registrar's list views make the same number of queries however much data they list"""
+
+    def setUp(self):
+        super().setUp()
+        self.user = create_test_user()
+        self.portfolio = Portfolio.objects.create(creator=self.user, organization_name="Budget org")
+        UserPortfolioPermission.objects.create(
+            user=self.user,
+            portfolio=self.portfolio,
+            roles=[UserPortfolioRoleChoices.ORGANIZATION_ADMIN],
+            additional_permissions=[
+                UserPortfolioPermissionChoices.VIEW_MEMBERS,
+                UserPortfolioPermissionChoices.EDIT_MEMBERS,
+            ],
+        )
+        self.data = ScaledDataFactory(self.user, self.portfolio)
+        self.client = Client()
+        self.client.force_login(self.user)
+
+    def tearDown(self):
+        super().tearDown()
+        DomainInvitation.objects.all().delete()
+        PortfolioInvitation.objects.all().delete()
+        UserDomainRole.objects.all().delete()
+        UserPortfolioPermission.objects.all().delete()
+        DomainRequest.objects.all().delete()
+        DomainInformation.objects.all().delete()
+        Domain.objects.all().delete()
+        DraftDomain.objects.all().delete()
+        Portfolio.objects.all().delete()
+        Contact.objects.all().delete()
+        Website.objects.all().delete()
+        User.objects.all().delete()
+
+    def get_json(self, url_name, **params):
+        return self.client.get(reverse(url_name), params)
+
+    @less_console_noise_decorator
+    def test_domains_json(self):
+        """The user's domains"""
+        self.assertQueryCountConstant("get_domains_json", lambda: self.get_json("get_domains_json"), self.data.seed)
+
+    @less_console_noise_decorator
+    @override_flag("organization_feature", active=True)
+    def test_domains_json_portfolio(self):
+        """The domains of the user's portfolio"""
+        self.assertQueryCountConstant(
+            "get_domains_json (portfolio)",
+            lambda: self.get_json("get_domains_json", portfolio=self.portfolio.id),
+            self.data.seed,
+        )
+
+    @less_console_noise_decorator
+    def test_domain_requests_json(self):
+        """The user's domain requests"""
+        self.assertQueryCountConstant(
+            "get_domain_requests_json", lambda: self.get_json("get_domain_requests_json"), self.data.seed
+        )
+
+    @less_console_noise_decorator
+    @override_flag("organization_feature", active=True)
+    @override_flag("organization_requests", active=True)
+    def test_domain_requests_json_portfolio(self):
+        """The domain requests of the user's portfolio"""
+        self.assertQueryCountConstant(
+            "get_domain_requests_json (portfolio)",
+            lambda: self.get_json("get_domain_requests_json", portfolio=self.portfolio.id),
+            self.data.seed,
+        )
+
+    @less_console_noise_decorator
+    @override_flag("organization_feature", active=True)
+    @override_flag("organization_members", active=True)
+    def test_portfolio_members_json(self):
+        """The members and invited members of the user's portfolio"""
+        self.assertQueryCountConstant(
+            "get_portfolio_members_json",
+            lambda: self.get_json("get_portfolio_members_json", portfolio=self.portfolio.id),
+            self.data.seed,
+        )
+
+    @less_console_noise_decorator
+    @override_flag("organization_feature", active=True)
+    @override_flag("organization_members", active=True)
+    def test_member_domains_json(self):
+        """The domains of the user's portfolio, as shown on a member's page"""
+        self.assertQueryCountConstant(
+            "get_member_domains_json",
+            lambda: self.get_json("get_member_domains_json", portfolio=self.portfolio.id, member_id=self.user.id),
+            self.data.seed,
+        )
+
+    @less_console_noise_decorator
+    def test_domain_users(self):
+        """The managers and invitations of a domain"""
+        url = reverse("domain-users", kwargs={"pk": self.data.shared_domain.id})
+        self.assertQueryCountConstant("DomainUsersView", lambda: self.client.get(url), self.data.seed)
+
+    @less_console_noise_decorator
+    def test_domain_request_wizard_review(self):
+        """The review step of the domain request wizard, which lists every contact and website"""
+        domain_request = completed_domain_request(user=self.user, name="wizard.gov")
+
+        def seed(count):
+            while domain_request.other_contacts.count() < count:
+                i = domain_request.other_contacts.count()
+                domain_request.other_contacts.add(
+                    Contact.objects.create(first_name=f"Other {i}", last_name="Tester", email=f"other{i}@town.com")
+                )
+                domain_request.current_websites.add(Website.objects.create(website=f"scaled{i}.com"))
+
+        def get_review_step():
+            self.client.get(reverse("edit-domain-request", kwargs={"id": domain_request.pk}))
+            return self.client.get(reverse("domain-request:review"))
+
+        self.assertQueryCountConstant("DomainRequestWizard (review)", get_review_step, seed)
+
+
+class TestAdminQueryBudgets(QueryBudgetMixin, MockEppLib):
+    """The admin changelists make the same number of queries however many rows they show"""
+
+    def setUp(self):
+        super().setUp()
+        self.superuser = create_superuser()
+        user = create_test_user()
+        portfolio = Portfolio.objects.create(creator=user, organization_name="Budget org")
+        self.data = ScaledDataFactory(user, portfolio)
+        self.client = Client()
+        self.client.force_login(self.superuser)
+
+    def tearDown(self):
+        super().tearDown()
+        DomainInvitation.objects.all().delete()
+        PortfolioInvitation.objects.all().delete()
+        UserDomainRole.objects.all().delete()
+        UserPortfolioPermission.objects.all().delete()
+        DomainRequest.objects.all().delete()
+        DomainInformation.objects.all().delete()
+        Domain.objects.all().delete()
+        DraftDomain.objects.all().delete()
+        Portfolio.objects.all().delete()
+        Contact.objects.all().delete()
+        Website.objects.all().delete()
+        User.objects.all().delete()
+
+    def assertChangelistQueryCountConstant(self, model_name):
+        url = reverse(f"admin:registrar_{model_name}_changelist")
+        self.assertQueryCountConstant(f"admin {model_name} changelist", lambda: self.client.get(url), self.data.seed)
+
+    @less_console_noise_decorator
+    def test_domain_changelist(self):
+        self.assertChangelistQueryCountConstant("domain")
+
+    @less_console_noise_decorator
+    def test_domain_request_changelist(self):
+        self.assertChangelistQueryCountConstant("domainrequest")
+
+    @less_console_noise_decorator
+    def test_user_changelist(self):
+        self.assertChangelistQueryCountConstant("user")
+
+    @less_console_noise_decorator
+    def test_portfolio_changelist(self):
+        self.assertChangelistQueryCountConstant("portfolio")
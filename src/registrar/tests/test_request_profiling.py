@@ -0,0 +1,171 @@
+import json
+from unittest.mock import patch
+
+from django.contrib.auth.models import AnonymousUser
+from django.http import HttpResponse
+from django.template import engines
+from django.template.response import TemplateResponse
+from django.test import Client, RequestFactory, TestCase, override_settings
+
+from api.tests.common import less_console_noise_decorator
+from epplibwrapper.metrics import EPPMetrics
+from registrar.models import Domain, User
+from registrar.registrar_middleware import RequestProfilingMiddleware
+from registrar.utility.request_profiling import (
+    RequestProfile,
+    get_current_profile,
+    profile_request,
+    record_epp_command,
+    time_external_call,
+)
+from .common import create_superuser, create_test_user
+
+
+class TestRequestProfile(TestCase):
+    """Tests for what a RequestProfile records while it is active"""
+
+    def test_counts_queries_and_duplicates(self):
+        """Each query is counted, and a query repeated with the same SQL counts as a duplicate"""
+        profile = RequestProfile(method="GET", path="/")
+        with profile_request(profile):
+            Domain.objects.filter(name="one.gov").exists()
+            Domain.objects.filter(name="two.gov").exists()
+            Domain.objects.count()
+
+        self.assertEqual(profile.query_count, 3)
+        self.assertEqual(profile.duplicate_query_count, 1)
+        self.assertGreater(profile.query_seconds, 0)
+        self.assertEqual(profile.as_dict(200)["db"]["duplicates"], 1)
+
+    def test_nothing_recorded_outside_a_profile(self):
+        """Queries, external calls and registry commands outside profile_request are not recorded"""
+        profile = RequestProfile(method="GET", path="/")
+        with profile_request(profile):
+            pass
+
+        Domain.objects.count()
+        with time_external_call("ses"):
+            pass
+        record_epp_command("InfoDomain", 0.1, 0.0)
+
+        self.assertIsNone(get_current_profile())
+        self.assertEqual(profile.query_count, 0)
+        self.assertEqual(profile.epp_count, 0)
+        self.assertFalse(profile.external_counts)
+
+    def test_records_external_calls_and_epp_commands(self):
+        """Calls timed with time_external_call and registry commands sent through EPPMetrics are recorded"""
+        metrics = EPPMetrics()
+        metrics.add_listener(record_epp_command)
+        metrics.add_listener(record_epp_command)
+        profile = RequestProfile(method="GET", path="/")
+        with profile_request(profile):
+            with time_external_call("ses"):
+                pass
+            with time_external_call("s3"):
+                pass
+            with time_external_call("s3"):
+                pass
+            metrics.record_command("InfoDomain", seconds=0.05, lock_wait_seconds=0.01)
+
+        self.assertEqual(profile.external_counts, {"ses": 1, "s3": 2})
+        # The listener was only added once
+        self.assertEqual(profile.epp_count, 1)
+        self.assertEqual(profile.epp_commands, {"InfoDomain": 1})
+        self.assertAlmostEqual(profile.epp_lock_wait_seconds, 0.01)
+
+        server_timing = profile.server_timing()
+        self.assertIn('epp;dur=50.0;desc="1 commands"', server_timing)
+        self.assertIn("s3;dur=", server_timing)
+        self.assertIn("total;dur=", server_timing)
+
+
+class TestRequestProfilingMiddleware(TestCase):
+    """Tests for which requests RequestProfilingMiddleware profiles, and what it returns"""
+
+    def setUp(self):
+        super().setUp()
+        self.factory = RequestFactory()
+        self.staff_user = create_superuser()
+        self.user = create_test_user()
+
+    def tearDown(self):
+        super().tearDown()
+        User.objects.all().delete()
+
+    def get_response(self, request):
+        Domain.objects.count()
+        return HttpResponse("OK")
+
+    def make_request(self, user, **headers):
+        request = self.factory.get("/domains/", headers=headers)
+        request.user = user
+        return request
+
+    @less_console_noise_decorator
+    def test_staff_header_profiles_request(self):
+        """A staff user who sends the header gets a Server-Timing header, and the profile is logged"""
+        middleware = RequestProfilingMiddleware(self.get_response)
+        with self.assertLogs("registrar.registrar_middleware", level="INFO") as logs:
+            response = middleware(self.make_request(self.staff_user, **{"X-Profile-Request": "1"}))
+
+        self.assertIn("db;dur=", response["Server-Timing"])
+        self.assertIn('desc="1 queries"', response["Server-Timing"])
+        logged = logs.output[0].split("Request profile: ", 1)[1]
+        profile = json.loads(logged)
+        self.assertEqual(profile["path"], "/domains/")
+        self.assertEqual(profile["status"], 200)
+        self.assertEqual(profile["db"]["count"], 1)
+
+    @less_console_noise_decorator
+    def test_header_ignored_for_other_users(self):
+        """Users who are not staff, and anonymous users, can not profile a request with the header"""
+        middleware = RequestProfilingMiddleware(self.get_response)
+        for user in [self.user, AnonymousUser()]:
+            with self.subTest(user=user):
+                with patch("registrar.registrar_middleware.logger") as mock_logger:
+                    response = middleware(self.make_request(user, **{"X-Profile-Request": "1"}))
+                self.assertNotIn("Server-Timing", response)
+                mock_logger.info.assert_not_called()
+
+    @less_console_noise_decorator
+    @override_settings(REQUEST_PROFILING_SAMPLE_RATE=1.0)
+    def test_sampled_request_is_logged_without_header(self):
+        """Sampled requests are logged, but only return Server-Timing when the setting is on"""
+        middleware = RequestProfilingMiddleware(self.get_response)
+        with self.assertLogs("registrar.registrar_middleware", level="INFO"):
+            response = middleware(self.make_request(self.user))
+        self.assertNotIn("Server-Timing", response)
+
+        with override_settings(REQUEST_PROFILING_SERVER_TIMING=True):
+            with self.assertLogs("registrar.registrar_middleware", level="INFO"):
+                response = middleware(self.make_request(self.user))
+        self.assertIn("Server-Timing", response)
+
+    @less_console_noise_decorator
+    def test_template_render_time(self):
+        """The rendering of a TemplateResponse is timed"""
+        template = engines["django"].from_string("{% for i in items %}{{ i }}{% endfor %}")
+
+        def get_template_response(request):
+            response = TemplateResponse(request, template, {"items": range(100)})
+            # Django renders the response after the middleware's process_template_response
+            response = middleware.process_template_response(request, response)
+            return response.render()
+
+        middleware = RequestProfilingMiddleware(get_template_response)
+        with patch("registrar.registrar_middleware.logger") as mock_logger:
+            response = middleware(self.make_request(self.staff_user, **{"X-Profile-Request": "1"}))
+
+        profile = json.loads(mock_logger.info.call_args.args[1])
+        self.assertGreater(profile["template_ms"], 0)
+        self.assertIn("template;dur=", response["Server-Timing"])
+
+    @less_console_noise_decorator
+    def test_profiled_through_the_client(self):
+        """The middleware is installed, and profiles a staff user's request end to end"""
+        client = Client()
+        client.force_login(self.staff_user)
+        with patch("registrar.registrar_middleware.logger"):
+            response = client.get("/health", headers={"X-Profile-Request": "1"})
+        self.assertIn("total;dur=", response["Server-Timing"])
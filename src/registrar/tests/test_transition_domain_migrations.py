@@ -1,4 +1,6 @@
 import datetime
+import os
+import tempfile
 
 from io import StringIO
 
@@ -17,6 +19,8 @@ from registrar.models import (
 from django.core.management import call_command
 from unittest.mock import patch
 
+from registrar.management.commands.utility.extra_transition_domain_helper import OrganizationDataLoader
+from registrar.management.commands.utility.transition_domain_arguments import TransitionDomainArguments
 from registrar.models.contact import Contact
 
 from .common import MockSESClient, less_console_noise
@@ -510,6 +514,42 @@ class TestOrganizationMigration(TestCase):
                 expected_missing_domain_informations,
             )
 
+    def test_organization_data_loader_index(self):
+        """
+        Every domain in the domain_additional file resolves to its organization_adhoc row,
+        and domains whose organization is missing resolve to None.
+        """
+        with tempfile.TemporaryDirectory() as directory:
+            with open(os.path.join(directory, "domain_additional.txt"), "w") as domain_additional_file:
+                domain_additional_file.write(
+                    "domainname|domaintypeid|authorityid|orgid|securitycontactemail|dnsseckeymonitor|domainpurpose\n"
+                )
+                for i in range(10):
+                    domain_additional_file.write(f"domain{i}.gov|1|1|{i % 3}|security@domain{i}.gov|N|test\n")
+                domain_additional_file.write("orphan.gov|1|1|99|security@orphan.gov|N|test\n")
+            with open(os.path.join(directory, "organization_adhoc.txt"), "w") as organization_file:
+                organization_file.write("orgid|orgname|orgstreet|orgcity|orgstate|orgzip|orgcountrycode\n")
+                for i in range(3):
+                    organization_file.write(f"{i}|Org {i}|{i} Main St|Citytown|Virginia|22201|US\n")
+
+            with less_console_noise():
+                loader = OrganizationDataLoader(
+                    TransitionDomainArguments(
+                        directory=directory,
+                        domain_additional_filename="domain_additional.txt",
+                        organization_adhoc_filename="organization_adhoc.txt",
+                    )
+                )
+                org_info_by_domain = loader.build_org_info_index()
+
+        self.assertEqual(len(org_info_by_domain), 11)
+        self.assertIsNone(org_info_by_domain["orphan.gov"])
+        for i in range(10):
+            self.assertEqual(org_info_by_domain[f"domain{i}.gov"].orgname, f"Org {i % 3}")
+        org_info = loader.get_org_info("domain7.gov")
+        self.assertEqual(org_info.orgname, "Org 1")
+        self.assertEqual(org_info.orgcity, "Citytown")
+
 
 class TestMigrations(TestCase):
     def setUp(self):
@@ -1,5 +1,8 @@
+from unittest.mock import patch
 from django.test import TestCase
-from registrar.models import User
+from epplibwrapper.errors import RegistryError
+from registrar.models import Domain, User
+from registrar.utility.domain_availability import DomainAvailabilityCache
 from waffle.testutils import override_flag
 from registrar.utility.waffle import flag_is_active_for_user
 
@@ -21,3 +24,62 @@ class FlagIsActiveForUserTest(TestCase):
         # Test that the flag is inactive for the user
         is_active = flag_is_active_for_user(self.user, "test_flag")
         self.assertFalse(is_active)
+
+
+class DomainAvailabilityCacheTest(TestCase):
+    """Tests for the session cache of registry domain availability checks"""
+
+    def setUp(self):
+        self.session = {}
+
+    @patch.object(Domain, "available_many", return_value={"city.gov": True, "gsa.gov": False})
+    def test_check_batches_uncached_domains(self, mock_available_many):
+        """Uncached domains are checked in one registry request and stored in the session"""
+        availability = DomainAvailabilityCache(self.session)
+        results = availability.check(["city", "GSA.gov", "city.gov"])
+        self.assertEqual(results, {"city.gov": True, "gsa.gov": False})
+        mock_available_many.assert_called_once_with(["city.gov", "gsa.gov"])
+        self.assertEqual(availability.registry_calls, 1)
+
+        # a new cache for the same session reuses the results
+        availability = DomainAvailabilityCache(self.session)
+        self.assertTrue(availability.is_available("city"))
+        self.assertFalse(availability.is_available("gsa"))
+        mock_available_many.assert_called_once()
+
+    @patch.object(Domain, "available_many", return_value={"city.gov": True})
+    def test_expired_results_are_checked_again(self, mock_available_many):
+        """Results older than the ttl are checked against the registry again"""
+        availability = DomainAvailabilityCache(self.session, ttl=0)
+        availability.is_available("city")
+        availability.is_available("city")
+        self.assertEqual(mock_available_many.call_count, 2)
+        self.assertEqual(availability.registry_calls, 2)
+
+        availability.reset_registry_calls()
+        self.assertEqual(availability.registry_calls, 0)
+
+    @patch.object(Domain, "available_many", return_value={"city.gov": True})
+    def test_without_session(self, mock_available_many):
+        """Without a session, results are only reused by the same cache"""
+        availability = DomainAvailabilityCache()
+        availability.is_available("city")
+        availability.is_available("city")
+        DomainAvailabilityCache().is_available("city")
+        self.assertEqual(mock_available_many.call_count, 2)
+
+    @patch.object(Domain, "available_many", return_value={"City.gov.": True})
+    def test_names_are_normalized_on_both_sides(self, mock_available_many):
+        """Names are matched with the registry's response regardless of case or a trailing dot"""
+        availability = DomainAvailabilityCache(self.session)
+        self.assertEqual(availability.check(["CITY.gov."]), {"city.gov": True})
+        mock_available_many.assert_called_once_with(["city.gov"])
+
+    @patch.object(Domain, "available_many", return_value={"city.gov": True})
+    def test_missing_result_raises(self, mock_available_many):
+        """A name the registry did not return a result for is not assumed to be unavailable"""
+        availability = DomainAvailabilityCache(self.session)
+        with self.assertLogs("registrar.utility.domain_availability", level="ERROR"):
+            with self.assertRaises(RegistryError):
+                availability.check(["city", "gsa"])
+        self.assertIsNone(availability.get("gsa"))
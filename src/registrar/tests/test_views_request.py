@@ -3,12 +3,16 @@ from unittest.mock import Mock, patch
 from datetime import datetime
 from django.utils import timezone
 from django.conf import settings
+from django.contrib.sessions.backends.cache import SessionStore
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from api.tests.common import less_console_noise_decorator
 from .common import MockSESClient, completed_domain_request  # type: ignore
 from django_webtest import WebTest  # type: ignore
 import boto3_mocking  # type: ignore
 from waffle.testutils import override_flag
+from epplibwrapper import commands
 
 from registrar.models import (
     DomainRequest,
@@ -20,6 +24,7 @@ from registrar.models import (
     Website,
     FederalAgency,
     Portfolio,
+    UserDomainRole,
     UserPortfolioPermission,
 )
 from registrar.views.domain_request import DomainRequestWizard, Step
@@ -1190,6 +1195,61 @@ class DomainRequestTests(TestWithUser, WebTest):
         other_contacts_form = other_contacts_page.forms[0]
         self.assertEquals(other_contacts_form["other_contacts-has_other_contacts"].value, "True")
 
+    @less_console_noise_decorator
+    def test_dotgov_domain_checks_registry_once(self):
+        """The requested domain and alternative domains are checked against the registry
+        in one request, and the result is reused when the page is submitted again"""
+        domain_request = completed_domain_request(user=self.user)
+        # prime the form by visiting /edit
+        self.app.get(reverse("edit-domain-request", kwargs={"id": domain_request.pk}))
+        session_id = self.app.cookies[settings.SESSION_COOKIE_NAME]
+        self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+
+        dotgov_page = self.app.get(reverse("domain-request:dotgov_domain"))
+        dotgov_form = dotgov_page.forms[0]
+        dotgov_form["dotgov_domain-requested_domain"] = "city"
+        dotgov_form["dotgov_domain-0-alternative_domain"] = "city1"
+
+        self.mockedSendFunction.reset_mock()
+        for _ in range(2):
+            self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+            dotgov_result = dotgov_form.submit()
+            self.assertEqual(dotgov_result.status_code, 302)
+
+        check_calls = [
+            call for call in self.mockedSendFunction.call_args_list if isinstance(call.args[0], commands.CheckDomain)
+        ]
+        self.assertEqual(len(check_calls), 1)
+        self.assertEqual(check_calls[0].args[0].names, ["city.gov", "city1.gov"])
+
+    @less_console_noise_decorator
+    def test_review_page_query_count(self):
+        """The review page loads the domain request and its related objects in a fixed
+        number of queries, however many contacts and websites the request has"""
+
+        def review_page_queries(domain_request):
+            self.app.get(reverse("edit-domain-request", kwargs={"id": domain_request.pk}))
+            session_id = self.app.cookies[settings.SESSION_COOKIE_NAME]
+            self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+            with CaptureQueriesContext(connection) as queries:
+                review_page = self.app.get(reverse("domain-request:review"))
+            self.assertEqual(review_page.status_code, 200)
+            return len(queries)
+
+        small_request = completed_domain_request(user=self.user)
+        small_request_queries = review_page_queries(small_request)
+
+        large_request = completed_domain_request(user=self.user, name="large.gov")
+        for i in range(10):
+            large_request.other_contacts.add(
+                Contact.objects.create(first_name=f"Other {i}", last_name="Tester", email=f"other{i}@town.com")
+            )
+            large_request.alternative_domains.add(Website.objects.create(website=f"large{i}.gov"))
+            large_request.current_websites.add(Website.objects.create(website=f"large{i}.com"))
+        large_request_queries = review_page_queries(large_request)
+
+        self.assertEqual(large_request_queries, small_request_queries)
+
     @less_console_noise_decorator
     def test_yes_no_form_inits_yes_for_cisa_representative_and_anything_else(self):
         """On the Additional Details page, the yes/no form gets initialized with YES selected
@@ -2982,6 +3042,84 @@ class TestDomainRequestWizard(TestWithUser, WebTest):
         expected_dict = []
         self.assertEqual(unlocked_steps, expected_dict)
 
+    @less_console_noise_decorator
+    def test_unlocked_steps_are_computed_once(self):
+        """Unlocked steps are reused within a request until the wizard saves"""
+        domain_request = completed_domain_request(user=self.user)
+        self.wizard._domain_request = domain_request
+        unlocked_steps = self.wizard.db_check_for_unlocking_steps()
+        with self.assertNumQueries(0):
+            self.assertEqual(self.wizard.db_check_for_unlocking_steps(), unlocked_steps)
+
+    @less_console_noise_decorator
+    def test_pending_requests_single_query(self):
+        """Pending requests, approved requests and approved domains are checked with one query"""
+        pending_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.SUBMITTED, user=self.user)
+        self.wizard._domain_request = completed_domain_request(user=self.user, name="started.gov")
+        with self.assertNumQueries(1):
+            pending_requests = self.wizard.pending_requests()
+        self.assertEqual(pending_requests, [pending_request])
+
+        # a user who manages a domain can submit more requests
+        domain, _ = Domain.objects.get_or_create(name="igorville.gov")
+        UserDomainRole.objects.create(user=self.user, domain=domain, role=UserDomainRole.Roles.MANAGER)
+        with self.assertNumQueries(1):
+            self.assertEqual(self.wizard.pending_requests(), [])
+
+    @less_console_noise_decorator
+    def test_wizard_step_query_count(self):
+        """A wizard step loads in the same number of queries however many
+        contacts and websites the domain request has"""
+
+        def step_queries(domain_request):
+            self.app.get(reverse("edit-domain-request", kwargs={"id": domain_request.pk}))
+            session_id = self.app.cookies[settings.SESSION_COOKIE_NAME]
+            self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+            with CaptureQueriesContext(connection) as queries:
+                page = self.app.get(reverse("domain-request:purpose"))
+            self.assertEqual(page.status_code, 200)
+            return len(queries)
+
+        small_request_queries = step_queries(completed_domain_request(user=self.user))
+
+        large_request = completed_domain_request(user=self.user, name="large.gov")
+        for i in range(10):
+            large_request.other_contacts.add(
+                Contact.objects.create(
+                    first_name=f"Other {i}", last_name="Tester", title="Tester", email=f"other{i}@town.com"
+                )
+            )
+            large_request.current_websites.add(Website.objects.create(website=f"large{i}.com"))
+        large_request_queries = step_queries(large_request)
+
+        self.assertEqual(large_request_queries, small_request_queries)
+
+    @less_console_noise_decorator
+    def test_wizard_walkthrough_session_writes(self):
+        """Viewing wizard steps only saves the session when the wizard state changes"""
+        domain_request = completed_domain_request(status=DomainRequest.DomainRequestStatus.STARTED, user=self.user)
+        self.app.get(reverse("edit-domain-request", kwargs={"id": domain_request.pk}))
+        session_id = self.app.cookies[settings.SESSION_COOKIE_NAME]
+        # walk through the steps which are unlocked for this domain request
+        unlocked_steps = SessionStore(session_key=session_id)["wizard_domain_request"]["step_history"]
+        self.assertTrue(unlocked_steps)
+
+        def walk_through_steps():
+            with patch.object(SessionStore, "save", autospec=True, side_effect=SessionStore.save) as session_save:
+                for step in unlocked_steps:
+                    self.app.set_cookie(settings.SESSION_COOKIE_NAME, session_id)
+                    self.app.get(reverse(f"domain-request:{step}"))
+            return session_save.call_count
+
+        first_walkthrough_writes = walk_through_steps()
+        second_walkthrough_writes = walk_through_steps()
+        logger.info(
+            f"Session writes per wizard walkthrough: first {first_walkthrough_writes}, "
+            f"second {second_walkthrough_writes}"
+        )
+        self.assertLess(first_walkthrough_writes, len(unlocked_steps))
+        self.assertEqual(second_walkthrough_writes, 0)
+
     @less_console_noise_decorator
     def test_unlocked_steps_full_domain_request(self):
         """Test when all fields in the domain request are filled."""
@@ -0,0 +1,109 @@
+"""Short lived, per session memo of registry domain availability checks"""
+
+import logging
+import time
+
+from django.apps import apps
+
+from epplibwrapper.errors import RegistryError
+
+logger = logging.getLogger(__name__)
+
+
+class DomainAvailabilityCache:
+    """
+    Remembers the result of registry availability checks for a short time.
+
+    Results are kept in the user's session (when one is given), so that a name which was
+    checked by the availability api, or on a previous POST of the domain request wizard,
+    is not checked against the registry again while the result is recent. Names that are
+    not cached can be checked together in a single EPP CheckDomain request.
+
+    The number of registry requests made is also counted in the session, so that it
+    can be reported when the domain request is submitted.
+    """
+
+    SESSION_KEY = "domain_availability"
+    REGISTRY_CALLS_SESSION_KEY = "domain_availability_registry_calls"
+
+    # Seconds for which a result is reused
+    TTL = 60
+
+    def __init__(self, session=None, ttl=TTL):
+        self.session = session
+        self.ttl = ttl
+        self.entries: dict[str, list] = {}
+        if session is not None:
+            self.entries = session.get(self.SESSION_KEY, {})
+
+    @staticmethod
+    def normalize(domain: str) -> str:
+        """Lowercase the domain, drop a trailing dot, and add .gov when it is missing"""
+        domain = domain.strip().lower().rstrip(".")
+        return domain if domain.endswith(".gov") else f"{domain}.gov"
+
+    def get(self, domain: str) -> bool | None:
+        """Returns the cached availability of domain, or None if it is not cached or has expired"""
+        entry = self.entries.get(self.normalize(domain))
+        if entry is None:
+            return None
+        available, checked_at = entry
+        if time.time() - checked_at >= self.ttl:
+            return None
+        return available
+
+    def check(self, domains: list[str]) -> dict[str, bool]:
+        """Returns the availability of each of the given domains, keyed by normalized name.
+        Domains that are not cached are checked together in one registry request.
+
+        throws- RegistryError or InvalidDomainError"""
+        results = {}
+        unchecked = []
+        for name in dict.fromkeys(self.normalize(domain) for domain in domains):
+            available = self.get(name)
+            if available is None:
+                unchecked.append(name)
+            else:
+                results[name] = available
+
+        if not unchecked:
+            return results
+
+        Domain = apps.get_model("registrar.Domain")
+        checked = {self.normalize(name): available for name, available in Domain.available_many(unchecked).items()}
+        self._count_registry_call()
+        missing = [name for name in unchecked if name not in checked]
+        if missing:
+            logger.error(f"Registry availability check did not return a result for {missing}")
+            raise RegistryError(f"No availability returned for {', '.join(missing)}")
+
+        now = time.time()
+        # drop expired entries so the session does not grow
+        self.entries = {name: entry for name, entry in self.entries.items() if now - entry[1] < self.ttl}
+        for name in unchecked:
+            results[name] = checked[name]
+            self.entries[name] = [results[name], now]
+        if self.session is not None:
+            self.session[self.SESSION_KEY] = self.entries
+        return results
+
+    def is_available(self, domain: str) -> bool:
+        """Returns the availability of domain, checking the registry if it is not cached.
+
+        throws- RegistryError or InvalidDomainError"""
+        return self.check([domain])[self.normalize(domain)]
+
+    def _count_registry_call(self):
+        if self.session is not None:
+            self.session[self.REGISTRY_CALLS_SESSION_KEY] = self.registry_calls + 1
+
+    @property
+    def registry_calls(self) -> int:
+        """Number of registry requests made for this session since the last reset"""
+        if self.session is None:
+            return 0
+        return self.session.get(self.REGISTRY_CALLS_SESSION_KEY, 0)
+
+    def reset_registry_calls(self):
+        if self.session is not None:
+            self.session.pop(self.REGISTRY_CALLS_SESSION_KEY, None)
@@ -12,6 +12,8 @@ from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from waffle import flag_is_active
 
+from registrar.utility.request_profiling import time_external_call
+
 
 logger = logging.getLogger(__name__)
 
@@ -106,16 +108,17 @@ def send_templated_email(  # noqa
             if wrap_email:
                 email_body = wrap_text_and_preserve_paragraphs(email_body, width=80)
 
-            ses_client.send_email(
-                FromEmailAddress=settings.DEFAULT_FROM_EMAIL,
-                Destination=destination,
-                Content={
-                    "Simple": {
-                        "Subject": {"Data": subject},
-                        "Body": {"Text": {"Data": email_body}},
+            with time_external_call("ses"):
+                ses_client.send_email(
+                    FromEmailAddress=settings.DEFAULT_FROM_EMAIL,
+                    Destination=destination,
+                    Content={
+                        "Simple": {
+                            "Subject": {"Data": subject},
+                            "Body": {"Text": {"Data": email_body}},
+                        },
                     },
-                },
-            )
+                )
             logger.info("Email sent to [%s], bcc [%s], cc %s", to_address, bcc_address, sendable_cc_addresses)
         else:
             ses_client = boto3.client(
@@ -222,5 +225,8 @@ def send_email_with_attachment(sender, recipient, subject, body, attachment_file
     attachment_part.add_header("Content-Disposition", f'attachment; filename="{current_filename}"')
     msg.attach(attachment_part)
 
-    response = ses_client.send_raw_email(Source=sender, Destinations=[recipient], RawMessage={"Data": msg.as_string()})
+    with time_external_call("ses"):
+        response = ses_client.send_raw_email(
+            Source=sender, Destinations=[recipient], RawMessage={"Data": msg.as_string()}
+        )
     return response
@@ -0,0 +1,165 @@
+"""
+Records where the time of a single request goes: database queries, registry (EPP) commands,
+AWS calls and template rendering. Used by RequestProfilingMiddleware.
+
+While a request is being profiled, its RequestProfile is available through get_current_profile.
+Code that calls an external service can time the call with time_external_call, which does
+nothing when no request is being profiled.
+"""
+
+import contextlib
+import time
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+
+from django.db import connections
+
+_current_profile: ContextVar["RequestProfile | None"] = ContextVar("request_profile", default=None)
+
+
+@dataclass
+class RequestProfile:
+    """The timings of one request, in seconds"""
+
+    method: str
+    path: str
+    started_at: float = field(default_factory=time.perf_counter)
+    query_count: int = 0
+    query_seconds: float = 0.0
+    # The number of times each SQL statement ran, to spot repeated queries
+    query_statements: Counter = field(default_factory=Counter)
+    epp_count: int = 0
+    epp_seconds: float = 0.0
+    epp_lock_wait_seconds: float = 0.0
+    epp_commands: Counter = field(default_factory=Counter)
+    external_counts: Counter = field(default_factory=Counter)
+    external_seconds: Counter = field(default_factory=Counter)
+    template_seconds: float = 0.0
+
+    @property
+    def elapsed_seconds(self):
+        return time.perf_counter() - self.started_at
+
+    @property
+    def duplicate_query_count(self):
+        """The number of queries whose SQL had already run earlier in the request"""
+        return sum(count - 1 for count in self.query_statements.values())
+
+    def record_query(self, sql, seconds):
+        self.query_count += 1
+        self.query_seconds += seconds
+        self.query_statements[sql] += 1
+
+    def record_epp_command(self, cmd_type, seconds, lock_wait_seconds):
+        self.epp_count += 1
+        self.epp_seconds += seconds
+        self.epp_lock_wait_seconds += lock_wait_seconds
+        self.epp_commands[cmd_type] += 1
+
+    def record_external_call(self, service, seconds):
+        self.external_counts[service] += 1
+        self.external_seconds[service] += seconds
+
+    def record_template_render(self, seconds):
+        self.template_seconds += seconds
+
+    def as_dict(self, status_code=None):
+        """Returns the profile in a form that can be logged as JSON, with times in milliseconds"""
+
+        def milliseconds(seconds):
+            return round(seconds * 1000, 2)
+
+        return {
+            "method": self.method,
+            "path": self.path,
+            "status": status_code,
+            "total_ms": milliseconds(self.elapsed_seconds),
+            "db": {
+                "count": self.query_count,
+                "duplicates": self.duplicate_query_count,
+                "ms": milliseconds(self.query_seconds),
+            },
+            "epp": {
+                "count": self.epp_count,
+                "ms": milliseconds(self.epp_seconds),
+                "lock_wait_ms": milliseconds(self.epp_lock_wait_seconds),
+                "commands": dict(self.epp_commands),
+            },
+            "external": {
+                service: {"count": count, "ms": milliseconds(self.external_seconds[service])}
+                for service, count in self.external_counts.items()
+            },
+            "template_ms": milliseconds(self.template_seconds),
+        }
+
+    def server_timing(self):
+        """Returns the value of a Server-Timing header for this profile"""
+        metrics = [
+            f'db;dur={self.query_seconds * 1000:.1f};desc="{self.query_count} queries"',
+            f'epp;dur={self.epp_seconds * 1000:.1f};desc="{self.epp_count} commands"',
+        ]
+        for service, count in self.external_counts.items():
+            metrics.append(f'{service};dur={self.external_seconds[service] * 1000:.1f};desc="{count} calls"')
+        metrics.append(f"template;dur={self.template_seconds * 1000:.1f}")
+        metrics.append(f"total;dur={self.elapsed_seconds * 1000:.1f}")
+        return ", ".join(metrics)
+
+
+def get_current_profile() -> RequestProfile | None:
+    """Returns the profile of the request being handled, if it is being profiled"""
+    return _current_profile.get()
+
+
+@contextlib.contextmanager
+def profile_request(profile: RequestProfile):
+    """Records the queries, registry commands and external calls made inside this block in profile"""
+    token = _current_profile.set(profile)
+    try:
+        with contextlib.ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(_time_query))
+            yield profile
+    finally:
+        _current_profile.reset(token)
+
+
+@contextlib.contextmanager
+def time_external_call(service):
+    """
+    Records the time taken by the block in the current request's profile, under service.
+
+    Usage:
+    with time_external_call("ses"):
+        ses_client.send_email(...)
+    """
+    profile = _current_profile.get()
+    if profile is None:
+        yield
+        return
+
+    started_at = time.perf_counter()
+    try:
+        yield
+    finally:
+        profile.record_external_call(service, time.perf_counter() - started_at)
+
+
+def record_epp_command(cmd_type, seconds, lock_wait_seconds):
+    """An EPPMetrics listener which adds each registry command to the current request's profile"""
+    profile = _current_profile.get()
+    if profile is not None:
+        profile.record_epp_command(cmd_type, seconds, lock_wait_seconds)
+
+
+def _time_query(execute, sql, params, many, context):
+    """A database execute wrapper which adds each query to the current request's profile"""
+    profile = _current_profile.get()
+    if profile is None:
+        return execute(sql, params, many, context)
+
+    started_at = time.perf_counter()
+    try:
+        return execute(sql, params, many, context)
+    finally:
+        profile.record_query(sql, time.perf_counter() - started_at)
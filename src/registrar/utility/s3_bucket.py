@@ -5,6 +5,8 @@ import boto3
 from botocore.exceptions import ClientError
 from django.conf import settings
 
+from registrar.utility.request_profiling import time_external_call
+
 
 class S3ClientErrorCodes(IntEnum):
     """Used for S3ClientError
@@ -107,7 +109,8 @@ class S3ClientHelper:
         """
 
         try:
-            response = self.boto_client.upload_file(file_path, self.get_bucket_name(), file_name)
+            with time_external_call("s3"):
+                response = self.boto_client.upload_file(file_path, self.get_bucket_name(), file_name)
         except Exception as exc:
             raise S3ClientError(code=S3ClientErrorCodes.UPLOAD_FILE_ERROR) from exc
         return response
@@ -133,7 +136,8 @@ class S3ClientHelper:
         """
 
         try:
-            response = self.boto_client.get_object(Bucket=self.get_bucket_name(), Key=file_name)
+            with time_external_call("s3"):
+                response = self.boto_client.get_object(Bucket=self.get_bucket_name(), Key=file_name)
         except ClientError as exc:
             if exc.response["Error"]["Code"] == "NoSuchKey":
                 raise S3ClientError(code=S3ClientErrorCodes.FILE_NOT_FOUND_ERROR) from exc
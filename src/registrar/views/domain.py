@@ -844,6 +844,9 @@ class DomainUsersView(DomainBaseView):
         # Get the email of the current user
         context["current_user_email"] = self.request.user.email
 
+        # The managers are listed with their emails, so their users are loaded along with them
+        context["permissions"] = self.object.permissions.select_related("user")
+
         return context
 
     def _add_booleans_to_context(self, context):
@@ -1,5 +1,6 @@
 import logging
 from collections import defaultdict
+from django.forms import BaseFormSet
 from django.http import Http404, HttpResponse, HttpResponseRedirect
 from django.shortcuts import redirect, render
 from django.urls import resolve, reverse
@@ -9,12 +10,17 @@ from django.views.generic import TemplateView
 from django.contrib import messages
 from registrar.forms import domain_request_wizard as forms
 from registrar.forms.utility.wizard_form_helper import request_step_list
-from registrar.models import DomainRequest
+from django.db.models import Exists, OuterRef, Prefetch
+from registrar.models import DomainRequest, UserDomainRole, Website
 from registrar.models.contact import Contact
 from registrar.models.user import User
+from registrar.models.utility.domain_helper import DomainHelper
 from registrar.views.utility import StepsHelper
+from registrar.views.utility.wizard_storage import WizardStorage
 from registrar.views.utility.permission_views import DomainRequestPermissionDeleteView
+from registrar.utility.domain_availability import DomainAvailabilityCache
 from registrar.utility.enums import Step, PortfolioDomainRequestStep
+from epplibwrapper.errors import RegistryError
 
 from .utility import (
     DomainRequestPermissionView,
@@ -155,6 +161,8 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
         self.wizard_conditions = {}
         self.unlocking_steps = {}
         self.steps = None
+        self._unlocked_steps = None  # for caching
+        self._storage = None
         # Configure titles, wizard_conditions, unlocking_steps, and steps
         self.configure_step_options()
         self._domain_request = None  # for caching
@@ -178,6 +186,7 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
             self.titles = self.REGULAR_TITLES
             self.wizard_conditions = self.REGULAR_WIZARD_CONDITIONS
             self.unlocking_steps = self.REGULAR_UNLOCKING_STEPS
+        self._unlocked_steps = None
         self.steps = StepsHelper(self)
 
     def has_pk(self):
@@ -216,7 +225,8 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
         if self.has_pk():
             id = self.storage["domain_request_id"]
             try:
-                self._domain_request = DomainRequest.objects.get(
+                # Related objects are loaded up front, as the forms and the review page use all of them
+                self._domain_request = self.get_domain_request_queryset().get(
                     creator=creator,
                     pk=id,
                 )
@@ -242,33 +252,54 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
         self.storage["domain_request_id"] = self._domain_request.id
         return self._domain_request
 
+    def get_domain_request_queryset(self):
+        """DomainRequest queryset which loads the related objects shown in the wizard
+        in a fixed number of queries. Formsets are prefetched in the order they are shown in."""
+        return DomainRequest.objects.select_related(
+            "requested_domain",
+            "senior_official",
+            "federal_agency",
+            "portfolio",
+            "sub_organization",
+            "creator",
+        ).prefetch_related(
+            Prefetch("other_contacts", queryset=Contact.objects.order_by("created_at")),
+            Prefetch("alternative_domains", queryset=Website.objects.order_by("created_at")),
+            Prefetch("current_websites", queryset=Website.objects.order_by("created_at")),
+        )
+
     @property
     def storage(self):
-        # marking session as modified on every access
-        # so that updates to nested keys are always saved
-        # Also - check that self.request.session has the attr
-        # modified to account for test environments calling
-        # view methods
-        if hasattr(self.request.session, "modified"):
-            self.request.session.modified = True
-        return self.request.session.setdefault(self.prefix, {})
-
-    @storage.setter
-    def storage(self, value):
-        self.request.session[self.prefix] = value
-        self.request.session.modified = True
+        """Wizard state in the user's session: the domain request id and step history.
+        Changes are written to the session once, at the end of the request."""
+        if self._storage is None:
+            self._storage = WizardStorage(self.request.session, self.prefix)
+        return self._storage
 
     @storage.deleter
     def storage(self):
-        if self.prefix in self.request.session:
-            del self.request.session[self.prefix]
-            self.request.session.modified = True
+        self.storage.clear()
+
+    def dispatch(self, request, *args, **kwargs):
+        """Handles the request, then saves the wizard state to the session if it changed"""
+        response = super().dispatch(request, *args, **kwargs)
+        if self._storage is not None:
+            self._storage.flush()
+        return response
 
     def done(self):
         """Called when the user clicks the submit button, if all forms are valid."""
         self.domain_request.submit()  # change the status to submitted
         self.domain_request.save()
         logger.debug("Domain Request object saved: %s", self.domain_request.id)
+
+        availability = DomainAvailabilityCache(self.request.session)
+        logger.info(
+            "Domain request %s submitted after %s registry availability checks",
+            self.domain_request.id,
+            availability.registry_calls,
+        )
+        availability.reset_registry_calls()
         return redirect(reverse(f"{self.URL_NAMESPACE}:finished"))
 
     def from_model(self, attribute: str, default, *args, **kwargs):
@@ -387,8 +418,7 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
         if step is None:
             forms = self.forms
         else:
-            url = reverse(f"{self.URL_NAMESPACE}:{step}")
-            forms = resolve(url).func.view_class.forms
+            forms = WIZARD_STEP_FORMS[step]
 
         instantiated = []
 
@@ -405,43 +435,45 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
 
     def pending_requests(self):
         """return an array of pending requests if user has pending requests
-        and no approved requests"""
-        if self.approved_domain_requests_exist() or self.approved_domains_exist():
-            return []
-        else:
-            return self.pending_domain_requests()
-
-    def approved_domain_requests_exist(self):
-        """Checks if user is creator of domain requests with DomainRequestStatus.APPROVED status"""
-        approved_domain_request_count = DomainRequest.objects.filter(
-            creator=self.request.user, status=DomainRequest.DomainRequestStatus.APPROVED
-        ).count()
-        return approved_domain_request_count > 0
-
-    def approved_domains_exist(self):
-        """Checks if user has permissions on approved domains
+        and no approved requests or domains.
 
-        This additional check is necessary to account for domains which were migrated
-        and do not have a domain request"""
-        return self.request.user.permissions.count() > 0
-
-    def pending_domain_requests(self):
-        """Returns a List of user's domain requests with one of the following states:
-        DomainRequestStatus.SUBMITTED, DomainRequestStatus.IN_REVIEW, DomainRequestStatus.ACTION_NEEDED"""
+        Approved requests, pending requests and whether the user manages any domains
+        are all found with one query."""
         # if the current domain request has DomainRequestStatus.ACTION_NEEDED status, this check should not be performed
         if self.domain_request.status == DomainRequest.DomainRequestStatus.ACTION_NEEDED:
             return []
-        check_statuses = [
+        pending_statuses = [
             DomainRequest.DomainRequestStatus.SUBMITTED,
             DomainRequest.DomainRequestStatus.IN_REVIEW,
             DomainRequest.DomainRequestStatus.ACTION_NEEDED,
         ]
-        return DomainRequest.objects.filter(creator=self.request.user, status__in=check_statuses)
+        domain_requests = list(
+            DomainRequest.objects.filter(
+                creator=self.request.user,
+                status__in=pending_statuses + [DomainRequest.DomainRequestStatus.APPROVED],
+            )
+            # This additional check is necessary to account for domains which were migrated
+            # and do not have a domain request
+            .annotate(creator_has_domains=Exists(UserDomainRole.objects.filter(user=OuterRef("creator"))))
+            .select_related("requested_domain")
+            .order_by("id")
+        )
+        if any(
+            domain_request.status == DomainRequest.DomainRequestStatus.APPROVED or domain_request.creator_has_domains
+            for domain_request in domain_requests
+        ):
+            return []
+        return domain_requests
 
     def db_check_for_unlocking_steps(self):
         """Helper for get_context_data.
-        Queries the DB for a domain request and returns a list of unlocked steps."""
-        return [key for key, is_unlocked_checker in self.unlocking_steps.items() if is_unlocked_checker(self)]
+        Returns a list of unlocked steps. This is computed once per request, from the
+        domain request and its prefetched related objects."""
+        if self._unlocked_steps is None:
+            self._unlocked_steps = [
+                key for key, is_unlocked_checker in self.unlocking_steps.items() if is_unlocked_checker(self)
+            ]
+        return self._unlocked_steps
 
     def get_context_data(self):
         """Define context for access on all wizard pages."""
@@ -586,6 +618,8 @@ class DomainRequestWizard(DomainRequestWizardPermissionView, TemplateView):
         for form in forms:
             if form is not None and hasattr(form, "to_database"):
                 form.to_database(self.domain_request)
+        # the saved data may unlock more steps
+        self._unlocked_steps = None
 
 
 # TODO - this is a WIP until the domain request experience for portfolios is complete
@@ -698,6 +732,61 @@ class DotgovDomain(DomainRequestWizard):
         context["federal_type"] = self.domain_request.federal_type
         return context
 
+    def get_forms(self, step=None, use_post=False, use_db=False, files=None):
+        """Overrides default behavior defined in DomainRequestWizard.
+        The domain forms share a cache of registry availability checks kept in the session."""
+        forms = super().get_forms(step=step, use_post=use_post, use_db=use_db, files=files)
+        availability = DomainAvailabilityCache(self.request.session)
+        for form in forms:
+            for domain_form in self._domain_forms(form):
+                domain_form.domain_availability = availability
+        return forms
+
+    def is_valid(self, forms: list) -> bool:
+        """Overrides default behavior defined in DomainRequestWizard.
+        Checks the requested domain and all alternative domains against the
+        registry in one request, then validates each form."""
+        self.check_domain_availability(forms)
+        return super().is_valid(forms)
+
+    def check_domain_availability(self, forms: list):
+        """Checks every submitted domain name which is not already cached in one registry request.
+
+        Registry errors are ignored here, as each form reports them when it is validated."""
+        availability = None
+        names = []
+        for form in forms:
+            for domain_form in self._domain_forms(form):
+                availability = domain_form.domain_availability
+                names.extend(self._submitted_domain_names(domain_form))
+
+        if availability is None or not names:
+            return
+        try:
+            availability.check(names)
+        except (RegistryError, ValueError) as err:
+            logger.warning(f"Could not check domain availability for {names}: {err}")
+
+    def _domain_forms(self, form):
+        """Returns the individual forms of a formset, or the form itself"""
+        return form.forms if isinstance(form, BaseFormSet) else [form]
+
+    def _submitted_domain_names(self, domain_form):
+        """Returns the valid domain names submitted in domain_form, without checking their availability"""
+        names = []
+        for field in ("requested_domain", "alternative_domain"):
+            if field not in domain_form.fields:
+                continue
+            try:
+                name = DomainHelper._validate_domain_string(
+                    domain_form.data.get(domain_form.add_prefix(field)), blank_ok=True
+                )
+            except ValueError:
+                continue
+            if name:
+                names.append(name)
+        return names
+
 
 class Purpose(DomainRequestWizard):
     template_name = "domain_request_purpose.html"
@@ -1041,3 +1130,29 @@ class PortfolioDomainRequestStatusViewOnly(DomainRequestPortfolioViewonlyView):
 
 
 # endregion
+
+
+# Each wizard step and the view which handles it. The wizard urls are generated from this list.
+WIZARD_STEP_VIEWS = [
+    # add/remove steps here
+    (Step.ORGANIZATION_TYPE, OrganizationType),
+    (Step.TRIBAL_GOVERNMENT, TribalGovernment),
+    (Step.ORGANIZATION_FEDERAL, OrganizationFederal),
+    (Step.ORGANIZATION_ELECTION, OrganizationElection),
+    (Step.ORGANIZATION_CONTACT, OrganizationContact),
+    (Step.ABOUT_YOUR_ORGANIZATION, AboutYourOrganization),
+    (Step.SENIOR_OFFICIAL, SeniorOfficial),
+    (Step.CURRENT_SITES, CurrentSites),
+    (Step.DOTGOV_DOMAIN, DotgovDomain),
+    (Step.PURPOSE, Purpose),
+    (Step.OTHER_CONTACTS, OtherContacts),
+    (Step.ADDITIONAL_DETAILS, AdditionalDetails),
+    (Step.REQUIREMENTS, Requirements),
+    (Step.REVIEW, Review),
+    # Portfolio steps
+    (PortfolioDomainRequestStep.REQUESTING_ENTITY, RequestingEntity),
+    (PortfolioDomainRequestStep.ADDITIONAL_DETAILS, PortfolioAdditionalDetails),
+]
+
+# The form classes of each step, so that forms for any step can be built without resolving its url
+WIZARD_STEP_FORMS = {step: view.forms for step, view in WIZARD_STEP_VIEWS}
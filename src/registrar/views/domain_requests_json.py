@@ -16,7 +16,7 @@ def get_domain_requests_json(request):
 
     domain_request_ids = get_domain_request_ids_from_request(request)
 
-    objects = DomainRequest.objects.filter(id__in=domain_request_ids)
+    objects = DomainRequest.objects.filter(id__in=domain_request_ids).select_related("requested_domain", "creator")
     unfiltered_total = objects.count()
 
     objects = apply_search(objects, request)
@@ -26,8 +26,14 @@ def get_domain_requests_json(request):
     paginator = Paginator(objects, 10)
     page_number = request.GET.get("page", 1)
     page_obj = paginator.get_page(page_number)
+    # The user's permissions are the same for every domain request, so they are checked once
+    is_org_user = request.user.is_org_user(request)
+    can_edit_requests = is_org_user and request.user.has_edit_request_portfolio_permission(
+        request.session.get("portfolio")
+    )
     domain_requests = [
-        serialize_domain_request(request, domain_request, request.user) for domain_request in page_obj.object_list
+        serialize_domain_request(request, domain_request, request.user, is_org_user, can_edit_requests)
+        for domain_request in page_obj.object_list
     ]
 
     return JsonResponse(
@@ -114,7 +120,7 @@ def apply_sorting(queryset, request):
     return queryset.order_by(sort_by)
 
 
-def serialize_domain_request(request, domain_request, user):
+def serialize_domain_request(request, domain_request, user, is_org_user, can_edit_requests):
 
     deletable_statuses = [
         DomainRequest.DomainRequestStatus.STARTED,
@@ -122,13 +128,12 @@ def serialize_domain_request(request, domain_request, user):
     ]
 
     # Determine if the request is deletable
-    if not user.is_org_user(request):
+    if not is_org_user:
         is_deletable = domain_request.status in deletable_statuses
     else:
-        portfolio = request.session.get("portfolio")
         is_deletable = (
-            domain_request.status in deletable_statuses and user.has_edit_request_portfolio_permission(portfolio)
-        ) and domain_request.creator == user
+            domain_request.status in deletable_statuses and can_edit_requests and domain_request.creator == user
+        )
 
     # Determine action label based on user permissions and request status
     editable_statuses = [
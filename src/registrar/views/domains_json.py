@@ -4,7 +4,7 @@ from django.core.paginator import Paginator
 from registrar.models import UserDomainRole, Domain, DomainInformation, User
 from django.contrib.auth.decorators import login_required
 from django.urls import reverse
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 
 logger = logging.getLogger(__name__)
 
@@ -16,7 +16,11 @@ def get_domains_json(request):
 
     domain_ids = get_domain_ids_from_request(request)
 
-    objects = Domain.objects.filter(id__in=domain_ids).select_related("domain_info__sub_organization")
+    objects = (
+        Domain.objects.filter(id__in=domain_ids)
+        .select_related("domain_info__sub_organization")
+        .annotate(user_has_role=Exists(UserDomainRole.objects.filter(domain=OuterRef("pk"), user=request.user)))
+    )
     unfiltered_total = objects.count()
 
     objects = apply_search(objects, request)
@@ -125,9 +129,8 @@ def serialize_domain(domain, user):
         domain_info = None
         logger.debug(f"Issue in domains_json: We could not find domain_info for {domain}")
 
-    # Check if there is a UserDomainRole for this domain and user
-    user_domain_role_exists = UserDomainRole.objects.filter(domain_id=domain.id, user=user).exists()
-    view_only = not user_domain_role_exists or domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD]
+    # Whether there is a UserDomainRole for this domain and user, annotated in get_domains_json
+    view_only = not domain.user_has_role or domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD]
     return {
         "id": domain.id,
         "name": domain.name,
@@ -5,7 +5,7 @@ from django.shortcuts import get_object_or_404
 from django.views import View
 from registrar.models import UserDomainRole, Domain, DomainInformation, User
 from django.urls import reverse
-from django.db.models import Q
+from django.db.models import Exists, OuterRef, Q
 
 from registrar.models.domain_invitation import DomainInvitation
 from registrar.views.utility.mixins import PortfolioMemberDomainsPermission
@@ -22,7 +22,11 @@ class PortfolioMemberDomainsJson(PortfolioMemberDomainsPermission, View):
 
         domain_ids = self.get_domain_ids_from_request(request)
 
-        objects = Domain.objects.filter(id__in=domain_ids).select_related("domain_info__sub_organization")
+        objects = (
+            Domain.objects.filter(id__in=domain_ids)
+            .select_related("domain_info__sub_organization")
+            .annotate(user_has_role=Exists(UserDomainRole.objects.filter(domain=OuterRef("pk"), user=request.user)))
+        )
         unfiltered_total = objects.count()
 
         objects = self.apply_search(objects, request)
@@ -104,9 +108,8 @@ class PortfolioMemberDomainsJson(PortfolioMemberDomainsPermission, View):
             domain_info = None
             logger.debug(f"Issue in domains_json: We could not find domain_info for {domain}")
 
-        # Check if there is a UserDomainRole for this domain and user
-        user_domain_role_exists = UserDomainRole.objects.filter(domain_id=domain.id, user=user).exists()
-        view_only = not user_domain_role_exists or domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD]
+        # Whether there is a UserDomainRole for this domain and user, annotated in get
+        view_only = not domain.user_has_role or domain.state in [Domain.State.DELETED, Domain.State.ON_HOLD]
         return {
             "id": domain.id,
             "name": domain.name,
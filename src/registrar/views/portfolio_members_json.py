@@ -39,7 +39,9 @@ class PortfolioMembersJson(PortfolioMembersPermission, View):
         page_number = request.GET.get("page", 1)
         page_obj = paginator.get_page(page_number)
 
-        members = [self.serialize_members(request, portfolio, item, request.user) for item in page_obj.object_list]
+        # Whether the user can edit members is the same for every member, so it is checked once
+        view_only = self.is_view_only(portfolio, request.user)
+        members = [self.serialize_members(item, view_only) for item in page_obj.object_list]
 
         return JsonResponse(
             {
@@ -179,14 +181,16 @@ class PortfolioMembersJson(PortfolioMembersPermission, View):
             queryset = queryset.order_by(sort_by)
         return queryset
 
-    def serialize_members(self, request, portfolio, item, user):
+    def is_view_only(self, portfolio, user):
+        """Returns True if the user can not edit the members of the portfolio"""
         # Check if the user can edit other users
         user_can_edit_other_users = any(
             user.has_perm(perm) for perm in ["registrar.full_access_permission", "registrar.change_user"]
         )
 
-        view_only = not user.has_edit_members_portfolio_permission(portfolio) or not user_can_edit_other_users
+        return not user.has_edit_members_portfolio_permission(portfolio) or not user_can_edit_other_users
 
+    def serialize_members(self, item, view_only):
         is_admin = UserPortfolioRoleChoices.ORGANIZATION_ADMIN in (item.get("roles") or [])
         action_url = reverse("member" if item["source"] == "permission" else "invitedmember", kwargs={"pk": item["id"]})
 
@@ -1,5 +1,6 @@
 import logging
 from django.http import JsonResponse
+from epplibwrapper.metrics import EPP_METRICS
 from django.forms.models import model_to_dict
 from registrar.models import FederalAgency, SeniorOfficial, DomainRequest
 from django.contrib.admin.views.decorators import staff_member_required
@@ -115,3 +116,17 @@ def get_rejection_email_for_user_json(request):
     domain_request = DomainRequest.objects.filter(id=domain_request_id).first()
     email = get_rejection_reason_default_email(domain_request, reason)
     return JsonResponse({"email": email}, status=200)
+
+
+@login_required
+@staff_member_required
+def get_epp_metrics_json(request):
+    """Returns the counts and timings of the commands this process has sent to the registry"""
+
+    # This API is only accessible to admins and analysts
+    superuser_perm = request.user.has_perm("registrar.full_access_permission")
+    analyst_perm = request.user.has_perm("registrar.analyst_access_permission")
+    if not request.user.is_authenticated or not any([analyst_perm, superuser_perm]):
+        return JsonResponse({"error": "You do not have access to this resource"}, status=403)
+
+    return JsonResponse(EPP_METRICS.snapshot(), status=200)
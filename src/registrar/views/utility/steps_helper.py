@@ -45,6 +45,7 @@ class StepsHelper:
 
     def __init__(self, wizard):
         self._wizard = wizard
+        self._current = None
 
     def __dir__(self):
         return self.all
@@ -71,28 +72,26 @@ class StepsHelper:
     @property
     def current(self):
         """
-        Returns the current step (a string). If no current step is stored in the
-        storage backend, the first step will be returned.
+        Returns the current step (a string). If no current step has been set
+        for this request, the step is found from the url, or the first step is returned.
         """
-        step = getattr(self._wizard.storage, "current_step", None)
-        if step is None:
+        if self._current is None:
             current_url = resolve(self._wizard.request.path_info).url_name
-            step = current_url if current_url in self.all else self.first
-            self._wizard.storage["current_step"] = step
-        return step
+            self._current = current_url if current_url in self.all else self.first
+        return self._current
 
     @current.setter
     def current(self, step: str):
         """Sets the current step. Updates step history."""
         if step in self.all:
-            self._wizard.storage["current_step"] = step
+            self._current = step
         else:
             logger.debug("Invalid step name %s given to StepHelper" % str(step))
-            self._wizard.storage["current_step"] = self.first
+            self._current = self.first
 
         # can't serialize a set, so keep list entries unique
         if step not in self.history:
-            self.history.append(step)
+            self._wizard.storage["step_history"] = self.history + [step]
 
     @property
     def first(self):
@@ -133,4 +132,4 @@ class StepsHelper:
     @property
     def history(self):
         """Returns the list of already visited steps."""
-        return self._wizard.storage.setdefault("step_history", [])
+        return list(self._wizard.storage.get("step_history", []))
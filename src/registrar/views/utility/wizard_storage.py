@@ -0,0 +1,49 @@
+import copy
+from collections.abc import MutableMapping
+
+
+class WizardStorage(MutableMapping):
+    """
+    Wizard state kept under a single key of the user's session.
+
+    Reads and writes go to a copy of the state, which `flush` writes back to the
+    session only if it differs from what was loaded. The session is therefore only
+    marked as modified (and saved at the end of the request) when the wizard state
+    really changed, rather than on every access.
+
+    Keep values small and json serializable, such as ids and lists of step names.
+    """
+
+    def __init__(self, session, prefix):
+        self._session = session
+        self._prefix = prefix
+        # a deep copy, so that changes to nested values are noticed by flush
+        self._data = copy.deepcopy(session.get(prefix, {}))
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def __setitem__(self, key, value):
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        del self._data[key]
+
+    def __iter__(self):
+        return iter(self._data)
+
+    def __len__(self):
+        return len(self._data)
+
+    def clear(self):
+        """Removes all wizard state"""
+        self._data = {}
+
+    def flush(self):
+        """Writes the wizard state back to the session, if it changed"""
+        stored = self._session.get(self._prefix)
+        if not self._data:
+            if stored is not None:
+                del self._session[self._prefix]
+        elif self._data != stored:
+            self._session[self._prefix] = copy.deepcopy(self._data)